@@ -0,0 +1,203 @@
+# development/batch_render.py
+
+# === Standard library imports ===
+import argparse
+import json
+import os
+import shutil
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(PROJECT_ROOT)
+
+# === Third-party imports ===
+# None
+
+# === Own modules ===
+from helper_scripts.data_functions import load_bot_data
+from helper_scripts.helper_functions import (
+    GENERATED_TABLES_DIR,
+    extract_leaderboard_meta,
+    filter_json_tracked,
+    image_chunks,
+    iter_images_from_json,
+    json_to_text_table,
+    parse_html_to_json,
+    render_digest,
+)
+
+
+# Offline batch renderer: renders every variant of one leaderboard (full,
+# top-N, the tracked bots of each guild, text tables) from saved scrims HTML
+# or a leaderboard.json, without a Discord connection, on all cores.
+#
+#   python development/batch_render.py --html scrims.html --out out/
+#   python development/batch_render.py --json leaderboard.json --top 10,50 -j 4
+#
+# Images are rendered into GENERATED_TABLES_DIR under the same names the bot
+# uses (render_<digest>_part_N.png), so pages that already exist there are
+# skipped and a running bot picks the new ones up from its render cache.
+# Point HIDDEN_GEMS_LOCAL_DATA_DIR (and LEADERBOARD_CLUSTER_ID) at the bot's
+# data to pre-generate for it; --out gets copies with readable names.
+
+
+# Variants of this process (set once per worker by init_worker)
+_variants: Dict[str, Tuple[List[dict], int]] = {}
+
+
+# === Input ===
+def load_rows(args) -> Tuple[List[dict], dict]:
+    """Rows (and meta, if known) from --html or --json."""
+    if args.html:
+        with open(args.html, encoding="utf-8") as f:
+            html = f.read()
+        return parse_html_to_json(html), extract_leaderboard_meta(html)
+
+    with open(args.json, encoding="utf-8") as f:
+        return json.load(f), {}
+
+
+def load_tracked(path: Optional[str]) -> Dict[str, List[dict]]:
+    """Tracked bots by guild id, from bot_data.json or a {guild: [bots]} file."""
+    if path:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+
+    guilds = load_bot_data().get("guild_data", {})
+    return {
+        guild_id: g_data["tracked_bots"]
+        for guild_id, g_data in guilds.items()
+        if g_data.get("tracked_bots")
+    }
+
+
+def build_variants(
+    rows: List[dict], top_list: List[int], tracked: Dict[str, List[dict]]
+) -> Dict[str, Tuple[List[dict], int]]:
+    """Name -> (rows, top_x) in the same shape the bot renders them."""
+    variants = {"full": (rows, 0)}
+    for top_x in top_list:
+        if 0 < top_x < len(rows):
+            variants[f"top{top_x}"] = (rows, top_x)
+    for guild_id, tracked_bots in sorted(tracked.items()):
+        tracked_json = filter_json_tracked(rows, tracked_bots)
+        if tracked_json:
+            variants[f"tracked_{guild_id}"] = (tracked_json, 0)
+    return variants
+
+
+# === Workers ===
+def init_worker(variants: Dict[str, Tuple[List[dict], int]]):
+    global _variants
+    _variants = variants
+
+
+def render_page(name: str, page: int) -> Tuple[str, int, str, float, bool]:
+    """(name, page, path, seconds, cached) of one image of one variant."""
+    rows, top_x = _variants[name]
+    digest = render_digest(rows, top_x)
+    path = str(GENERATED_TABLES_DIR / f"render_{digest}_part_{page + 1}.png")
+    if os.path.exists(path):
+        return name, page, path, 0.0, True
+
+    start = time.perf_counter()
+    for path in iter_images_from_json(
+        rows, top_x, file_prefix=f"render_{digest}", only_page=page
+    ):
+        pass
+    return name, page, path, time.perf_counter() - start, False
+
+
+def page_count(rows: List[dict], top_x: int) -> int:
+    return len(image_chunks(len(rows[:top_x] if top_x else rows)))
+
+
+# === Main ===
+def main():
+    parser = argparse.ArgumentParser(description="Render all leaderboard variants.")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--html", help="saved scrims page")
+    source.add_argument("--json", help="rows as written by parse_html_to_json")
+    parser.add_argument("--out", help="copy images and text tables here")
+    parser.add_argument(
+        "--top", default="10,25,50", help="top-N variants, comma separated"
+    )
+    parser.add_argument(
+        "--tracked",
+        help="JSON {guild_id: [{name, author}]} (default: bot_data.json)",
+    )
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=os.cpu_count() or 1, help="processes"
+    )
+    parser.add_argument(
+        "--force", action="store_true", help="render again even if cached"
+    )
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    rows, meta = load_rows(args)
+    if not rows or "error" in rows[0]:
+        sys.exit("Keine Leaderboard-Zeilen gefunden.")
+
+    top_list = [int(x) for x in args.top.split(",") if x.strip()]
+    variants = build_variants(rows, top_list, load_tracked(args.tracked))
+    tasks = [
+        (name, page)
+        for name, (v_rows, top_x) in variants.items()
+        for page in range(page_count(v_rows, top_x))
+    ]
+    print(
+        f"{len(rows)} Zeilen ({meta.get('date') or 'ohne Datum'}), "
+        f"{len(variants)} Varianten, {len(tasks)} Bilder, {args.jobs} Prozesse"
+    )
+
+    if args.force:
+        for name, (v_rows, top_x) in variants.items():
+            digest = render_digest(v_rows, top_x)
+            for page in range(page_count(v_rows, top_x)):
+                path = GENERATED_TABLES_DIR / f"render_{digest}_part_{page + 1}.png"
+                if path.exists():
+                    path.unlink()
+
+    results = {}
+    with ProcessPoolExecutor(
+        max_workers=args.jobs, initializer=init_worker, initargs=(variants,)
+    ) as pool:
+        futures = [pool.submit(render_page, name, page) for name, page in tasks]
+        for future in futures:
+            name, page, path, seconds, cached = future.result()
+            results[(name, page)] = (path, seconds, cached)
+
+    if args.out:
+        os.makedirs(args.out, exist_ok=True)
+        for (name, page), (path, _, _) in results.items():
+            shutil.copyfile(path, os.path.join(args.out, f"{name}_part_{page + 1}.png"))
+        for name, (v_rows, top_x) in variants.items():
+            lines = json_to_text_table(v_rows[:top_x] if top_x else v_rows)
+            with open(
+                os.path.join(args.out, f"{name}.txt"), "w", encoding="utf-8"
+            ) as f:
+                f.write("\n".join(lines) + "\n")
+        if meta:
+            with open(os.path.join(args.out, "meta.json"), "w", encoding="utf-8") as f:
+                json.dump(meta, f, ensure_ascii=False, indent=2)
+
+    rendered = [seconds for _, seconds, cached in results.values() if not cached]
+    print(f"\n{'Variante':<24}{'Bilder':>8}{'neu':>6}{'Render s':>10}")
+    for name in variants:
+        pages = [value for (v_name, _), value in results.items() if v_name == name]
+        new = [seconds for _, seconds, cached in pages if not cached]
+        print(f"{name:<24}{len(pages):>8}{len(new):>6}{sum(new):>10.2f}")
+    print(
+        f"\n{len(rendered)} gerendert, {len(results) - len(rendered)} aus dem Cache, "
+        f"Renderzeit {sum(rendered):.2f}s, Gesamt {time.perf_counter() - start:.2f}s"
+    )
+    if args.out:
+        print(f"Ausgabe in {os.path.abspath(args.out)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+# development/bench_fakes.py
+
+# === Standard library imports ===
+import asyncio
+import hashlib
+import itertools
+import os
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Optional
+
+# === Third-party imports ===
+# None
+
+# === Own modules ===
+# None
+
+
+# Stand-ins for the parts of discord.py and the scrims site that the
+# leaderboard pipeline talks to. Every send/edit is recorded with its
+# payload size and delayed by a simulated API latency.
+
+_ids = itertools.count(1_000_000)
+
+
+# MARK: LocalScrimsServer
+class LocalScrimsServer:
+    """
+    Serve one HTML page on 127.0.0.1 (random port) from a background thread,
+    with an ETag and 304 answers to If-None-Match like a real web server.
+    """
+
+    def __init__(self, page: str = "", delay_ms: float = 0.0):
+        self.page = page
+        self.delay_ms = delay_ms
+        self.requests = 0
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                server.requests += 1
+                if server.delay_ms:
+                    time.sleep(server.delay_ms / 1000)
+                body = server.page.encode("utf-8")
+                etag = f'"{hashlib.sha1(body).hexdigest()}"'
+                if self.headers.get("If-None-Match") == etag:
+                    self.send_response(304)
+                    self.send_header("ETag", etag)
+                    self.end_headers()
+                    return
+
+                self.send_response(200)
+                self.send_header("ETag", etag)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/scrims"
+
+    def __enter__(self) -> "LocalScrimsServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+
+# MARK: FakeAttachment
+class FakeAttachment:
+    def __init__(self, filename: str):
+        self.filename = filename
+        self.url = f"https://cdn.example.invalid/{next(_ids)}/{filename}"
+
+
+# MARK: FakeMessage
+class FakeMessage:
+    def __init__(
+        self, channel: "FakeChannel", content: Optional[str], attachments=None
+    ):
+        self.id = next(_ids)
+        self.channel = channel
+        self.content = content
+        self.attachments: List[FakeAttachment] = attachments or []
+        self.jump_url = f"https://discord.example.invalid/{channel.id}/{self.id}"
+
+    async def edit(self, content: Optional[str] = None, **kwargs):
+        await self.channel.simulate_latency()
+        self.channel.record("edit", content)
+        self.content = content
+        return self
+
+    async def create_thread(self, name: str, **kwargs) -> "FakeChannel":
+        await self.channel.simulate_latency()
+        thread = FakeChannel(self.channel.latency_ms, name=name, log=self.channel.log)
+        self.channel.record("thread", name)
+        return thread
+
+
+# MARK: FakeChannel
+class FakeChannel:
+    """Records everything that is sent; also used for threads."""
+
+    def __init__(self, latency_ms: float = 0.0, name: str = "bench", log=None):
+        self.id = next(_ids)
+        self.name = name
+        self.latency_ms = latency_ms
+        # shared with threads of this channel: (kind, perf_counter, bytes)
+        self.log: List[tuple] = log if log is not None else []
+
+    async def simulate_latency(self):
+        if self.latency_ms:
+            # +-50 % jitter around the configured latency
+            await asyncio.sleep(self.latency_ms * random.uniform(0.5, 1.5) / 1000)
+
+    def record(self, kind: str, content: Optional[str] = None, size: int = 0):
+        size += len(content.encode("utf-8")) if content else 0
+        self.log.append((kind, time.perf_counter(), size))
+
+    async def send(self, content: Optional[str] = None, file=None, files=None, **kw):
+        uploads = list(files or []) + ([file] if file else [])
+        size = 0
+        for upload in uploads:
+            size += os.fstat(upload.fp.fileno()).st_size
+            upload.close()
+
+        await self.simulate_latency()
+        kind = "file" if uploads else "embed" if kw.get("embed") else "message"
+        self.record(kind, content, size)
+        attachments = [FakeAttachment(upload.filename) for upload in uploads]
+        return FakeMessage(self, content, attachments)
+
+
+# MARK: FakeBot
+class FakeBot:
+    """Only what post_lb_in_scheduled_channels() needs: get_channel()."""
+
+    def __init__(self, channels: List[FakeChannel]):
+        self.channels = {channel.id: channel for channel in channels}
+
+    def get_channel(self, channel_id: int) -> Optional[FakeChannel]:
+        return self.channels.get(channel_id)
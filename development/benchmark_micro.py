@@ -0,0 +1,188 @@
+# development/benchmark_micro.py
+
+# === Standard library imports ===
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+from typing import Callable, Dict, List
+
+# Generated HTML/JSON/PNGs go to a temp dir, not the real local_data
+os.environ.setdefault(
+    "HIDDEN_GEMS_LOCAL_DATA_DIR", tempfile.mkdtemp(prefix="hgbot_micro_")
+)
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(PROJECT_ROOT)
+
+# === Third-party imports ===
+# None
+
+# === Own modules ===
+from helper_scripts.helper_functions import (
+    extract_leaderboard_meta,
+    filter_json_tracked,
+    generate_images_from_json,
+    json_to_text_table,
+    parse_html_to_json,
+)
+
+from synthetic_leaderboard import generate_rows, rows_to_scrims_html
+
+
+# Micro-benchmarks of the single pipeline functions at growing row counts.
+#
+#   python development/benchmark_micro.py                    # run only
+#   python development/benchmark_micro.py --compare          # run + compare
+#   python development/benchmark_micro.py --save-baseline    # new baseline
+#   python development/benchmark_micro.py --sizes 100,1000 --only parse
+#
+# The baseline in development/benchmark_baseline.json is committed; renew it
+# with --save-baseline (on the machine the comparisons run on) when a change
+# is meant to be slower or faster. With --compare, exit code 1 if a benchmark
+# is slower than the baseline by more than --threshold (default 25 %).
+
+BASELINE_PATH = os.path.join(PROJECT_ROOT, "development", "benchmark_baseline.json")
+DEFAULT_SIZES = [100, 1000, 10000]
+TRACKED_COUNT = 10
+
+
+# === Benchmarks ===
+def build_cases(size: int, seed: int) -> Dict[str, Callable[[], object]]:
+    """name -> zero-argument callable, all inputs prepared up front."""
+    rows = generate_rows(size, seed)
+    page = rows_to_scrims_html(rows)
+    step = max(size // TRACKED_COUNT, 1)
+    tracked = [
+        {"name": row["Bot"], "author": row["Autor / Team"]} for row in rows[::step]
+    ]
+    return {
+        "parse_html_to_json": lambda: parse_html_to_json(page),
+        "extract_leaderboard_meta": lambda: extract_leaderboard_meta(page),
+        "generate_images_from_json": lambda: generate_images_from_json(
+            rows, file_prefix="micro"
+        ),
+        "json_to_text_table": lambda: json_to_text_table(rows),
+        "filter_json_tracked": lambda: filter_json_tracked(rows, tracked),
+    }
+
+
+def measure(func: Callable[[], object], min_time: float, max_runs: int) -> dict:
+    """Run until `min_time` seconds are spent (at least 3 runs, at most max_runs)."""
+    times: List[float] = []
+    spent = 0.0
+    while len(times) < max_runs and (len(times) < 3 or spent < min_time):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        times.append(elapsed)
+        spent += elapsed
+        if elapsed > min_time * 4:
+            break  # very slow case, one run is representative enough
+    return {
+        "runs": len(times),
+        "min_ms": min(times) * 1000,
+        "median_ms": statistics.median(times) * 1000,
+    }
+
+
+# === Baseline ===
+def load_baseline(path: str) -> dict:
+    if not os.path.exists(path):
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> List[str]:
+    """
+    Names of benchmarks slower than baseline * (1 + threshold). Compares the
+    fastest run, which is far less noisy than the median for short cases.
+    """
+    regressions = []
+    for name, result in results.items():
+        old = baseline.get("results", {}).get(name)
+        if not old:
+            continue
+        ratio = result["min_ms"] / old["min_ms"]
+        marker = ""
+        if ratio > 1 + threshold:
+            marker = "  <-- REGRESSION"
+            regressions.append(name)
+        print(
+            f"   {name:<38}{old['min_ms']:>10.2f}{result['min_ms']:>10.2f}"
+            f"{ratio:>8.2f}x{marker}"
+        )
+    return regressions
+
+
+# === Main ===
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Micro-benchmarks per function.")
+    parser.add_argument(
+        "--sizes",
+        type=lambda v: [int(p) for p in v.split(",") if p],
+        default=DEFAULT_SIZES,
+    )
+    parser.add_argument("--only", help="substring filter on benchmark names")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--min-time", type=float, default=0.5)
+    parser.add_argument("--max-runs", type=int, default=50)
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument(
+        "--compare", action="store_true", help="flag regressions vs. the baseline"
+    )
+    parser.add_argument("--threshold", type=float, default=0.25)
+    args = parser.parse_args()
+
+    results: Dict[str, dict] = {}
+    print(f"   {'benchmark':<38}{'runs':>6}{'min ms':>10}{'median ms':>11}")
+    for size in args.sizes:
+        for name, func in build_cases(size, args.seed).items():
+            if args.only and args.only not in name:
+                continue
+            key = f"{name}[{size}]"
+            func()  # warm-up (fonts, icons, imports)
+            results[key] = measure(func, args.min_time, args.max_runs)
+            r = results[key]
+            print(
+                f"   {key:<38}{r['runs']:>6}{r['min_ms']:>10.2f}{r['median_ms']:>11.2f}"
+            )
+
+    if args.save_baseline:
+        baseline = load_baseline(args.baseline)
+        baseline.setdefault("results", {}).update(results)
+        baseline["created"] = datetime.now().isoformat(timespec="seconds")
+        baseline["python"] = platform.python_version()
+        baseline["machine"] = platform.machine()
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+        print(f"\nBaseline gespeichert: {args.baseline}")
+        sys.exit(0)
+
+    if not args.compare:
+        sys.exit(0)
+
+    baseline = load_baseline(args.baseline)
+    if not baseline:
+        print("\nKeine Baseline vorhanden, speichern mit --save-baseline.")
+        sys.exit(2)
+    if baseline.get("machine") != platform.machine():
+        print(
+            f"\n⚠️ Baseline von {baseline.get('machine')}, "
+            f"hier {platform.machine()}: Zeiten nur bedingt vergleichbar."
+        )
+
+    print(f"\nVergleich mit Baseline vom {baseline.get('created')}:")
+    print(f"   {'benchmark':<38}{'base ms':>10}{'now ms':>10}{'ratio':>9}")
+    regressions = compare(results, baseline, args.threshold)
+    if regressions:
+        print(f"\n❌ {len(regressions)} Regression(en) über {args.threshold:.0%}")
+        sys.exit(1)
+    print("\n✅ Keine Regressionen.")
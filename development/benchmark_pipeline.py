@@ -0,0 +1,262 @@
+# development/benchmark_pipeline.py
+
+# === Standard library imports ===
+import argparse
+import asyncio
+import json
+import math
+import os
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from typing import Dict, List
+
+# Keep the benchmark away from the real local_data (bot_data.json, history)
+os.environ.setdefault(
+    "HIDDEN_GEMS_LOCAL_DATA_DIR", tempfile.mkdtemp(prefix="hgbot_bench_")
+)
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(PROJECT_ROOT)
+
+# === Third-party imports ===
+# None
+
+# === Own modules ===
+import helper_scripts.helper_functions as helper_functions
+from helper_scripts.data_functions import save_bot_data
+from helper_scripts.image_store import get_image_store
+from helper_scripts.metrics import registry
+from helper_scripts.prewarm import prewarm_leaderboard
+
+from bench_fakes import FakeBot, FakeChannel, LocalScrimsServer
+from synthetic_leaderboard import generate_rows, rows_to_scrims_html
+
+
+# End-to-end benchmark: local scrims server -> fetch -> parse -> render ->
+# "upload" into fake Discord channels. Stage timings come from the same
+# metrics the bot exports (helper_scripts/metrics.py), as raw samples.
+#
+#   python development/benchmark_pipeline.py --rows 100,1000 --channels 1,5
+#   python development/benchmark_pipeline.py --html recorded_scrims.html
+
+
+# === Helpers ===
+def percentile(sorted_values: List[float], p: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return math.nan
+    index = max(math.ceil(p / 100 * len(sorted_values)) - 1, 0)
+    return sorted_values[index]
+
+
+class StageSamples:
+    """Collects every stage_duration_seconds observation by stage name."""
+
+    def __init__(self):
+        self.samples: Dict[str, List[float]] = defaultdict(list)
+
+    def __call__(self, name: str, value: float, labels: dict):
+        if name == "stage_duration_seconds":
+            self.samples[str(labels.get("stage"))].append(value)
+
+    def clear(self):
+        self.samples.clear()
+
+    def summary(self) -> Dict[str, dict]:
+        result = {}
+        for stage, values in sorted(self.samples.items()):
+            values = sorted(values)
+            result[stage] = {
+                "n": len(values),
+                "p50_ms": percentile(values, 50) * 1000,
+                "p90_ms": percentile(values, 90) * 1000,
+                "p99_ms": percentile(values, 99) * 1000,
+                "max_ms": values[-1] * 1000,
+                "total_ms": sum(values) * 1000,
+            }
+        return result
+
+
+def print_summary(title: str, summary: Dict[str, dict], extra: Dict[str, float]):
+    print(f"\n== {title} ==")
+    for name, value in extra.items():
+        print(f"   {name}: {value:.2f}")
+    print(
+        f"   {'stage':<18}{'n':>6}{'p50 ms':>10}{'p90 ms':>10}{'p99 ms':>10}"
+        f"{'max ms':>10}"
+    )
+    for stage, s in summary.items():
+        print(
+            f"   {stage:<18}{s['n']:>6}{s['p50_ms']:>10.2f}{s['p90_ms']:>10.2f}"
+            f"{s['p99_ms']:>10.2f}{s['max_ms']:>10.2f}"
+        )
+
+
+def setup_guilds(channels: List[FakeChannel], tracked_bots: List[dict]):
+    """One guild per fake channel, all posting as scheduled."""
+    save_bot_data(
+        {
+            "guild_data": {
+                str(i): {
+                    "scheduled_channels": [channel.id],
+                    "tracked_bots": tracked_bots,
+                }
+                for i, channel in enumerate(channels)
+            }
+        }
+    )
+
+
+# === Scenarios ===
+async def bench_interactive(samples: StageSamples, repeat: int, latency_ms: float):
+    """`!lb` in one channel, `repeat` times in a row."""
+    samples.clear()
+    channel = FakeChannel(latency_ms)
+    latencies = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        await helper_functions.send_leaderboard(
+            channel, tracked_bots=[], top_x=0, force_text=False, as_thread=True
+        )
+        latencies.append(time.perf_counter() - start)
+
+    latencies.sort()
+    extra = {
+        "command p50 s": percentile(latencies, 50),
+        "command p99 s": percentile(latencies, 99),
+        "uploaded MiB": sum(size for _, _, size in channel.log) / 1024 / 1024,
+    }
+    return samples.summary(), extra
+
+
+async def bench_scheduled(
+    samples: StageSamples,
+    repeat: int,
+    channel_count: int,
+    latency_ms: float,
+    row_count: int,
+    tracked_bots: List[dict],
+    prewarm: bool,
+    storage: bool,
+):
+    """
+    Scheduler run over `channel_count` channels, `repeat` times. With
+    `prewarm`, the render cache is emptied and the pre-warm job runs before
+    every run (not timed), as at the daily post. With `storage`, images are
+    uploaded once to a storage channel and sent as embeds.
+    """
+    samples.clear()
+    channels = [FakeChannel(latency_ms) for _ in range(channel_count)]
+    setup_guilds(channels, tracked_bots)
+    storage_channel = FakeChannel(latency_ms, name="storage")
+    bot = FakeBot(channels + [storage_channel])
+    get_image_store().configure(bot, storage_channel.id if storage else 0)
+
+    durations = []
+    for _ in range(repeat):
+        helper_functions._render_cache.clear()
+        if prewarm:
+            registry.observers.remove(samples)
+            await asyncio.to_thread(prewarm_leaderboard)
+            registry.observers.append(samples)
+        start = time.perf_counter()
+        await helper_functions.post_lb_in_scheduled_channels(bot)
+        durations.append(time.perf_counter() - start)
+
+    total = sum(durations)
+    uploaded = [size for c in channels + [storage_channel] for _, _, size in c.log]
+    extra = {
+        "run mean s": total / repeat,
+        "channels/s": channel_count * repeat / total,
+        "rows/s": row_count * channel_count * repeat / total,
+        "uploaded MiB/run": sum(uploaded) / 1024 / 1024 / repeat,
+    }
+    return samples.summary(), extra
+
+
+# === Main ===
+async def main(args) -> dict:
+    samples = StageSamples()
+    registry.observers.append(samples)
+
+    if args.html:
+        with open(args.html, "r", encoding="utf-8") as f:
+            pages = {"recorded": f.read()}
+    else:
+        pages = {
+            str(rows): rows_to_scrims_html(generate_rows(rows, args.seed))
+            for rows in args.rows
+        }
+
+    results = {}
+    with LocalScrimsServer(delay_ms=args.server_delay_ms) as server:
+        helper_functions.SCRIMS_URL = server.url
+
+        for label, page in pages.items():
+            server.page = page
+            # warm-up: first parse stores the snapshot, fonts/icons get loaded
+            rows, _ = helper_functions.get_leaderboard_json()
+            row_count = len(rows)
+            tracked_bots = [
+                {"name": row["Bot"], "author": row.get("Autor / Team", "")}
+                for row in rows[:: max(row_count // 3, 1)][:3]
+            ]
+
+            summary, extra = await bench_interactive(
+                samples, args.repeat, args.latency_ms
+            )
+            title = f"!lb | rows={row_count}"
+            print_summary(title, summary, extra)
+            results[title] = {"stages": summary, **extra}
+
+            for channel_count in args.channels:
+                summary, extra = await bench_scheduled(
+                    samples,
+                    args.repeat,
+                    channel_count,
+                    args.latency_ms,
+                    row_count,
+                    tracked_bots,
+                    args.prewarm,
+                    args.storage,
+                )
+                title = f"scheduled | rows={row_count} channels={channel_count}"
+                print_summary(title, summary, extra)
+                results[title] = {"stages": summary, **extra}
+
+    registry.observers.remove(samples)
+    return results
+
+
+def int_list(value: str) -> List[int]:
+    return [int(part) for part in value.split(",") if part]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="End-to-end leaderboard benchmark.")
+    parser.add_argument("--rows", type=int_list, default=[100, 500])
+    parser.add_argument("--channels", type=int_list, default=[1, 5])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    parser.add_argument("--server-delay-ms", type=float, default=0.0)
+    parser.add_argument("--html", help="recorded scrims page instead of synthetic")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--prewarm", action="store_true", help="pre-warm before scheduled runs"
+    )
+    parser.add_argument(
+        "--storage",
+        action="store_true",
+        help="scheduled runs upload each image once to a storage channel",
+    )
+    parser.add_argument("--json", help="also write the results to this file")
+    args = parser.parse_args()
+
+    print(f"Daten: {os.environ['HIDDEN_GEMS_LOCAL_DATA_DIR']}")
+    results = asyncio.run(main(args))
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
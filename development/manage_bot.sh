@@ -11,6 +11,9 @@ Usage:
 
 3. Update bot (pull latest, update deps, restart):
     ./development/manage_bot.sh update
+
+Console output goes to bot.log, structured JSON-lines logs (rotated) to
+local_data/logs/bot.jsonl (see LOG_* variables in the .env).
 '
 
 # ----------------------
@@ -0,0 +1,320 @@
+# development/render_regression.py
+
+# === Standard library imports ===
+import argparse
+import json
+import os
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from typing import List, Tuple
+
+# Rendered PNGs go to a temp dir, not the real local_data
+os.environ.setdefault(
+    "HIDDEN_GEMS_LOCAL_DATA_DIR", tempfile.mkdtemp(prefix="hgbot_golden_")
+)
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(PROJECT_ROOT)
+
+# === Third-party imports ===
+from PIL import Image, ImageChops
+
+# === Own modules ===
+from helper_scripts.globals import LOCAL_DATA_PATH_DIR
+from helper_scripts.helper_functions import generate_images_from_json
+
+from synthetic_leaderboard import generate_rows
+
+
+# Golden-image check for generate_images_from_json(): renders the fixture
+# leaderboards in render_golden/fixtures.json and compares every PNG with the
+# stored golden image. Also fails if a case exceeds its time or memory budget.
+#
+#   python development/render_regression.py             # check
+#   python development/render_regression.py --update    # accept new images
+#   python development/render_regression.py --write-fixtures  # new fixtures
+#
+# Exit code 1 on any visual difference above the tolerance or budget breach.
+# Every case is rendered in a fresh interpreter (--measure), so its peak RSS
+# includes Pillow's pixel buffers and is not inflated by earlier cases.
+
+GOLDEN_DIR = os.path.join(PROJECT_ROOT, "development", "render_golden")
+FIXTURES_PATH = os.path.join(GOLDEN_DIR, "fixtures.json")
+DIFF_DIR = LOCAL_DATA_PATH_DIR / "render_diffs"
+
+# a pixel counts as changed if any channel differs by more than this
+CHANNEL_TOLERANCE = 16
+# share of changed pixels that is still accepted (font hinting etc.)
+MAX_CHANGED_RATIO = 0.001
+# budgets for new fixtures: measured value * factor
+BUDGET_FACTOR = 3.0
+# peak RSS includes the interpreter and imports, so it needs less headroom
+RSS_BUDGET_FACTOR = 1.5
+
+
+# === Fixtures ===
+def edge_case_rows() -> List[dict]:
+    """Rows that hit the special cases of the renderer."""
+    base = {"GU": "50.0%", "CF": "50.0%", "FC": "50.0%", "Ort": "Berlin"}
+    return [
+        {
+            **base,
+            "Rang": "1.",
+            "Col1": "⭐",
+            "Bot": "Star",
+            "Score": "499.9",
+            "Autor / Team": "Anna A.",
+            "Sprache": "python",
+        },
+        {
+            **base,
+            "Rang": "2.",
+            "Col1": "🤖",
+            "Bot": "EinSehrLangerBotNameDerAbgeschnittenWerdenMuss",
+            "Score": "400.0",
+            "Autor / Team": "Team Mit Einem Sehr Langen Namen Und Mehr",
+            "Sprache": "ruby",
+            "Ort": "Freiburg im Breisgau und Umgebung",
+        },
+        {
+            **base,
+            "Rang": "3.",
+            "Col1": "",
+            "Bot": "Kein Emoji",
+            "Score": "300.0",
+            "Autor / Team": "Ben B.",
+            "Sprache": "",
+        },
+        {
+            **base,
+            "Rang": "4.",
+            "Col1": "🦄",
+            "Bot": "Unbekannte Sprache",
+            "Score": "200.0",
+            "Autor / Team": "Clara C.",
+            "Sprache": "cobol",
+        },
+        {
+            **base,
+            "Rang": "5.",
+            "Col1": "💎",
+            "Bot": "Ümläüte ß",
+            "Score": "0.0",
+            "Autor / Team": "Dörte Ä.",
+            "Sprache": "rust",
+            "Ort": "",
+        },
+        {
+            **base,
+            "Rang": "DNQ.",
+            "Col1": "👻",
+            "Bot": "Nicht qualifiziert",
+            "Score": "",
+            "Autor / Team": "Emil E.",
+            "Sprache": "go",
+        },
+    ]
+
+
+def build_fixtures() -> dict:
+    delta_rows = generate_rows(12, seed=3)
+    for i, row in enumerate(delta_rows):
+        row["Delta"] = ["+3", "-1", "", "NEU", "+12", "-7"][i % 6]
+
+    return {
+        "single_image": {"rows": generate_rows(20, seed=1)},
+        "multi_part": {"rows": generate_rows(25, seed=2, dnq_ratio=0.4)},
+        "top_x": {"rows": generate_rows(40, seed=4), "top_x": 5},
+        "delta_column": {"rows": delta_rows, "delta_column": True},
+        "edge_cases": {"rows": edge_case_rows()},
+    }
+
+
+def load_fixtures() -> dict:
+    with open(FIXTURES_PATH, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_fixtures(fixtures: dict):
+    os.makedirs(GOLDEN_DIR, exist_ok=True)
+    with open(FIXTURES_PATH, "w", encoding="utf-8") as f:
+        json.dump(fixtures, f, ensure_ascii=False, indent=1)
+        f.write("\n")
+
+
+# === Rendering ===
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process so far, in MiB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return peak / 1024 / 1024 if sys.platform == "darwin" else peak / 1024
+
+
+def measure_case(name: str, case: dict) -> dict:
+    """
+    Render one fixture in this (fresh) process. Returns the image paths, the
+    render time and the peak RSS, plus how far the render raised it above the
+    warm-up.
+    """
+    # warm-up, so the case does not pay for loading fonts and icons
+    generate_images_from_json(edge_case_rows(), file_prefix="golden_warmup")
+    baseline_mb = peak_rss_mb()
+
+    start = time.perf_counter()
+    paths = generate_images_from_json(
+        case["rows"],
+        case.get("top_x"),
+        delta_column=case.get("delta_column", False),
+        file_prefix=f"golden_{name}",
+    )
+    seconds = time.perf_counter() - start
+    rss_mb = peak_rss_mb()
+    return {
+        "paths": paths,
+        "seconds": seconds,
+        "rss_mb": rss_mb,
+        "rss_growth_mb": rss_mb - baseline_mb,
+    }
+
+
+def render_case(name: str) -> Tuple[List[str], float, float, float]:
+    """
+    Render one fixture in a subprocess. Returns (image paths, seconds,
+    peak RSS MiB, RSS growth over the warm-up MiB).
+    """
+    result = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "--measure", name],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    # the JSON result is the last line, anything before is log output
+    measured = json.loads(result.stdout.strip().splitlines()[-1])
+    return (
+        measured["paths"],
+        measured["seconds"],
+        measured["rss_mb"],
+        measured["rss_growth_mb"],
+    )
+
+
+def golden_path(name: str, part: int) -> str:
+    return os.path.join(GOLDEN_DIR, f"{name}_part_{part}.png")
+
+
+def compare_images(actual_path: str, golden: str, diff_path: str) -> Tuple[bool, str]:
+    """Pixel diff with tolerance. Writes a diff mask for failed comparisons."""
+    if not os.path.exists(golden):
+        return False, "kein Golden-Image"
+
+    with Image.open(actual_path) as actual, Image.open(golden) as expected:
+        actual = actual.convert("RGB")
+        expected = expected.convert("RGB")
+        if actual.size != expected.size:
+            return False, f"Größe {actual.size} statt {expected.size}"
+
+        red, green, blue = ImageChops.difference(actual, expected).split()
+        # per pixel: largest channel difference above the tolerance -> 255
+        mask = ImageChops.lighter(ImageChops.lighter(red, green), blue).point(
+            lambda v: 255 if v > CHANNEL_TOLERANCE else 0
+        )
+        changed = mask.histogram()[255]
+
+    ratio = changed / (mask.width * mask.height)
+    if ratio > MAX_CHANGED_RATIO:
+        os.makedirs(DIFF_DIR, exist_ok=True)
+        mask.save(diff_path)
+        return False, f"{changed} Pixel ({ratio:.3%}) geändert, Diff: {diff_path}"
+    return True, f"{changed} Pixel ({ratio:.3%}) geändert"
+
+
+# === Main ===
+def check(fixtures: dict, update: bool) -> bool:
+    ok = True
+    for name, case in fixtures.items():
+        paths, seconds, rss_mb, growth_mb = render_case(name)
+        # new cases get budgets from this run; existing budgets stay as edited
+        budget = case.setdefault("budget", {})
+        budget.setdefault("max_ms", round(seconds * 1000 * BUDGET_FACTOR))
+        budget.setdefault("max_rss_mb", round(rss_mb * RSS_BUDGET_FACTOR))
+
+        print(
+            f"{name}: {len(paths)} Bild(er), {seconds * 1000:.0f} ms, "
+            f"RSS-Peak {rss_mb:.1f} MiB (+{growth_mb:.1f} MiB beim Rendern)"
+        )
+
+        if seconds * 1000 > budget["max_ms"]:
+            print(f"   ❌ Zeitbudget {budget['max_ms']} ms überschritten")
+            ok = False
+        if rss_mb > budget["max_rss_mb"]:
+            print(f"   ❌ Speicherbudget {budget['max_rss_mb']} MiB überschritten")
+            ok = False
+
+        if update:
+            for old in os.listdir(GOLDEN_DIR):
+                if old.startswith(f"{name}_part_"):
+                    os.remove(os.path.join(GOLDEN_DIR, old))
+            for part, path in enumerate(paths, start=1):
+                shutil.copyfile(path, golden_path(name, part))
+            continue
+
+        expected_parts = len(
+            [f for f in os.listdir(GOLDEN_DIR) if f.startswith(f"{name}_part_")]
+        )
+        if expected_parts != len(paths):
+            print(f"   ❌ {len(paths)} Bilder statt {expected_parts}")
+            ok = False
+
+        for part, path in enumerate(paths, start=1):
+            diff_path = str(DIFF_DIR / f"{name}_part_{part}_diff.png")
+            same, message = compare_images(path, golden_path(name, part), diff_path)
+            print(f"   {'✅' if same else '❌'} Teil {part}: {message}")
+            ok = ok and same
+    return ok
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Golden-image render regression.")
+    parser.add_argument("--update", action="store_true", help="accept new images")
+    parser.add_argument(
+        "--write-fixtures", action="store_true", help="regenerate fixtures.json"
+    )
+    parser.add_argument("--only", help="substring filter on case names")
+    parser.add_argument("--measure", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure:
+        # child of render_case(): one case, result as JSON on stdout
+        case = load_fixtures()[args.measure]
+        print(json.dumps(measure_case(args.measure, case)))
+        sys.exit(0)
+
+    if args.write_fixtures or not os.path.exists(FIXTURES_PATH):
+        save_fixtures(build_fixtures())
+        args.update = True
+
+    fixtures = load_fixtures()
+    selected = {
+        name: case
+        for name, case in fixtures.items()
+        if not args.only or args.only in name
+    }
+
+    new_budgets = any(
+        "max_rss_mb" not in case.get("budget", {}) for case in selected.values()
+    )
+    ok = check(selected, args.update)
+    if new_budgets and not args.update:
+        save_fixtures(fixtures)
+        print(f"\nNeue Budgets gespeichert in {FIXTURES_PATH}")
+    if args.update:
+        save_fixtures(fixtures)
+        print(f"\nGolden-Images aktualisiert in {GOLDEN_DIR}")
+        sys.exit(0)
+
+    print("\n✅ Keine Abweichungen." if ok else "\n❌ Render-Regression gefunden.")
+    sys.exit(0 if ok else 1)
@@ -0,0 +1,218 @@
+# development/synthetic_leaderboard.py
+
+# === Standard library imports ===
+import argparse
+import html
+import json
+import random
+from typing import List
+
+# === Third-party imports ===
+# None
+
+# === Own modules ===
+# None
+
+
+# Builds scrims pages (and the matching row JSON) of any size in the same
+# shape as the live site, so the real fetch -> meta -> parse -> render
+# pipeline can run against a local server or straight from the rows.
+
+# weights roughly like the real scrims (python/ruby dominate)
+LANGUAGES = {
+    "python": 30,
+    "ruby": 20,
+    "rust": 8,
+    "cpp": 8,
+    "js": 7,
+    "ts": 4,
+    "go": 4,
+    "java": 4,
+    "csharp": 4,
+    "c": 3,
+    "lua": 2,
+    "julia": 1,
+    "php": 1,
+    "": 4,
+}
+ORTE = [
+    "Berlin",
+    "Hamburg",
+    "München",
+    "Köln",
+    "Bad Homburg",
+    "Leipzig",
+    "Frankfurt am Main",
+    "Dresden",
+    "Nürnberg",
+    "Freiburg im Breisgau",
+    "Wien",
+    "Zürich",
+    "",
+]
+EMOJIS = ["🤖", "💎", "🐍", "🦀", "🚀", "🔥", "👾", "🧠", "🐉", "🦊", "⚡", "🍀"]
+EMOJIS += ["🎯", "🐢", "🦉", "🐙", "🌵", "🍕", "👻", "🏆", "🧙", "🪨"]
+BOT_PREFIXES = ["Gem", "Cave", "Deep", "Greedy", "Lazy", "Smart", "Turbo", "Shy"]
+BOT_PREFIXES += ["Quantum", "Kristall", "Schatz", "Rand", "Mega", "Tiny"]
+BOT_SUFFIXES = ["Hunter", "Runner", "Miner", "Bot", "Finder", "Sucher", "Seeker"]
+BOT_SUFFIXES += ["Crawler", "Gräber", "Walker", "Wizard", "Brain", "Explorer"]
+FIRST_NAMES = ["Anna", "Ben", "Clara", "David", "Emil", "Frieda", "Greta", "Hannes"]
+FIRST_NAMES += ["Ida", "Jonas", "Karla", "Leon", "Mia", "Noah", "Ole", "Paula"]
+TEAM_WORDS = ["AG Informatik", "Team", "Klasse", "Crew", "Kollektiv", "Gruppe"]
+TABLE_HEADERS = [
+    "Rang",
+    "",
+    "Bot",
+    "Score",
+    "GU",
+    "CF",
+    "FC",
+    "Autor / Team",
+    "Ort",
+    "Sprache",
+    "Commit",
+]
+
+
+# MARK: random_bot_name()
+def random_bot_name(rng: random.Random) -> str:
+    name = rng.choice(BOT_PREFIXES) + rng.choice(BOT_SUFFIXES)
+    roll = rng.random()
+    if roll < 0.3:
+        name += f" v{rng.randint(1, 12)}"
+    elif roll < 0.4:
+        name = name.lower().replace("ä", "ae") + "_" + rng.choice(["final", "neu"])
+    elif roll < 0.45:
+        # long names exercise the text truncation
+        name += " " + " ".join(rng.choice(BOT_SUFFIXES) for _ in range(4))
+    return name
+
+
+# MARK: random_author()
+def random_author(rng: random.Random) -> str:
+    if rng.random() < 0.25:
+        return f"{rng.choice(TEAM_WORDS)} {rng.choice(FIRST_NAMES)}"
+    return f"{rng.choice(FIRST_NAMES)} {chr(rng.randint(65, 90))}."
+
+
+# MARK: generate_rows()
+def generate_rows(count: int, seed: int = 0, dnq_ratio: float = 0.2) -> List[dict]:
+    """
+    Leaderboard rows as parse_html_to_json() returns them: qualified rows by
+    Score descending, then DNQ rows. Names, emojis, languages and Orte are
+    drawn from realistic pools; a few rows carry the ⭐ (blackstar) marker.
+    Bot + author stay unique, like on the real page.
+    """
+    rng = random.Random(seed)
+    qualified = count - int(count * dnq_ratio)
+    scores = sorted((rng.uniform(0, 500) for _ in range(qualified)), reverse=True)
+    languages, weights = zip(*LANGUAGES.items())
+    authors = [random_author(rng) for _ in range(max(count // 3, 1))]
+
+    rows = []
+    seen = set()
+    for i in range(count):
+        dnq = i >= qualified
+        bot = random_bot_name(rng)
+        author = rng.choice(authors)
+        while (bot, author) in seen:
+            bot = f"{random_bot_name(rng)} {rng.randint(2, 999)}"
+        seen.add((bot, author))
+
+        rows.append(
+            {
+                "Rang": "DNQ." if dnq else f"{i + 1}.",
+                "Col1": "⭐" if rng.random() < 0.02 else rng.choice(EMOJIS),
+                "Bot": bot,
+                "Score": "" if dnq else f"{scores[i]:.1f}",
+                "GU": f"{rng.uniform(0, 100):.1f}%",
+                "CF": f"{rng.uniform(0, 100):.1f}%",
+                "FC": f"{rng.uniform(0, 100):.1f}%",
+                "Autor / Team": author,
+                "Ort": rng.choice(ORTE),
+                "Sprache": rng.choices(languages, weights)[0],
+            }
+        )
+    return rows
+
+
+# MARK: rows_to_scrims_html()
+def rows_to_scrims_html(
+    rows: List[dict], date: str = "01.01.2026", stage: int = 1, seed: str = "abc123"
+) -> str:
+    """Render rows into a page that extract_leaderboard_meta/parse_html_to_json read."""
+    parts = [
+        "<html><body>",
+        f'<div class="col-md-4"><h3>Datum</h3><p>{date}</p></div>',
+        f'<div class="col-md-4"><h3>Stage #{stage}</h3><p>Synthetic</p></div>',
+        f'<div class="col-md-4"><h3>Seed</h3><p>{seed} (5 Runden)</p></div>',
+        "<table><tr>",
+        "".join(f"<th>{header}</th>" for header in TABLE_HEADERS),
+        "</tr>",
+    ]
+
+    spacer_done = False
+    for row in rows:
+        dnq = row["Rang"] == "DNQ."
+        if dnq and not spacer_done:
+            parts.append('<tr class="spacer"><td colspan="11"></td></tr>')
+            spacer_done = True
+
+        language = row.get("Sprache", "")
+        language_cell = (
+            f'<img src="/images/{language}-logo-256.png">' if language else ""
+        )
+        emoji = row.get("Col1", "")
+        if emoji == "⭐":
+            emoji = '<img src="/images/blackstar.png">'
+        cells = [
+            "" if dnq else row["Rang"],
+            emoji,
+            html.escape(row["Bot"]),
+            row.get("Score", ""),
+            row.get("GU", ""),
+            row.get("CF", ""),
+            row.get("FC", ""),
+            html.escape(row.get("Autor / Team", "")),
+            html.escape(row.get("Ort", "")),
+        ]
+        parts.append(
+            "<tr>"
+            + "".join(
+                f'<td class="emoji">{cell}</td>' if i == 1 else f"<td>{cell}</td>"
+                for i, cell in enumerate(cells)
+            )
+            + f"<td>{language_cell}</td><td>0000000</td></tr>"
+        )
+
+    parts.append("</table></body></html>")
+    return "\n".join(parts)
+
+
+# MARK: generate_scrims_html()
+def generate_scrims_html(
+    count: int, seed: int = 0, dnq_ratio: float = 0.2, **meta
+) -> str:
+    return rows_to_scrims_html(generate_rows(count, seed, dnq_ratio), **meta)
+
+
+# === CLI ===
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Write a synthetic scrims page.")
+    parser.add_argument("rows", type=int)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--dnq-ratio", type=float, default=0.2)
+    parser.add_argument("--json", action="store_true", help="row JSON, not HTML")
+    parser.add_argument("-o", "--output", default="-")
+    args = parser.parse_args()
+
+    rows = generate_rows(args.rows, args.seed, args.dnq_ratio)
+    if args.json:
+        page = json.dumps(rows, ensure_ascii=False, indent=2)
+    else:
+        page = rows_to_scrims_html(rows)
+    if args.output == "-":
+        print(page)
+    else:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(page)
@@ -1,21 +1,64 @@
 # helper_scripts/bot_commands.py
 
 # Standard library imports
+import asyncio
+import io
+import logging
+import math
+import os
 from typing import Optional, List, Dict
 
 # Third-party imports
+from discord import app_commands
 from discord.ext import commands
-from discord import TextChannel, DMChannel, Embed
+from discord import TextChannel, DMChannel, Embed, File, Interaction
 
 # Own modules
-from helper_scripts.helper_functions import get_leaderboard_json
+from helper_scripts.helper_functions import (
+    MOVERS_DEFAULT_COUNT,
+    MOVERS_MAX_COUNT,
+    filter_json_tracked,
+    filter_json_where,
+    get_leaderboard_json,
+    leaderboard_title,
+    send_movers,
+)
 from helper_scripts.data_functions import (
+    get_guild_data,
     get_tracked_bots,
     load_bot_data,
-    save_bot_data,
+    set_guild_data,
     set_tracked_bots,
 )
 from helper_scripts.asset_access import send_embed_all_emojis
+from helper_scripts.command_throttle import COALESCED, COOLDOWN, LeaderboardThrottle
+from helper_scripts.logging_setup import command_fields
+from helper_scripts.profiling import profile_pipeline
+from helper_scripts.history_charts import get_history_chart, range_start
+from helper_scripts.history_store import bot_key, get_history_store, snapshot_key
+from helper_scripts.job_queue import PRIORITY_INTERACTIVE, job_queue
+from helper_scripts.leaderboard_export import (
+    EXPORT_FORMATS,
+    iter_current_snapshot,
+    iter_history_snapshots,
+    parse_export_range,
+    write_export,
+)
+from helper_scripts.leaderboard_view import send_leaderboard_pages
+from helper_scripts.leaderboard_stats import (
+    get_stats_image,
+    history_stats,
+    snapshot_stats,
+)
+from helper_scripts.post_scheduler import (
+    DEFAULT_TIMEZONE,
+    channel_slot,
+    default_post_window,
+    parse_post_time,
+    parse_timezone,
+)
+
+logger = logging.getLogger(__name__)
 
 
 def register_commands(
@@ -25,11 +68,19 @@ def register_commands(
     scheduled_channels: dict,
     save_channels,
     send_leaderboard,
+    post_scheduler=None,
+    throttle: Optional[LeaderboardThrottle] = None,
 ):
+    throttle = throttle or LeaderboardThrottle()
+
     # MARK: !leaderboard / top
     @bot.command(name="leaderboard", aliases=["lb", "top"])
     async def leaderboard_command(
-        ctx: commands.Context, top_x: Optional[str] = None, mode: Optional[str] = None
+        ctx: commands.Context,
+        top_x: Optional[str] = None,
+        mode: Optional[str] = None,
+        *,
+        query: Optional[str] = None,
     ):
         """Zeigt Leaderboard, optional Top x: "!leaderboard x (alias: lb, top)" """
 
@@ -42,10 +93,33 @@ def register_commands(
                 "\n- `[top_x]       ` → zeige nur die top [top_x] Einträge des Leaderboards"
                 '\n- `["text"]      ` → erzwingt Textformat statt Bilder'
                 '\n- `["no_tracked"]` → sendet keine tracked Bots'
+                "\n"
+                "\n`!lb where <filter>`"
+                "\n- `lang=python ort=Berlin` → nur Bots mit dieser Sprache / diesem Ort"
+                "\n- `author=~foo           ` → `=~` sucht Teilstrings (Felder: lang, ort, author, bot)"
                 "\n-# ℹ️ Syntax: `<param>` = erforderlicher parameter, `[param]` = optionaler parameter"
             )
             return
 
+        # MARK: > where
+        if top_x and top_x.lower() == "where":
+            where_query = " ".join(part for part in (mode, query) if part)
+            if not where_query:
+                await ctx.send(
+                    f"❌ Bitte gib einen Filter an, z.B. `{ctx.prefix}lb where lang=python`."
+                )
+                return
+
+            await throttled_leaderboard(
+                ctx,
+                tracked_bots=[],
+                top_x=0,
+                force_text=False,
+                as_thread=True,
+                query=where_query,
+            )
+            return
+
         # Determine guild ID (or use author ID for DM)
         guild_id = ctx.guild.id if ctx.guild else ctx.author.id
 
@@ -71,26 +145,115 @@ def register_commands(
         # Get tracked bots for this guild/DM
         tracked_bots = get_tracked_bots(guild_id=guild_id)
 
-        # Call the updated send_leaderboard
-        await send_leaderboard(
-            channel=ctx.channel,
+        await throttled_leaderboard(
+            ctx,
             tracked_bots=tracked_bots,
             top_x=top_x_int,
-            force_text=force_text,
+            force_text=bool(force_text),
             as_thread=True,
         )
 
+    async def throttled_leaderboard(ctx: commands.Context, **kwargs):
+        """send_leaderboard as interactive job, coalesced and rate limited."""
+        key = (
+            ctx.channel.id,
+            kwargs["top_x"],
+            kwargs["force_text"],
+            kwargs.get("query"),
+        )
+        outcome, result = await throttle.run(
+            ctx.author.id,
+            key,
+            # interactive job: runs ahead of queued scheduled posts
+            lambda: job_queue.submit(
+                PRIORITY_INTERACTIVE, send_leaderboard, channel=ctx.channel, **kwargs
+            ),
+        )
+        if outcome == COALESCED:
+            # the same leaderboard is being sent right now
+            await ctx.message.add_reaction("⏳")
+        elif outcome == COOLDOWN:
+            seconds_left, link = result
+            await ctx.reply(
+                f"🕒 Das Leaderboard wurde gerade erst gesendet: {link}"
+                f"\n-# Neu erzeugen ist in {math.ceil(seconds_left)} s wieder möglich.",
+                mention_author=False,
+            )
+
+    # MARK: /leaderboard
+    @bot.tree.command(
+        name="leaderboard", description="Zeigt das Leaderboard seitenweise"
+    )
+    @app_commands.describe(
+        top_x="nur die Top x Einträge",
+        where="Filter, z.B. lang=python ort=Berlin",
+        tracked="nur die tracked Bots dieses Servers",
+    )
+    async def leaderboard_slash(
+        interaction: Interaction,
+        top_x: Optional[app_commands.Range[int, 1]] = None,
+        where: Optional[str] = None,
+        tracked: bool = False,
+    ):
+        # answer within Discord's 3 s, the image follows
+        await interaction.response.defer(thinking=True)
+
+        leaderboard_json, leaderboard_meta = await asyncio.to_thread(
+            get_leaderboard_json
+        )
+        if not leaderboard_json or "error" in leaderboard_json[0]:
+            error = leaderboard_json[0]["error"] if leaderboard_json else ""
+            await interaction.followup.send(f"❌ Leaderboard nicht verfügbar. {error}")
+            return
+
+        # where first: its column index is built for the full board
+        title = leaderboard_title(leaderboard_meta)
+        if where:
+            try:
+                leaderboard_json = filter_json_where(
+                    leaderboard_json, leaderboard_meta, where
+                )
+            except ValueError as e:
+                await interaction.followup.send(f"❌ {e}")
+                return
+        if tracked:
+            guild_id = interaction.guild_id or interaction.user.id
+            leaderboard_json = filter_json_tracked(
+                leaderboard_json, get_tracked_bots(guild_id=guild_id)
+            )
+            title += "\n-# Tracked Bots"
+        if where:
+            title += f"\n-# Filter: `{where}` ({len(leaderboard_json)} Bots)"
+        if top_x:
+            title += f"\n**(Top {top_x})**"
+
+        if not leaderboard_json:
+            await interaction.followup.send("📭 Keine Bots gefunden.")
+            return
+
+        await send_leaderboard_pages(interaction, leaderboard_json, top_x, title)
+
     # MARK: !schedule
-    @bot.command(name="schedule", aliases=["s"])
-    async def schedule_command(ctx: commands.Context, action: str = ""):
-        """Start, stop oder list scheduled leaderboard posts"""
-        valid_actions = ["start", "stop", "list"]
+    @bot.hybrid_command(name="schedule", aliases=["s"])
+    @app_commands.describe(
+        action="start, stop, list, time oder servertime",
+        arg="<HH:MM> [Zeitzone] oder reset (für time / servertime)",
+    )
+    async def schedule_command(
+        ctx: commands.Context, action: str = "", *, arg: Optional[str] = None
+    ):
+        """Start, stop, list oder Uhrzeit der scheduled leaderboard posts"""
+        await ctx.defer()
+        valid_actions = ["start", "stop", "list", "time", "servertime"]
         data = load_bot_data()
         channel_id = ctx.channel.id
         channel = ctx.channel
         guild = ctx.guild
 
         if not action or action.lower() not in valid_actions:
+            first, last = default_post_window()
+            g_data = data.get("guild_data", {}).get(str(guild.id), {}) if guild else {}
+            post_time, zone = channel_slot(g_data, channel_id)
             await ctx.send(
                 f"## Nutzung von {ctx.prefix}schedule"
                 f"\n-# (aliases: {ctx.prefix}s)"
@@ -98,6 +261,10 @@ def register_commands(
                 "\n- start → Scheduler für diesen Channel aktivieren"
                 "\n- stop → Scheduler für diesen Channel deaktivieren"
                 "\n- list → Zeigt alle registrierten Channels (Admins only)"
+                "\n- time <HH:MM> [Zeitzone] → Uhrzeit für diesen Channel (`reset` = Server-Zeit)"
+                "\n- servertime <HH:MM> [Zeitzone] → Uhrzeit für alle Channels dieses Servers"
+                f"\n-# Standard: zwischen {first} und {last} {DEFAULT_TIMEZONE}, "
+                f"dieser Channel: {post_time} {zone}"
                 "\n-# ℹ️ Syntax: <param> = erforderlicher parameter, [param] = optionaler parameter"
             )
             return
@@ -114,7 +281,13 @@ def register_commands(
         data.setdefault("guild_data", {}).setdefault(
             guild_id_str, {"tracked_bots": [], "scheduled_channels": []}
         )
-        guild_channels = data["guild_data"][guild_id_str]["scheduled_channels"]
+        guild_data = data["guild_data"][guild_id_str]
+        guild_channels = guild_data["scheduled_channels"]
+
+        def reload_schedule():
+            # from disk: other cluster processes may have changed their guilds
+            if post_scheduler is not None:
+                post_scheduler.reload()
 
         # MARK: > start
         if action == "start":
@@ -125,9 +298,11 @@ def register_commands(
                 )
             else:
                 guild_channels.append(channel_id)
-                save_bot_data(data)
+                set_guild_data(guild.id, guild_data)
+                reload_schedule()
+                post_time, zone = channel_slot(guild_data, channel_id)
                 embed = Embed(
-                    description="✅ Dieser Channel wird jetzt täglich um 03:00 CET das Leaderboard erhalten.",
+                    description=f"✅ Dieser Channel wird jetzt täglich um {post_time} ({zone}) das Leaderboard erhalten.",
                     color=0x57F287,
                 )
             await ctx.send(embed=embed)
@@ -136,7 +311,8 @@ def register_commands(
         elif action == "stop":
             if channel_id in guild_channels:
                 guild_channels.remove(channel_id)
-                save_bot_data(data)
+                set_guild_data(guild.id, guild_data)
+                reload_schedule()
                 embed = Embed(
                     description="✅ Dieser Channel erhält das Leaderboard ab jetzt nicht mehr.",
                     color=0xED4245,
@@ -160,12 +336,14 @@ def register_commands(
             for g_id, g_data in data.get("guild_data", {}).items():
                 for ch_id in g_data.get("scheduled_channels", []):
                     ch = bot.get_channel(ch_id)
+                    post_time, zone = channel_slot(g_data, ch_id)
                     if isinstance(ch, TextChannel):
-                        all_channels.append(f"{ch.guild.name} → #{ch.name}")
+                        ch_desc = f"{ch.guild.name} → #{ch.name}"
                     elif isinstance(ch, DMChannel):
-                        all_channels.append(f"DM with {ch.recipient}")
+                        ch_desc = f"DM with {ch.recipient}"
                     else:
-                        all_channels.append(f"Unknown Channel → ID {ch_id}")
+                        ch_desc = f"Unknown Channel → ID {ch_id}"
+                    all_channels.append(f"{ch_desc} ({post_time} {zone})")
 
             if not all_channels:
                 embed = Embed(
@@ -182,6 +360,58 @@ def register_commands(
 
             await ctx.send(embed=embed)
 
+        # MARK: > time / servertime
+        elif action in ("time", "servertime"):
+            parts = (arg or "").split()
+            if not parts:
+                post_time, zone = channel_slot(guild_data, channel_id)
+                await ctx.send(
+                    f"🕒 Dieser Channel postet täglich um {post_time} ({zone})."
+                    f"\n-# Ändern mit `{ctx.prefix}schedule {action} <HH:MM> [Zeitzone]`"
+                )
+                return
+
+            if parts[0].lower() == "reset":
+                if action == "time":
+                    guild_data.get("channel_schedules", {}).pop(str(channel_id), None)
+                else:
+                    guild_data.pop("post_time", None)
+                    guild_data.pop("timezone", None)
+            else:
+                try:
+                    post_time = parse_post_time(parts[0])
+                    zone = parse_timezone(parts[1]) if len(parts) > 1 else None
+                except ValueError as e:
+                    await ctx.send(f"❌ {e}")
+                    return
+
+                if action == "time":
+                    schedule = {"time": post_time}
+                    if zone:
+                        schedule["timezone"] = zone
+                    guild_data.setdefault("channel_schedules", {})[
+                        str(channel_id)
+                    ] = schedule
+                else:
+                    guild_data["post_time"] = post_time
+                    if zone:
+                        guild_data["timezone"] = zone
+
+            set_guild_data(guild.id, guild_data)
+            reload_schedule()
+
+            post_time, zone = channel_slot(guild_data, channel_id)
+            note = (
+                ""
+                if channel_id in guild_channels
+                else f"\n-# ℹ️ Aktivieren mit `{ctx.prefix}schedule start`"
+            )
+            embed = Embed(
+                description=f"🕒 Dieser Channel postet täglich um {post_time} ({zone}).{note}",
+                color=0x57F287,
+            )
+            await ctx.send(embed=embed)
+
     # MARK: !ping
     @bot.command(name="ping", aliases=["p"])
     async def ping_command(ctx: commands.Context):
@@ -190,7 +420,11 @@ def register_commands(
         await ctx.send(f"🏓 Pong! {latency_ms}ms")
 
     # MARK: !track
-    @bot.command(name="track", aliases=["t"])
+    @bot.hybrid_command(name="track", aliases=["t"])
+    @app_commands.describe(
+        action="list, add, remove oder notify",
+        arg="Botnamen (add), Indizes (remove) oder on/off (notify)",
+    )
     async def track_command(
         ctx: commands.Context,
         action: Optional[str] = None,
@@ -198,6 +432,8 @@ def register_commands(
         arg: Optional[str] = None,
     ):
         """Manage tracked bots: list/add/remove"""
+        # slash command: acknowledge now, fetching the leaderboard can take a while
+        await ctx.defer()
         guild_id = ctx.guild.id if ctx.guild else ctx.author.id
         tracked_bots: List[Dict] = get_tracked_bots(guild_id=guild_id)
 
@@ -240,7 +476,7 @@ def register_commands(
                 )
                 return
 
-            leaderboard_json, _ = get_leaderboard_json()
+            leaderboard_json, _ = await asyncio.to_thread(get_leaderboard_json)
             if "error" in leaderboard_json[0]:
                 await ctx.send(leaderboard_json[0]["error"])
                 return
@@ -445,6 +681,21 @@ def register_commands(
 
             await ctx.send(embed=embed)
 
+        # MARK: > notify
+        elif action == "notify":
+            guild_data = get_guild_data(guild_id)
+            if arg and arg.strip().lower() == "off":
+                guild_data["notify_channel"] = None
+                description = "🔕 Keine Benachrichtigungen mehr für tracked Bots."
+            else:
+                guild_data["notify_channel"] = ctx.channel.id
+                description = (
+                    "🔔 Dieser Channel wird bei jedem neuen Leaderboard über "
+                    "Rang-, DNQ- und Score-Änderungen der tracked Bots informiert."
+                )
+            set_guild_data(guild_id, guild_data)
+            await ctx.send(embed=Embed(description=description, color=embed_color))
+
         else:
             await ctx.send(
                 f"## Nutzung von `{ctx.prefix}track`"
@@ -453,13 +704,262 @@ def register_commands(
                 "\n- `add <Botname>      ` → fügt Bot zu zum tracking mit namen `<Botname>`"
                 "\n- `remove <list index>` → entfernt bot vom tracking mit index `<list index>`"
                 "\n- `list               ` → Zeigt alle tracked Bots"
+                "\n- `notify [on|off]    ` → Änderungen der tracked Bots in diesem Channel melden"
+                "\n-# ℹ️ Syntax: `<param>` = erforderlicher parameter, `[param]` = optionaler parameter"
+            )
+            return
+
+    # MARK: !history
+    @bot.command(name="history", aliases=["h"])
+    async def history_command(ctx: commands.Context, *, arg: Optional[str] = None):
+        """Zeigt Rang und Score eines Bots über die Zeit als Diagramm"""
+        if not arg or arg.lower() == "help":
+            await ctx.send(
+                f"## Nutzung von `{ctx.prefix}history`"
+                f"\n-# (aliases: {ctx.prefix}h)"
+                "\n"
+                "\n`!history <Botname|tracked> [tage|all]`"
+                "\n- `<Botname>` → Verlauf von Rang und Score dieses Bots"
+                "\n- `tracked  ` → Verlauf aller tracked Bots"
+                "\n- `[tage]   ` → nur die letzten [tage] Tage (Standard: 30, `all` = alles)"
                 "\n-# ℹ️ Syntax: `<param>` = erforderlicher parameter, `[param]` = optionaler parameter"
             )
             return
 
+        # optional range as last word
+        days = 30
+        parts = arg.rsplit(" ", 1)
+        if len(parts) == 2 and (parts[1].isdigit() or parts[1].lower() == "all"):
+            arg = parts[0]
+            days = 0 if parts[1].lower() == "all" else int(parts[1])
+
+        store = get_history_store()
+        if len(store) == 0:
+            await ctx.send("📭 Es wurden noch keine Leaderboards gespeichert.")
+            return
+
+        if arg.lower() == "tracked":
+            guild_id = ctx.guild.id if ctx.guild else ctx.author.id
+            keys = [
+                bot_key(b["name"], b["author"])
+                for b in get_tracked_bots(guild_id=guild_id)
+            ]
+            if not keys:
+                await ctx.send("📭 Keine Bots werden aktuell getrackt.")
+                return
+        else:
+            keys = store.find_bots(arg.strip())
+            if not keys:
+                await ctx.send(f"❓ Kein Verlauf für `{arg.strip()}` gefunden.")
+                return
+
+        def render_charts() -> List[str]:
+            paths = (get_history_chart(store, key, days) for key in keys)
+            return [path for path in paths if path]
+
+        async with ctx.typing():
+            chart_paths = await job_queue.submit(
+                PRIORITY_INTERACTIVE, asyncio.to_thread, render_charts
+            )
+        if not chart_paths:
+            await ctx.send("📭 Keine Daten im gewählten Zeitraum.")
+            return
+
+        # Discord allows max. 10 attachments per message
+        MAX_FILES_PER_MESSAGE = 10
+        for i in range(0, len(chart_paths), MAX_FILES_PER_MESSAGE):
+            await ctx.send(
+                files=[
+                    File(path) for path in chart_paths[i : i + MAX_FILES_PER_MESSAGE]
+                ]
+            )
+
+    # MARK: !movers
+    @bot.command(name="movers", aliases=["m"])
+    async def movers_command(
+        ctx: commands.Context,
+        count: Optional[str] = None,
+        toggle: Optional[str] = None,
+    ):
+        """Zeigt die größten Auf- und Absteiger seit dem letzten Leaderboard"""
+        if count and count.lower() == "help":
+            await ctx.send(
+                f"## Nutzung von `{ctx.prefix}movers`"
+                f"\n-# (aliases: {ctx.prefix}m)"
+                "\n"
+                "\n- `[n]            ` → zeigt die [n] größten Auf- und Absteiger "
+                f"(Standard: {MOVERS_DEFAULT_COUNT}, max. {MOVERS_MAX_COUNT})"
+                "\n- `auto <on|off>  ` → Movers zusätzlich bei geplanten Posts senden"
+                "\n-# ℹ️ Syntax: `<param>` = erforderlicher parameter, `[param]` = optionaler parameter"
+            )
+            return
+
+        # MARK: > auto
+        if count and count.lower() == "auto":
+            if ctx.guild is None:
+                await ctx.send(
+                    "❌ Dieser Befehl kann nur in Server-Textkanälen verwendet werden."
+                )
+                return
+
+            guild_data = get_guild_data(ctx.guild.id)
+            enabled = (toggle or "").lower() != "off"
+            guild_data["post_movers"] = enabled
+            set_guild_data(ctx.guild.id, guild_data)
+            await ctx.send(
+                embed=Embed(
+                    description=(
+                        "✅ Geplante Posts enthalten jetzt auch die Movers."
+                        if enabled
+                        else "✅ Geplante Posts enthalten keine Movers mehr."
+                    ),
+                    color=0x57F287 if enabled else 0xED4245,
+                )
+            )
+            return
+
+        count_int = MOVERS_DEFAULT_COUNT
+        if count:
+            if not count.isdigit() or int(count) < 1:
+                await ctx.send("❌ Ungültige Zahl. Bitte gib eine ganze Zahl ein.")
+                return
+            count_int = min(int(count), MOVERS_MAX_COUNT)
+
+        await job_queue.submit(
+            PRIORITY_INTERACTIVE, send_movers, ctx.channel, count_int
+        )
+
+    # MARK: !stats
+    @bot.command(name="stats")
+    async def stats_command(ctx: commands.Context, days: Optional[str] = None):
+        """Statistiken pro Sprache und Ort, optional über die letzten x Tage"""
+        if days and (days.lower() == "help" or not days.isdigit()):
+            await ctx.send(
+                f"## Nutzung von `{ctx.prefix}stats`"
+                "\n"
+                "\n- `       ` → Anzahl, Ø Score, bester Score und DNQ-Quote pro Sprache und Ort"
+                "\n- `[tage] ` → dasselbe über alle gespeicherten Leaderboards der letzten [tage] Tage"
+                "\n-# ℹ️ Syntax: `<param>` = erforderlicher parameter, `[param]` = optionaler parameter"
+            )
+            return
+
+        def build_stats_image() -> tuple[Optional[str], Optional[str]]:
+            """Blocking: (image path, None) or (None, error message)."""
+            if days:
+                store = get_history_store()
+                entries = store.range_by_date(start=range_start(store, int(days)))
+                if not entries:
+                    return None, "📭 Keine gespeicherten Leaderboards im Zeitraum."
+                stats = history_stats(store, entries)
+                keys = tuple(entry["key"] for entry in entries)
+                title = (
+                    f"Statistik {entries[0]['date']} bis {entries[-1]['date']} "
+                    f"({len(entries)} Leaderboards)"
+                )
+            else:
+                leaderboard_json, leaderboard_meta = get_leaderboard_json()
+                key = snapshot_key(leaderboard_meta)
+                if (
+                    key is None
+                    or not leaderboard_json
+                    or "error" in leaderboard_json[0]
+                ):
+                    return None, "❌ Leaderboard konnte nicht geladen werden."
+                stats = snapshot_stats(key, leaderboard_json)
+                keys = (key,)
+                title = f"Statistik vom {leaderboard_meta.get('date')}"
+            return get_stats_image(keys, stats, title), None
+
+        # fetch, aggregation and Pillow stay off the event loop
+        async with ctx.typing():
+            path, error = await job_queue.submit(
+                PRIORITY_INTERACTIVE, asyncio.to_thread, build_stats_image
+            )
+        if error:
+            await ctx.send(error)
+            return
+        await ctx.send(file=File(path))
+
+    # MARK: !export
+    @bot.command(name="export", aliases=["e"])
+    async def export_command(
+        ctx: commands.Context,
+        fmt: Optional[str] = None,
+        date_range: Optional[str] = None,
+    ):
+        """Exportiert das Leaderboard oder einen Zeitraum als CSV/JSONL (gzip)"""
+        if fmt and fmt.lower() == "help":
+            await ctx.send(
+                f"## Nutzung von `{ctx.prefix}export`"
+                f"\n-# (aliases: {ctx.prefix}e)"
+                "\n"
+                "\n`!export [format] [zeitraum]`"
+                "\n- `[format]  ` → `csv` (Standard), `jsonl` oder `columnar` (eine Zeile pro Leaderboard)"
+                "\n- `[zeitraum]` → ohne: aktuelles Leaderboard, `[tage]`, `all`, `JJJJ-MM-TT` oder `JJJJ-MM-TT..JJJJ-MM-TT`"
+                "\n-# ℹ️ Syntax: `<param>` = erforderlicher parameter, `[param]` = optionaler parameter"
+            )
+            return
+
+        # format is optional, `!export 30` means csv of the last 30 days
+        if date_range is None and fmt and (fmt[0].isdigit() or fmt.lower() == "all"):
+            fmt, date_range = None, fmt
+        extension = EXPORT_FORMATS.get((fmt or "csv").lower())
+        if extension is None:
+            await ctx.send(
+                f"❌ Unbekanntes Format `{fmt}`. Erlaubt: `csv`, `jsonl`, `columnar`."
+            )
+            return
+
+        store = get_history_store()
+        try:
+            dates = parse_export_range(date_range, store)
+        except ValueError:
+            await ctx.send(f"❌ Ungültiger Zeitraum `{date_range}`.")
+            return
+
+        if dates is None:
+            snapshots = iter_current_snapshot()
+            name = "leaderboard"
+        else:
+            entries = store.range_by_date(*dates)
+            if not entries:
+                await ctx.send("📭 Keine gespeicherten Leaderboards im Zeitraum.")
+                return
+            snapshots = iter_history_snapshots(store, entries)
+            name = f"leaderboard_{entries[0]['date']}_{entries[-1]['date']}"
+
+        async with ctx.typing():
+            path, count = await job_queue.submit(
+                PRIORITY_INTERACTIVE,
+                asyncio.to_thread,
+                write_export,
+                extension,
+                snapshots,
+            )
+        try:
+            if count == 0:
+                await ctx.send("❌ Leaderboard konnte nicht geladen werden.")
+                return
+            size_limit = ctx.guild.filesize_limit if ctx.guild else 10 * 1024 * 1024
+            if os.path.getsize(path) > size_limit:
+                await ctx.send(
+                    "❌ Export ist zu groß für Discord. Bitte einen kürzeren Zeitraum wählen."
+                )
+                return
+            await ctx.send(
+                f"📦 {count} Leaderboard{'s' if count != 1 else ''}",
+                file=File(path, filename=f"{name}.{extension}.gz"),
+            )
+        finally:
+            os.remove(path)
+
     # MARK: !bot
     @bot.command(name="bot")
-    async def bot_command(ctx: commands.Context, subcommand: Optional[str] = None):
+    async def bot_command(
+        ctx: commands.Context,
+        subcommand: Optional[str] = None,
+        arg: Optional[str] = None,
+    ):
         """
         Verwalte Bot-spezifische Aktionen
         """
@@ -469,6 +969,7 @@ def register_commands(
                 f"## Nutzung von `{ctx.prefix}bot`"
                 "\n- `emojitest` → sendet alle Emojis zum Testen"
                 "\n- `stop`      → fährt den Bot herunter (Admins only)"
+                "\n- `profile [top_x]` → CPU- und Speicher-Profil von fetch → parse → render (Admins only)"
                 "\n-# ℹ️ Syntax: `<param>` = erforderlicher Parameter, `[param]` = optionaler Parameter"
             )
             return
@@ -487,15 +988,42 @@ def register_commands(
                 )
                 return
 
-            print(
-                f"[BOT STOP] {ctx.author} ({ctx.author.id}) hat den Bot heruntergefahren."
+            logger.warning(
+                f"[BOT STOP] {ctx.author} ({ctx.author.id}) hat den Bot heruntergefahren.",
+                extra=command_fields(ctx),
             )
             await ctx.send("⏹️ Bot wird heruntergefahren...")
             await bot.close()
 
+        elif subcommand == "profile":
+            if ctx.author.id not in ADMINS:
+                await ctx.send(
+                    "🚫 Du hast keine Berechtigung, diesen Befehl zu nutzen."
+                )
+                return
+
+            top_x_int = int(arg) if arg and arg.isdigit() else None
+            status_msg = await ctx.send("*🔬 Profiling läuft...*")
+            try:
+                report, stats_path = await asyncio.to_thread(
+                    profile_pipeline, top_x_int
+                )
+            except RuntimeError as e:
+                await status_msg.edit(content=f"⚠️ {e}")
+                return
+
+            summary = "\n".join(report.splitlines()[:3])
+            await status_msg.edit(content=f"**🔬 Profiling**\n```\n{summary}\n```")
+            await ctx.send(
+                files=[
+                    File(io.BytesIO(report.encode("utf-8")), filename="profile.txt"),
+                    File(stats_path),
+                ]
+            )
+
         else:
             # Fallback-Hilfe für unbekannte Unterbefehle
             await ctx.send(
                 f"Unbekannter Unterbefehl `{subcommand}`.\n"
-                f"Verfügbare Unterbefehle: `emojitest`, `stop`"
+                f"Verfügbare Unterbefehle: `emojitest`, `stop`, `profile`"
             )
@@ -0,0 +1,125 @@
+# helper_scripts/command_throttle.py
+
+# Standard library imports
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+# Third-party imports
+# None
+
+# Own modules
+from helper_scripts.metrics import registry
+
+
+#       |==========================|
+#       |   COMMAND_THROTTLE.PY    |
+#       |==========================|
+
+# Caps the load one busy channel can cause with `!lb`:
+# - identical requests (same channel, top_x, mode, filter) that arrive while
+#   one is still running share that run instead of starting their own
+# - within the channel cooldown an identical request, and within the user
+#   cooldown any request of that user, gets a link to the last posted result
+
+
+DEFAULT_USER_COOLDOWN = 30
+DEFAULT_CHANNEL_COOLDOWN = 60
+
+RequestKey = Tuple[Hashable, ...]
+
+# outcome of LeaderboardThrottle.run()
+RAN = "ran"
+COALESCED = "coalesced"
+COOLDOWN = "cooldown"
+
+
+# MARK: LeaderboardThrottle
+class LeaderboardThrottle:
+    def __init__(
+        self,
+        user_cooldown: float = DEFAULT_USER_COOLDOWN,
+        channel_cooldown: float = DEFAULT_CHANNEL_COOLDOWN,
+    ):
+        self.user_cooldown = user_cooldown
+        self.channel_cooldown = channel_cooldown
+        self.in_flight: Dict[RequestKey, asyncio.Future] = {}
+        # key -> (posted at, link to the posted message)
+        self.last_posted: Dict[RequestKey, Tuple[float, str]] = {}
+        # user id -> (requested at, request key)
+        self.last_request: Dict[int, Tuple[float, RequestKey]] = {}
+
+    # MARK: > cooldown
+    def cooldown(self, user_id: int, key: RequestKey) -> Optional[Tuple[float, str]]:
+        """(seconds left, link to last result) if the request is throttled."""
+        now = time.monotonic()
+
+        posted = self.last_posted.get(key)
+        if posted and now - posted[0] < self.channel_cooldown:
+            return self.channel_cooldown - (now - posted[0]), posted[1]
+
+        requested = self.last_request.get(user_id)
+        if requested and now - requested[0] < self.user_cooldown:
+            last = self.last_posted.get(requested[1])
+            if last:
+                return self.user_cooldown - (now - requested[0]), last[1]
+        return None
+
+    # MARK: > run
+    async def run(
+        self,
+        user_id: int,
+        key: RequestKey,
+        func: Callable[[], Awaitable[Any]],
+    ) -> Tuple[str, Any]:
+        """
+        Run `func` for this request unless an identical one is in flight
+        (COALESCED, None) or a cooldown applies (COOLDOWN, (seconds left,
+        link)). `func` returns the posted message, or None on errors.
+        """
+        if key in self.in_flight:
+            self._count(COALESCED)
+            self.last_request[user_id] = (time.monotonic(), key)
+            return COALESCED, None
+
+        throttled = self.cooldown(user_id, key)
+        if throttled:
+            self._count(COOLDOWN)
+            return COOLDOWN, throttled
+
+        self._count(RAN)
+        self.last_request[user_id] = (time.monotonic(), key)
+        future = asyncio.ensure_future(func())
+        self.in_flight[key] = future
+        try:
+            message = await asyncio.shield(future)
+        finally:
+            if future.done():
+                self.in_flight.pop(key, None)
+            else:  # requester cancelled: keep sharing until the run ends
+                future.add_done_callback(lambda _: self.in_flight.pop(key, None))
+
+        if message is not None and getattr(message, "jump_url", None):
+            self._prune()
+            self.last_posted[key] = (time.monotonic(), message.jump_url)
+        return RAN, message
+
+    def _prune(self):
+        now = time.monotonic()
+        # the user cooldown links to posts too
+        keep = max(self.user_cooldown, self.channel_cooldown)
+        self.last_posted = {
+            k: v for k, v in self.last_posted.items() if now - v[0] < keep
+        }
+        self.last_request = {
+            k: v
+            for k, v in self.last_request.items()
+            if now - v[0] < self.user_cooldown
+        }
+
+    def _count(self, outcome: str):
+        registry.inc(
+            "leaderboard_requests_total",
+            help_text="!leaderboard requests by outcome",
+            outcome=outcome,
+        )
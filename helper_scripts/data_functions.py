@@ -2,12 +2,15 @@
 
 # Standard library imports
 import json
-from typing import List, Dict
+import os
+from contextlib import contextmanager
+from typing import Dict, Iterator, List
 
 # Third-party imports
 # None
 
 # Own modules
+from helper_scripts.file_lock import file_lock
 from helper_scripts.globals import LOCAL_DATA_PATH_DIR
 
 
@@ -25,33 +28,49 @@ def load_bot_data() -> dict:
 
 def save_bot_data(data: dict):
     """Save a full dict back into bot_data.json."""
-    with open(BOT_DATA_FILE, "w", encoding="utf-8") as f:
+    with file_lock(BOT_DATA_FILE):
+        _write_bot_data(data)
+
+
+def _write_bot_data(data: dict):
+    # temp file + rename: other processes never read a half-written file
+    tmp_path = f"{BOT_DATA_FILE}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
         json.dump(data, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, BOT_DATA_FILE)
+
+
+@contextmanager
+def update_bot_data() -> Iterator[dict]:
+    """
+    Load, modify and save bot_data.json while holding the file lock, so
+    processes of a cluster never overwrite each other's changes.
+    """
+    with file_lock(BOT_DATA_FILE):
+        data = load_bot_data()
+        yield data
+        _write_bot_data(data)
 
 
 # MARK: Guild Data
 def get_guild_data(guild_id: int) -> dict:
     """Return the data for a specific guild ID, creating it if missing."""
-    data = load_bot_data()
-    guilds = data.setdefault("guild_data", {})
-
     guild_id_str = str(guild_id)
+    guilds = load_bot_data().get("guild_data", {})
+    if guild_id_str in guilds:
+        return guilds[guild_id_str]
 
     # Create empty structure if missing
-    if guild_id_str not in guilds:
-        guilds[guild_id_str] = {"tracked_bots": [], "scheduled_channels": []}
-        save_bot_data(data)
-
+    with update_bot_data() as data:
+        guilds = data.setdefault("guild_data", {})
+        guilds.setdefault(guild_id_str, {"tracked_bots": [], "scheduled_channels": []})
     return guilds[guild_id_str]
 
 
 def set_guild_data(guild_id: int, guild_dict: dict):
     """Write the updated guild data back into bot_data.json."""
-    data = load_bot_data()
-    guilds = data.setdefault("guild_data", {})
-
-    guilds[str(guild_id)] = guild_dict
-    save_bot_data(data)
+    with update_bot_data() as data:
+        data.setdefault("guild_data", {})[str(guild_id)] = guild_dict
 
 
 # MARK: Tracked Bots
@@ -66,3 +85,15 @@ def set_tracked_bots(guild_id: int, tracked: List[Dict[str, str]]):
     guild_data = get_guild_data(guild_id)
     guild_data["tracked_bots"] = tracked
     set_guild_data(guild_id, guild_data)
+
+
+# MARK: Bot State
+def get_bot_state(name: str, default=None):
+    """Return a persisted bot-wide state value (e.g. last seen snapshot)."""
+    return load_bot_data().get("bot_state", {}).get(name, default)
+
+
+def set_bot_state(name: str, value):
+    """Persist a bot-wide state value."""
+    with update_bot_data() as data:
+        data.setdefault("bot_state", {})[name] = value
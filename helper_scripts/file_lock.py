@@ -0,0 +1,44 @@
+# helper_scripts/file_lock.py
+
+# Standard library imports
+import os
+from contextlib import contextmanager
+from typing import Iterator
+
+try:
+    import fcntl
+except ImportError:  # Windows: single-process use only
+    fcntl = None
+
+# Third-party imports
+# None
+
+# Own modules
+# None
+
+
+#       |==========================|
+#       |       FILE_LOCK.PY       |
+#       |==========================|
+
+# Cross-process lock for files that several bot processes of a cluster
+# share (bot_data.json, the history store). Not reentrant: code holding the
+# lock must not call anything that takes the same lock again.
+
+
+# MARK: file_lock()
+@contextmanager
+def file_lock(path) -> Iterator[None]:
+    """Exclusive lock on `<path>.lock` for the duration of the block."""
+    if fcntl is None:
+        yield
+        return
+
+    lock_path = f"{path}.lock"
+    os.makedirs(os.path.dirname(lock_path) or ".", exist_ok=True)
+    with open(lock_path, "a") as f:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f.fileno(), fcntl.LOCK_UN)
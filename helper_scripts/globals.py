@@ -1,6 +1,7 @@
 # helper_scripts/globals.py
 
 # Standard library imports
+import os
 from pathlib import Path
 
 # Third-party imports
@@ -11,7 +12,12 @@ from pathlib import Path
 
 
 BASE_DIR = Path(__file__).parent.parent
-LOCAL_DATA_PATH_DIR = BASE_DIR / "local_data"
+# override e.g. for benchmarks, so they never touch the real bot data
+LOCAL_DATA_PATH_DIR = Path(
+    os.getenv("HIDDEN_GEMS_LOCAL_DATA_DIR", str(BASE_DIR / "local_data"))
+)
+# set per process by the cluster launcher, keeps per-process files apart
+CLUSTER_ID = os.getenv("LEADERBOARD_CLUSTER_ID", "")
 IMAGES_DIR = BASE_DIR / "images"
 LANGUAGE_LOGOS_DIR = IMAGES_DIR / "languages"
 
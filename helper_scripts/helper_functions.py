@@ -1,17 +1,26 @@
 # helper_scripts/helper_functions.py
 
 # Standard library imports
+import asyncio
+import contextlib
+import logging
 import os
+import hashlib
+import heapq
 import json
 import math
+import queue
 import re
-from typing import Optional, Dict, Any
+import threading
+import time
+from collections import Counter, OrderedDict
+from typing import AsyncIterator, Callable, Generator, Optional, Dict, Any
 
 
 # Third-party imports
 import discord
 from PIL import Image, ImageDraw, ImageFont
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 import datetime
 import requests
 
@@ -19,14 +28,53 @@ import requests
 # Own modules
 from helper_scripts.asset_access import language_logos, get_lang_icon, get_twemoji_image
 from helper_scripts.data_functions import load_bot_data
-from helper_scripts.globals import BASE_DIR, LOCAL_DATA_PATH_DIR
+from helper_scripts.globals import BASE_DIR, CLUSTER_ID, LOCAL_DATA_PATH_DIR
+from helper_scripts.history_store import get_history_store, snapshot_key
+from helper_scripts.image_store import get_image_store
+from helper_scripts.job_queue import PRIORITY_SCHEDULED, job_queue
+from helper_scripts.metrics import observe_stage, record_cache, timed
+from helper_scripts.sharding import owns_guild
+from helper_scripts.posting_journal import (
+    CHANNEL_DELIVERED,
+    CHANNEL_FAILED,
+    CHANNEL_SENDING,
+)
+from helper_scripts.leaderboard_columns import (
+    LeaderboardColumns,
+    get_snapshot_columns,
+    parse_where_query,
+)
+from helper_scripts.snapshot_diff import diff_snapshots
+from helper_scripts import worker_client
 
 
 FONTS_DIR = BASE_DIR / "fonts"
-GENERATED_TABLES_DIR = LOCAL_DATA_PATH_DIR / "generated_tables"
+# per cluster process: render cache eviction deletes files
+GENERATED_TABLES_DIR = LOCAL_DATA_PATH_DIR / "generated_tables" / CLUSTER_ID
 TEXT_FONT_PATH = FONTS_DIR / "DejaVuSans.ttf"
 HTML_FILE_PATH = LOCAL_DATA_PATH_DIR / "leaderboard.html"
 JSON_FILE_PATH = LOCAL_DATA_PATH_DIR / "leaderboard.json"
+SCRIMS_URL = "https://hiddengems.gymnasiumsteglitz.de/scrims"
+MOVERS_DEFAULT_COUNT = 10
+MOVERS_MAX_COUNT = 50
+MAX_ROWS_PER_IMAGE = 20
+# finished images waiting for upload; bounds memory and disk ahead of Discord
+RENDER_QUEUE_SIZE = 2
+MAX_CACHED_RENDERS = 16
+
+# rows digest -> rendered image paths, least recently used first
+_render_cache: "OrderedDict[str, list[str]]" = OrderedDict()
+_render_cache_lock = threading.RLock()
+# renders of the next scheduled post (prewarm.py), not counted or evicted
+_pinned_renders: set[str] = set()
+# image path -> number of uploads holding it (images_in_use)
+_images_in_use: Counter = Counter()
+# evicted while in use: deleted once the last holder lets go
+_orphaned_images: set[str] = set()
+# last parsed scrims page: digest, ETag/Last-Modified, rows, meta
+_last_page: dict[str, Any] = {}
+
+logger = logging.getLogger(__name__)
 
 
 os.makedirs(GENERATED_TABLES_DIR, exist_ok=True)
@@ -34,36 +82,263 @@ os.makedirs(GENERATED_TABLES_DIR, exist_ok=True)
 
 # MARK: generate_images_from_json()
 def generate_images_from_json(
-    leaderboard_json: list[dict], top_x: int | None = None
+    leaderboard_json: list[dict],
+    top_x: int | None = None,
+    delta_column: bool = False,
+    file_prefix: str = "leaderboard",
 ) -> list[str]:
-    """Generate one or more PNG images from the leaderboard JSON."""
+    """
+    Generate one or more PNG images from the leaderboard JSON.
+    With `delta_column`, the "Delta" value of each row (rank change, e.g. +3)
+    is drawn in an extra column after "Rang".
+    """
+    return list(
+        iter_images_from_json(leaderboard_json, top_x, delta_column, file_prefix)
+    )
+
+
+# MARK: render_digest()
+def render_digest(leaderboard_json: list[dict], top_x: int | None = None) -> str:
+    """Content hash of the rows an image render would draw."""
+    rows = leaderboard_json[:top_x] if top_x else leaderboard_json
+    payload = json.dumps(rows, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:16]
+
+
+# MARK: get_cached_images()
+def get_cached_images(
+    digest: str,
+    image_count: int = 0,
+    hold: Callable[[str], None] | None = None,
+    cache_name: str = "rendered_images",
+) -> list[str] | None:
+    """
+    Image paths of an earlier render of the same rows, if still on disk.
+    With `image_count`, complete renders from other processes (e.g.
+    development/batch_render.py) are found by their file names, too.
+    `hold` (see images_in_use()) is applied to a hit before eviction can run.
+    `cache_name` is the label of the hit/miss metric.
+    """
+    with _render_cache_lock:
+        paths = _render_cache.get(digest)
+        if paths is None and image_count:
+            paths = [
+                str(GENERATED_TABLES_DIR / f"render_{digest}_part_{i}.png")
+                for i in range(1, image_count + 1)
+            ]
+            if all(os.path.exists(path) for path in paths):
+                _render_cache[digest] = paths
+            else:
+                paths = None
+        hit = paths is not None and all(os.path.exists(path) for path in paths)
+        if hit:
+            _render_cache.move_to_end(digest)
+            if hold:
+                for path in paths:
+                    hold(path)
+    record_cache(cache_name, hit)
+    return paths if hit else None
+
+
+# MARK: store_cached_images()
+def store_cached_images(digest: str, paths: list[str], pin: bool = False):
+    """
+    Remember a finished render; the oldest unpinned renders are dropped.
+    Their files are deleted unless another entry or an upload still uses them.
+    """
+    with _render_cache_lock:
+        _render_cache[digest] = paths
+        _render_cache.move_to_end(digest)
+        if pin:
+            _pinned_renders.add(digest)
+
+        unpinned = [d for d in _render_cache if d not in _pinned_renders]
+        for old_digest in unpinned[: max(len(unpinned) - MAX_CACHED_RENDERS, 0)]:
+            old_paths = _render_cache.pop(old_digest)
+            # page entries (digest:page) share file names with full renders
+            live = {path for entry in _render_cache.values() for path in entry}
+            for path in old_paths:
+                if path in live:
+                    continue
+                if _images_in_use[path]:
+                    _orphaned_images.add(path)
+                else:
+                    _remove_image(path)
+
+
+def _remove_image(path: str):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+# MARK: unpin_renders()
+def unpin_renders():
+    """Let the renders pinned by the last pre-warm age out normally again."""
+    with _render_cache_lock:
+        _pinned_renders.clear()
+
+
+# MARK: images_in_use()
+@contextlib.contextmanager
+def images_in_use(paths: list[str] = ()):
+    """
+    Keep image files from being deleted by cache eviction (e.g. while they
+    are uploaded). Yields `hold(path)` to add more paths inside the block.
+    """
+    held: list[str] = []
+
+    def hold(path: str):
+        with _render_cache_lock:
+            _images_in_use[path] += 1
+        held.append(path)
+
+    for path in paths:
+        hold(path)
+    try:
+        yield hold
+    finally:
+        with _render_cache_lock:
+            live = {path for entry in _render_cache.values() for path in entry}
+            for path in held:
+                _images_in_use[path] -= 1
+                if _images_in_use[path] > 0:
+                    continue
+                del _images_in_use[path]
+                if path in _orphaned_images:
+                    _orphaned_images.discard(path)
+                    if path not in live:
+                        _remove_image(path)
+
+
+# MARK: render_images_cached()
+def render_images_cached(
+    leaderboard_json: list[dict], top_x: int | None = None, pin: bool = False
+) -> list[str]:
+    """
+    Blocking: images of these rows, rendered only if not in the render cache.
+    `pin` keeps them cached until unpin_renders() (pre-warmed posts).
+    """
+    digest = render_digest(leaderboard_json, top_x)
+    rows = leaderboard_json[:top_x] if top_x else leaderboard_json
+    with _render_cache_lock:
+        paths = get_cached_images(digest, len(image_chunks(len(rows))))
+        if paths is not None and pin:
+            _pinned_renders.add(digest)
+    if paths is None:
+        paths = generate_images_from_json(
+            leaderboard_json, top_x, file_prefix=f"render_{digest}"
+        )
+        store_cached_images(digest, paths, pin=pin)
+    return paths
+
+
+# MARK: render_page_cached()
+def render_page_cached(
+    leaderboard_json: list[dict],
+    top_x: int | None,
+    page: int,
+    hold: Callable[[str], None] | None = None,
+) -> str:
+    """
+    Blocking: one image (0-based page) of these rows, cached like full renders.
+    `hold` (see images_in_use()) keeps the file until the upload is done.
+    """
+    digest = render_digest(leaderboard_json, top_x)
+    rows = leaderboard_json[:top_x] if top_x else leaderboard_json
+    with _render_cache_lock:
+        full = get_cached_images(digest, len(image_chunks(len(rows))))
+        if full is not None:
+            if hold:
+                hold(full[page])
+            return full[page]
+
+    page_key = f"{digest}:{page}"
+    paths = get_cached_images(page_key, hold=hold)
+    if paths is None:
+        # same file name as in a full render of these rows
+        paths = list(
+            iter_images_from_json(
+                leaderboard_json, top_x, file_prefix=f"render_{digest}", only_page=page
+            )
+        )
+        if hold:
+            hold(paths[0])
+        store_cached_images(page_key, paths)
+    return paths[0]
+
+
+# MARK: image_chunks()
+def image_chunks(total_rows: int) -> list[tuple[int, int]]:
+    """(start, end) row ranges of the images, evenly filled."""
+    if total_rows <= 0:
+        return []
+    num_images = math.ceil(total_rows / MAX_ROWS_PER_IMAGE)
+    rows_per_image = math.ceil(total_rows / num_images)
+    return [
+        (start, min(start + rows_per_image, total_rows))
+        for start in range(0, total_rows, rows_per_image)
+    ]
+
+
+# MARK: iter_images_from_json()
+def iter_images_from_json(
+    leaderboard_json: list[dict],
+    top_x: int | None = None,
+    delta_column: bool = False,
+    file_prefix: str = "leaderboard",
+    only_page: int | None = None,
+    local: bool = False,
+) -> Generator[str, None, None]:
+    """
+    Like generate_images_from_json(), but yields each image path as soon as
+    that chunk is encoded, so only one pixel buffer is alive at a time.
+    With `only_page`, just that image (0-based) is rendered.
+    `local` renders in this process even if a render worker is configured.
+    """
+    if worker_client.enabled() and not local:
+        yielded = False
+        try:
+            for path in worker_client.remote_images(
+                rows=leaderboard_json,
+                top_x=top_x,
+                delta_column=delta_column,
+                file_prefix=file_prefix,
+                only_page=only_page,
+            ):
+                yielded = True
+                yield path
+            return
+        except OSError as e:
+            if yielded:
+                raise
+            worker_client.unreachable(e)
 
     # ----- COLORS -----
     BACKGROUND_COLOR = (21, 21, 20)
     HEADER_COLOR = (255, 200, 0)
     NORMAL_TEXT_COLOR = (231, 230, 225)
     DNQ_TEXT_COLOR = (108, 107, 105)
+    DELTA_UP_COLOR = (87, 242, 135)
+    DELTA_DOWN_COLOR = (237, 66, 69)
 
     # ----- LAYOUT -----
     PADDING = 5
     LINE_HEIGHT = 36
-    MAX_ROWS_PER_IMAGE = 20
     TEXT_FONT = ImageFont.truetype(TEXT_FONT_PATH, 18)
+    DELTA_COL_WIDTH = 60
 
     # slice top_x rows if provided
     rows = leaderboard_json[:top_x] if top_x else leaderboard_json
-    total_rows = len(rows)
-    num_images = math.ceil(total_rows / MAX_ROWS_PER_IMAGE)
-    rows_per_image = math.ceil(total_rows / num_images)
-
-    images = []
 
-    for i in range(num_images):
-        start_idx = i * rows_per_image
-        end_idx = min(start_idx + rows_per_image, total_rows)
+    for i, (start_idx, end_idx) in enumerate(image_chunks(len(rows))):
+        if only_page is not None and i != only_page:
+            continue
+        chunk_start = time.perf_counter()
         chunk = rows[start_idx:end_idx]
 
-        img_width = 1140
+        img_width = 1140 + (DELTA_COL_WIDTH if delta_column else 0)
         img_height = PADDING * 2 + (len(chunk) + 1) * LINE_HEIGHT
         img = Image.new("RGB", (img_width, img_height), color=BACKGROUND_COLOR)
         draw = ImageDraw.Draw(img)
@@ -82,13 +357,18 @@ def generate_images_from_json(
             ("Ort", 150),
             ("Lang", 60),
         ]
+        if delta_column:
+            columns.insert(2, ("+/-", DELTA_COL_WIDTH))
+        delta_col = 2 if delta_column else None
+        emoji_col = 3 if delta_column else 2
+
         header_titles, col_widths = zip(*columns)
         col_x = [5]
         for w in col_widths[:-1]:
             col_x.append(col_x[-1] + w)
 
         for col_idx, head in enumerate(header_titles):
-            if col_idx != 2:  # not emoji column
+            if col_idx != emoji_col:
                 draw.text(
                     (col_x[col_idx], PADDING), head, fill=HEADER_COLOR, font=TEXT_FONT
                 )
@@ -124,8 +404,11 @@ def generate_images_from_json(
                 author,
                 ort,
             ]
+            if delta_column:
+                row_values.insert(delta_col, entry.get("Delta", ""))
+
             for col_idx, val in enumerate(row_values):
-                if col_idx == 2:  # emoji column
+                if col_idx == emoji_col:
                     twemoji_img = get_twemoji_image(val, size=24)
                     img.paste(twemoji_img, (col_x[col_idx], y), twemoji_img)
                 else:
@@ -137,10 +420,15 @@ def generate_images_from_json(
                     val_to_draw = fit_text_to_column(
                         draw, str(val), TEXT_FONT, col_width
                     )
+                    cell_color = text_color
+                    if col_idx == delta_col and str(val).startswith("+"):
+                        cell_color = DELTA_UP_COLOR
+                    elif col_idx == delta_col and str(val).startswith("-"):
+                        cell_color = DELTA_DOWN_COLOR
                     draw.text(
                         (col_x[col_idx], y),
                         val_to_draw,
-                        fill=text_color,
+                        fill=cell_color,
                         font=TEXT_FONT,
                     )
 
@@ -150,11 +438,17 @@ def generate_images_from_json(
 
             y += LINE_HEIGHT
 
-        file_path = os.path.join(GENERATED_TABLES_DIR, f"leaderboard_part_{i + 1}.png")
-        img.save(file_path)
-        images.append(file_path)
+        file_path = os.path.join(
+            GENERATED_TABLES_DIR, f"{file_prefix}_part_{i + 1}.png"
+        )
+        observe_stage("render", time.perf_counter() - chunk_start)
 
-    return images
+        with timed("encode"):
+            # other processes may pick the file up by name (get_cached_images)
+            tmp_path = f"{file_path}.{os.getpid()}_{threading.get_ident()}.tmp"
+            img.save(tmp_path, format="PNG")
+            os.replace(tmp_path, file_path)
+        yield file_path
 
 
 # MARK: fit_text_to_column()
@@ -167,48 +461,175 @@ def fit_text_to_column(draw, text, font, max_width):
     return text + "..." if text else ""
 
 
+# MARK: stream_images()
+def stream_images(image_iter: Generator[str, None, None]) -> "ImageStream":
+    """
+    Start a blocking image generator in a worker thread right away and return
+    an async iterator over the finished paths. At most RENDER_QUEUE_SIZE
+    images wait for the consumer; the renderer pauses until one is taken.
+    Iterate it to the end or close it (contextlib.aclosing).
+    """
+    ready: queue.Queue = queue.Queue(maxsize=RENDER_QUEUE_SIZE)
+    stop = threading.Event()
+    done = object()
+
+    def produce():
+        try:
+            for path in image_iter:
+                ready.put(path)
+                if stop.is_set():
+                    break
+        except Exception as e:
+            ready.put(e)
+        finally:
+            image_iter.close()
+            ready.put(done)
+
+    producer = asyncio.create_task(asyncio.to_thread(produce))
+
+    async def shutdown():
+        # consumer gave up early: unblock the producer so the thread ends
+        stop.set()
+        while not producer.done():
+            try:
+                ready.get_nowait()
+            except queue.Empty:
+                await asyncio.sleep(0.01)
+
+    async def consume() -> AsyncIterator[str]:
+        try:
+            while True:
+                item = await asyncio.to_thread(ready.get)
+                if item is done:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            await shutdown()
+
+    return ImageStream(consume(), shutdown)
+
+
+class ImageStream:
+    """
+    Async iterator of stream_images(). Unlike a bare async generator, closing
+    it also stops the producer if iteration never started.
+    """
+
+    def __init__(self, items: AsyncIterator[str], shutdown):
+        self._items = items
+        self._shutdown = shutdown
+
+    def __aiter__(self) -> "ImageStream":
+        return self
+
+    async def __anext__(self) -> str:
+        return await self._items.__anext__()
+
+    async def aclose(self):
+        await self._items.aclose()
+        await self._shutdown()
+
+
 # MARK: send_table_images()
 async def send_table_images(
-    channel, status_msg, leaderboard_json, top_x, as_thread, title: str | None = None
+    channel,
+    status_msg,
+    leaderboard_json,
+    top_x,
+    as_thread,
+    title: str | None = None,
+    by_reference: bool = False,
 ):
-    await status_msg.edit(content="📊 Generating leaderboard images...")
+    """
+    With `by_reference` (and a configured storage channel), images are sent
+    as embeds pointing to one upload in the storage channel (image_store.py).
+    """
+    start = time.perf_counter()
+    store = get_image_store() if by_reference else None
+
+    async def send_image(target, path: str):
+        url = await store.url_for(path) if store and store.enabled else None
+        with timed("upload"):
+            if url:
+                await target.send(embed=discord.Embed().set_image(url=url))
+            else:
+                await target.send(file=discord.File(path))
 
-    image_paths = generate_images_from_json(leaderboard_json, top_x)
+    # Reuse a finished render of the same rows (e.g. from the pre-warm job),
+    # otherwise render in a worker thread while status edits and uploads run
+    digest = render_digest(leaderboard_json, top_x)
+    rows = leaderboard_json[:top_x] if top_x else leaderboard_json
+    image_count = len(image_chunks(len(rows)))
 
-    # Build header message
-    header = title or "**Aktuelles Leaderboard**"
-    if top_x and top_x > 0:
-        header += f"\n**(Top {top_x})**"
-    await status_msg.edit(content=header)
+    # files stay on disk until uploaded, even if evicted meanwhile
+    with images_in_use() as hold:
+        cached_paths = get_cached_images(digest, image_count, hold=hold)
+        if cached_paths is not None:
+            images = stream_images(path for path in cached_paths)
+        else:
+            images = stream_images(
+                iter_images_from_json(
+                    leaderboard_json, top_x, file_prefix=f"render_{digest}"
+                )
+            )
+        rendered_paths = []
 
-    MAX_IMAGES_BEFORE_THREAD = 1  # first N images also go in main channel
+        # closed on any error (e.g. a failed status edit), so the producer thread
+        # never blocks on a full queue
+        async with contextlib.aclosing(images):
+            await status_msg.edit(content="📊 Generating leaderboard images...")
 
-    thread: Optional[discord.Thread] = None
-    thread_created = False
+            # Build header message
+            header = title or "**Aktuelles Leaderboard**"
+            if top_x and top_x > 0:
+                header += f"\n**(Top {top_x})**"
+            await status_msg.edit(content=header)
 
-    # Only use thread if as_thread=True and more than 1 image
-    use_thread = as_thread and len(image_paths) > 1
+            MAX_IMAGES_BEFORE_THREAD = 1  # first N images also go in main channel
 
-    # Determine thread title: first line of title
-    thread_title = title.split("\n")[0] if title else "Rest der Leaderboards"
+            thread: Optional[discord.Thread] = None
+            thread_created = False
 
-    for i, path in enumerate(image_paths):
-        # Send into thread if enabled
-        if use_thread:
-            if not thread_created:
-                thread = await status_msg.create_thread(name=thread_title)
-                thread_created = True
-            if thread:
-                await thread.send(file=discord.File(path))
+            # Only use thread if as_thread=True and more than 1 image
+            use_thread = as_thread and image_count > 1
 
-        # Always send first MAX_IMAGES_BEFORE_THREAD images in main channel
-        if i < MAX_IMAGES_BEFORE_THREAD or not use_thread:
-            await channel.send(file=discord.File(path))
+            # Determine thread title: first line of title
+            thread_title = title.split("\n")[0] if title else "Rest der Leaderboards"
+
+            i = 0
+            async for path in images:
+                if cached_paths is None:
+                    hold(path)
+
+                # Send into thread if enabled
+                if use_thread:
+                    if not thread_created:
+                        thread = await status_msg.create_thread(name=thread_title)
+                        thread_created = True
+                    if thread:
+                        await send_image(thread, path)
+
+                # Always send first MAX_IMAGES_BEFORE_THREAD images in main channel
+                if i < MAX_IMAGES_BEFORE_THREAD or not use_thread:
+                    await send_image(channel, path)
+
+                if i == 0:
+                    observe_stage("first_image", time.perf_counter() - start)
+                i += 1
+                rendered_paths.append(path)
+
+        if cached_paths is None and len(rendered_paths) == image_count:
+            store_cached_images(digest, rendered_paths)
 
 
 # MARK: extract_leaderboard_meta()
 def extract_leaderboard_meta(html: str) -> Dict[str, Any]:
-    soup = BeautifulSoup(html, "html.parser")
+    # Only build the tree for the info boxes, not for the whole table
+    soup = BeautifulSoup(
+        html, "html.parser", parse_only=SoupStrainer("div", class_="col-md-4")
+    )
 
     # Results
     result: Dict[str, Optional[Any]] = {
@@ -385,25 +806,98 @@ def json_to_text_table(leaderboard_json: list[dict]) -> list[str]:
     return lines
 
 
+# MARK: fetch_leaderboard_html()
+def fetch_leaderboard_html() -> tuple[str | None, dict[str, str]]:
+    """
+    GET the scrims page, conditional on the validators of the last parsed
+    page. Returns (html, validators); html is None on 304 Not Modified.
+    """
+    headers = {}
+    if _last_page.get("etag"):
+        headers["If-None-Match"] = _last_page["etag"]
+    if _last_page.get("last_modified"):
+        headers["If-Modified-Since"] = _last_page["last_modified"]
+
+    response = requests.get(SCRIMS_URL, headers=headers, timeout=10)
+    if response.status_code == 304 and "rows" in _last_page:
+        return None, {}
+    response.raise_for_status()
+
+    validators = {}
+    if response.headers.get("ETag"):
+        validators["etag"] = response.headers["ETag"]
+    if response.headers.get("Last-Modified"):
+        validators["last_modified"] = response.headers["Last-Modified"]
+    return response.text, validators
+
+
 # MARK: get_leaderboard_json()
-def get_leaderboard_json() -> tuple[list[dict], dict[str, Any]]:
-    url = "https://hiddengems.gymnasiumsteglitz.de/scrims"
-    try:
-        response = requests.get(url, timeout=10)
-        response.raise_for_status()
-        html = response.text
-    except requests.RequestException as e:
-        return [{"error": f"Fehler beim Abrufen des Leaderboards: {e}"}], {}
+def get_leaderboard_json(html: str | None = None) -> tuple[list[dict], dict[str, Any]]:
+    """
+    Fetch (unless `html` is given) and parse the leaderboard. An unchanged
+    page (304 or same content hash) returns the last parse result; callers
+    must not modify the returned rows.
+    """
+    global _last_page
+
+    if worker_client.enabled():
+        try:
+            return worker_client.remote_leaderboard(html)
+        except OSError as e:
+            worker_client.unreachable(e)
+
+    validators: dict[str, str] = {}
+    if html is None:
+        try:
+            with timed("fetch"):
+                html, validators = fetch_leaderboard_html()
+        except requests.RequestException as e:
+            return [{"error": f"Fehler beim Abrufen des Leaderboards: {e}"}], {}
+
+    # html is None: 304, the last parse is still current
+    last_page = _last_page
+    digest = hashlib.sha1(html.encode("utf-8")).hexdigest() if html else None
+    if html is None or (digest and digest == last_page.get("digest")):
+        record_cache("leaderboard_page", True)
+        if validators:
+            _last_page = {**last_page, **validators}
+        return last_page["rows"], last_page["meta"]
+    record_cache("leaderboard_page", False)
 
     # Extract the leaderboard date
-    leaderboard_meta = extract_leaderboard_meta(html)
+    with timed("meta"):
+        leaderboard_meta = extract_leaderboard_meta(html)
 
     # Extract the leaderboard JSON
-    leaderboard_json = parse_html_to_json(html)
+    with timed("parse"):
+        leaderboard_json = parse_html_to_json(html)
+
+    # Keep every new snapshot in the history store
+    record_snapshot(leaderboard_meta, leaderboard_json)
 
+    _last_page = {
+        "digest": digest,
+        "rows": leaderboard_json,
+        "meta": leaderboard_meta,
+        **validators,
+    }
     return leaderboard_json, leaderboard_meta
 
 
+# MARK: record_snapshot()
+def record_snapshot(leaderboard_meta: dict, leaderboard_json: list[dict]):
+    """Append the snapshot to the history store, never breaking the caller."""
+    try:
+        entry = get_history_store().append(leaderboard_meta, leaderboard_json)
+        if entry:
+            logger.info(
+                f"🗄️ Snapshot vom {entry['date']} gespeichert ({entry['rows']} Zeilen).",
+                extra={"snapshot": entry["id"]},
+            )
+    except (OSError, ValueError) as e:
+        logger.warning(f"⚠️ Snapshot konnte nicht gespeichert werden: {e}")
+
+
 # MARK: send_table_texts()
 async def send_table_texts(
     channel,
@@ -488,38 +982,188 @@ def filter_json_tracked(
     return filtered
 
 
-# MARK: send_leaderboard()
-async def send_leaderboard(channel, tracked_bots, top_x, force_text, as_thread):
-    status_msg = await channel.send("*⌛Fetching leaderboards...*")
+# MARK: build_movers_json()
+def build_movers_json(
+    prev_rows: list[dict], new_rows: list[dict], count: int
+) -> list[dict]:
+    """Biggest risers and fallers, each row with its rank change as "Delta"."""
+    changes = diff_snapshots(prev_rows, new_rows)
+    moved = [c for c in changes.values() if c["rank_delta"]]
 
-    leaderboard_json, leaderboard_meta = get_leaderboard_json()
+    risers = heapq.nlargest(
+        count, (c for c in moved if c["rank_delta"] > 0), key=lambda c: c["rank_delta"]
+    )
+    fallers = heapq.nsmallest(
+        count, (c for c in moved if c["rank_delta"] < 0), key=lambda c: c["rank_delta"]
+    )
 
-    # Leaderboard
+    movers_json = []
+    for change in risers + fallers:
+        entry = dict(new_rows[change["new_pos"]])
+        entry["Delta"] = f"{change['rank_delta']:+d}"
+        movers_json.append(entry)
+    return movers_json
+
+
+# MARK: get_movers_images()
+def get_movers_images(
+    leaderboard_json: list[dict],
+    leaderboard_meta: dict,
+    count: int,
+    hold: Callable[[str], None] | None = None,
+) -> tuple[list[str], dict | None]:
+    """
+    Return (image paths, previous snapshot entry) for the movers since the
+    previous snapshot. `count` is clamped to MOVERS_MAX_COUNT and the board
+    size; the images live in the render cache, so old ones are evicted.
+    `hold` (see images_in_use()) keeps them until they are sent.
+    """
+    store = get_history_store()
+    key = snapshot_key(leaderboard_meta)
+    prev_entry = store.previous(key) if key else None
+    if prev_entry is None:
+        return [], None
+
+    count = max(min(count, MOVERS_MAX_COUNT, len(leaderboard_json)), 1)
+    digest = hashlib.sha1(f"{prev_entry['key']}|{key}".encode()).hexdigest()[:16]
+    cache_key = f"movers_{digest}_{count}"
+    with _render_cache_lock:
+        cached = get_cached_images(cache_key, hold=hold, cache_name="movers_images")
+    if cached is not None:
+        return cached, prev_entry
+
+    movers_json = build_movers_json(
+        store.get_rows(prev_entry["id"]), leaderboard_json, count
+    )
+    image_paths = []
+    if movers_json:
+        image_paths = generate_images_from_json(
+            movers_json, delta_column=True, file_prefix=cache_key
+        )
+    if hold:
+        for path in image_paths:
+            hold(path)
+    store_cached_images(cache_key, image_paths)
+    return image_paths, prev_entry
 
-    # Format the title using metadata (date, seed, stage)
-    if leaderboard_meta:
-        # Date
-        date_str = leaderboard_meta.get("date", "Unbekannten Datum")
 
-        # Stage
-        stage_str = (
-            f"{leaderboard_meta['stage']}"
-            if leaderboard_meta.get("stage") is not None
-            else ""
-        )
+# MARK: send_movers()
+async def send_movers(channel, count: int = MOVERS_DEFAULT_COUNT):
+    status_msg = await channel.send("*⌛Calculating movers...*")
+
+    leaderboard_json, leaderboard_meta = await asyncio.to_thread(get_leaderboard_json)
+    if not leaderboard_json or "error" in leaderboard_json[0]:
+        error = leaderboard_json[0]["error"] if leaderboard_json else ""
+        await status_msg.edit(content=f"❌ Leaderboard nicht verfügbar. {error}")
+        return
 
-        # Seed
-        seed_content = leaderboard_meta.get("seed", "")
-        seed_raw = seed_content.split("`")[1] if "`" in seed_content else seed_content
-        seed_str = (
-            f"{seed_content}\n-# Command:\n```ruby\nruby runner.rb --seed {seed_raw} --profile [/pfad/zu/deinem/bot]\n```"
-            if seed_content
-            else ""
+    count = max(min(count, MOVERS_MAX_COUNT, len(leaderboard_json)), 1)
+    with images_in_use() as hold:
+        image_paths, prev_entry = await asyncio.to_thread(
+            get_movers_images, leaderboard_json, leaderboard_meta, count, hold
         )
+        if prev_entry is None:
+            await status_msg.edit(
+                content="📭 Es ist noch kein vorheriges Leaderboard zum Vergleichen gespeichert."
+            )
+            return
+        if not image_paths:
+            await status_msg.edit(
+                content=f"ℹ️ Keine Rangänderungen seit {prev_entry['meta'].get('date')}."
+            )
+            return
+
+        await status_msg.edit(
+            content=f"**📊 Movers seit {prev_entry['meta'].get('date')}**"
+            f"\n-# Top {count} Aufsteiger und Absteiger"
+        )
+        for path in image_paths:
+            await channel.send(file=discord.File(path))
 
-        title = f"# Leaderboard vom {date_str}\n-# {stage_str}\n-# {seed_str}"
-    else:
-        title = "# Aktuelles Leaderboard"
+
+# MARK: filter_json_where()
+def filter_json_where(
+    leaderboard_json: list[dict], leaderboard_meta: dict, query: str
+) -> list[dict]:
+    """
+    Rows matching a "where" query. Raises ValueError (German text).
+    The columns are cached per snapshot, so `leaderboard_json` must be the
+    full board of `leaderboard_meta`; filter subsets (tracked, top x) after.
+    """
+    conditions = parse_where_query(query)
+    key = snapshot_key(leaderboard_meta)
+    columns = (
+        get_snapshot_columns(key, leaderboard_json)
+        if key
+        else LeaderboardColumns(leaderboard_json)
+    )
+    return [leaderboard_json[i] for i in columns.match_rows(conditions)]
+
+
+# MARK: leaderboard_title()
+def leaderboard_title(leaderboard_meta: dict) -> str:
+    """Header message of a leaderboard post (date, stage, seed)."""
+    if not leaderboard_meta:
+        return "# Aktuelles Leaderboard"
+
+    # Date
+    date_str = leaderboard_meta.get("date", "Unbekannten Datum")
+
+    # Stage
+    stage_str = (
+        f"{leaderboard_meta['stage']}"
+        if leaderboard_meta.get("stage") is not None
+        else ""
+    )
+
+    # Seed
+    seed_content = leaderboard_meta.get("seed", "")
+    seed_raw = seed_content.split("`")[1] if "`" in seed_content else seed_content
+    seed_str = (
+        f"{seed_content}\n-# Command:\n```ruby\nruby runner.rb --seed {seed_raw} --profile [/pfad/zu/deinem/bot]\n```"
+        if seed_content
+        else ""
+    )
+
+    return f"# Leaderboard vom {date_str}\n-# {stage_str}\n-# {seed_str}"
+
+
+# MARK: send_leaderboard()
+async def send_leaderboard(
+    channel,
+    tracked_bots,
+    top_x,
+    force_text,
+    as_thread,
+    query: str | None = None,
+    by_reference: bool = False,
+):
+    """
+    Returns the leaderboard's header message, or None if nothing was posted.
+    `by_reference`: see send_table_images().
+    """
+    status_msg = await channel.send("*⌛Fetching leaderboards...*")
+    header_msg = status_msg
+
+    leaderboard_json, leaderboard_meta = await asyncio.to_thread(get_leaderboard_json)
+
+    # Filter rows for "!lb where ..."
+    if query:
+        try:
+            leaderboard_json = filter_json_where(
+                leaderboard_json, leaderboard_meta, query
+            )
+        except ValueError as e:
+            await status_msg.edit(content=f"❌ {e}")
+            return None
+        if not leaderboard_json:
+            await status_msg.edit(content=f"📭 Keine Bots gefunden für `{query}`.")
+            return None
+
+    # Leaderboard
+    title = leaderboard_title(leaderboard_meta)
+    if query:
+        title += f"\n-# Filter: `{query}` ({len(leaderboard_json)} Bots)"
 
     if force_text:
         await send_table_texts(
@@ -538,6 +1182,7 @@ async def send_leaderboard(channel, tracked_bots, top_x, force_text, as_thread):
             top_x=top_x,
             as_thread=as_thread,
             title=title,
+            by_reference=by_reference,
         )
 
     # Tracked bots
@@ -563,49 +1208,123 @@ async def send_leaderboard(channel, tracked_bots, top_x, force_text, as_thread):
                     top_x=0,
                     as_thread=False,  # Tracked Bots nie als Thread
                     title=title,
+                    by_reference=by_reference,
                 )
 
+    return header_msg
+
+
+# MARK: channel_posted_since()
+async def channel_posted_since(bot, channel_id: int, since: float) -> bool:
+    """
+    True if the newest message in the channel is from this bot and newer than
+    `since` (UTC timestamp). False if unknown, so the post is sent again.
+    """
+    channel = bot.get_channel(int(channel_id))
+    if channel is None:
+        return False
+    try:
+        async for message in channel.history(limit=1):
+            return (
+                message.author == bot.user and message.created_at.timestamp() >= since
+            )
+    except discord.HTTPException as e:
+        logger.warning(
+            f"⚠️ Verlauf von Channel {channel_id} nicht lesbar: {e}",
+            extra={"channel": channel_id},
+        )
+    return False
+
 
 # MARK: post_lb_in_scheduled_channels()
-async def post_lb_in_scheduled_channels(bot):
-    print("🕒 Scheduler triggered! Starting automatic leaderboard posts...")
+async def post_lb_in_scheduled_channels(
+    bot,
+    channel_ids: set[int] | None = None,
+    report: Callable[[int, str], None] | None = None,
+):
+    """
+    Post to all scheduled channels, or only to `channel_ids` (one time slot).
+    `report(channel_id, state)` gets the posting journal states of a channel.
+    """
+
+    def report_state(channel_id, state: str):
+        if report is not None:
+            report(int(channel_id), state)
+
+    logger.info("🕒 Scheduler triggered! Starting automatic leaderboard posts...")
 
     data = load_bot_data()
     guilds = data.get("guild_data", {})
 
     if not guilds:
-        print("⚠️ Keine Guild-Daten gefunden.")
+        logger.warning("⚠️ Keine Guild-Daten gefunden.")
         return
 
-    # Loop through all guilds/DMs
+    async def post_channel(guild_id, g_data, channel_id):
+        channel = bot.get_channel(int(channel_id))
+
+        if channel is None:
+            logger.warning(
+                f"❌ Channel {channel_id} nicht gefunden.",
+                extra={"guild": guild_id, "channel": channel_id},
+            )
+            report_state(channel_id, CHANNEL_FAILED)
+            return
+
+        logger.info(
+            f"📤 Sending leaderboard to channel {channel_id}...",
+            extra={"guild": guild_id, "channel": channel_id},
+        )
+        report_state(channel_id, CHANNEL_SENDING)
+        try:
+            with timed("scheduled_channel", channel=channel_id):
+                await send_leaderboard(
+                    channel,
+                    tracked_bots=g_data.get("tracked_bots", []),
+                    top_x=0,
+                    force_text=False,
+                    as_thread=True,
+                    # upload once to the storage channel, if configured
+                    by_reference=True,
+                )
+                if g_data.get("post_movers"):
+                    await send_movers(channel)
+            logger.info(
+                f"✅ Successfully sent leaderboard to {channel_id}",
+                extra={"guild": guild_id, "channel": channel_id},
+            )
+            report_state(channel_id, CHANNEL_DELIVERED)
+        except Exception as e:
+            logger.exception(
+                f"❌ Failed to send leaderboard to {channel_id}: {e}",
+                extra={"guild": guild_id, "channel": channel_id},
+            )
+            report_state(channel_id, CHANNEL_FAILED)
+
+    # One low-priority job per channel, interactive commands go first
+    jobs = []
     for guild_id, g_data in guilds.items():
         scheduled_channels = g_data.get("scheduled_channels", [])
-        tracked_bots = g_data.get("tracked_bots", [])
+
+        # another process of the cluster serves this guild
+        if not owns_guild(bot, guild_id):
+            continue
 
         if not scheduled_channels:
-            print(f"⚠️ Guild {guild_id} hat keine geplanten Channels, skipping.")
+            logger.info(
+                f"⚠️ Guild {guild_id} hat keine geplanten Channels, skipping.",
+                extra={"guild": guild_id},
+            )
             continue
 
         for channel_id in scheduled_channels:
-            channel = bot.get_channel(int(channel_id))
-
-            if channel is None:
-                print(f"❌ Channel {channel_id} nicht gefunden.")
+            if channel_ids is not None and int(channel_id) not in channel_ids:
                 continue
-
-            print(
-                f"📤 Sending leaderboard to channel {channel_id}..."
-            )  # <--- log each send
-            try:
-                await send_leaderboard(
-                    channel,
-                    tracked_bots=tracked_bots,
-                    top_x=0,
-                    force_text=False,
-                    as_thread=True,
+            jobs.append(
+                job_queue.submit(
+                    PRIORITY_SCHEDULED, post_channel, guild_id, g_data, channel_id
                 )
-                print(f"✅ Successfully sent leaderboard to {channel_id}")
-            except Exception as e:
-                print(f"❌ Failed to send leaderboard to {channel_id}: {e}")
+            )
+    await asyncio.gather(*jobs)
 
-    print("🕒 Scheduler run complete.")
+    logger.info("🕒 Scheduler run complete.")
@@ -0,0 +1,197 @@
+# helper_scripts/history_charts.py
+
+# Standard library imports
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from datetime import date, timedelta
+from typing import Dict, List, Optional, Tuple
+
+# Third-party imports
+from PIL import Image, ImageDraw, ImageFont
+
+# Own modules
+from helper_scripts.helper_functions import GENERATED_TABLES_DIR, TEXT_FONT_PATH
+from helper_scripts.history_store import HistoryStore, split_bot_key
+from helper_scripts.metrics import record_cache
+
+
+HISTORY_CHARTS_DIR = GENERATED_TABLES_DIR / "history_charts"
+
+# rendered charts kept on disk, oldest files are deleted
+MAX_CACHED_CHARTS = 32
+
+os.makedirs(HISTORY_CHARTS_DIR, exist_ok=True)
+
+# (bot key, range in days) -> (window start, newest snapshot id in chart,
+# file path), least recently used first
+_chart_cache: "OrderedDict[Tuple[str, int], Tuple[Optional[str], int, str]]" = (
+    OrderedDict()
+)
+_chart_cache_lock = threading.Lock()
+
+
+# MARK: range_start()
+def range_start(store: HistoryStore, days: int) -> Optional[str]:
+    """Return the ISO start date for the last `days` days of history (0 = all)."""
+    latest = store.latest()
+    if days <= 0 or not latest:
+        return None
+    newest = date.fromisoformat(latest[-1]["date"])
+    return (newest - timedelta(days=days - 1)).isoformat()
+
+
+# MARK: get_history_chart()
+def get_history_chart(store: HistoryStore, key: str, days: int) -> Optional[str]:
+    """
+    Return the path of the rank/score chart for a bot, rendering it only when
+    a new snapshot of this bot arrived or the time window moved (a newer
+    board without this bot) since the cached version. Blocking.
+    """
+    start = range_start(store, days)
+    series = store.bot_series(key, start=start)
+    if not series["ids"]:
+        return None
+
+    newest_id = series["ids"][-1]
+    with _chart_cache_lock:
+        cached = _chart_cache.get((key, days))
+        hit = bool(
+            cached and cached[:2] == (start, newest_id) and os.path.exists(cached[2])
+        )
+        if cached and hit:
+            _chart_cache.move_to_end((key, days))
+    record_cache("history_charts", hit)
+    if cached and hit:
+        return cached[2]
+
+    digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+    file_path = os.path.join(HISTORY_CHARTS_DIR, f"history_{digest}_{days}.png")
+    render_history_chart(key, series, file_path)
+    with _chart_cache_lock:
+        _chart_cache[(key, days)] = (start, newest_id, file_path)
+        _chart_cache.move_to_end((key, days))
+        while len(_chart_cache) > MAX_CACHED_CHARTS:
+            _, (_, _, old_path) = _chart_cache.popitem(last=False)
+            try:
+                os.remove(old_path)
+            except OSError:
+                pass
+    return file_path
+
+
+# MARK: render_history_chart()
+def render_history_chart(key: str, series: Dict[str, list], file_path: str) -> str:
+    """Draw rank and score over time as one PNG with two panels."""
+
+    # ----- COLORS -----
+    BACKGROUND_COLOR = (21, 21, 20)
+    HEADER_COLOR = (255, 200, 0)
+    NORMAL_TEXT_COLOR = (231, 230, 225)
+    DNQ_TEXT_COLOR = (108, 107, 105)
+    RANK_LINE_COLOR = (88, 166, 255)
+    SCORE_LINE_COLOR = (87, 242, 135)
+
+    # ----- LAYOUT -----
+    IMG_WIDTH = 1140
+    PADDING = 10
+    TITLE_HEIGHT = 40
+    PANEL_HEIGHT = 220
+    AXIS_WIDTH = 80
+    TEXT_FONT = ImageFont.truetype(TEXT_FONT_PATH, 18)
+    SMALL_FONT = ImageFont.truetype(TEXT_FONT_PATH, 14)
+
+    name, author = split_bot_key(key)
+    img_height = TITLE_HEIGHT + 2 * (PANEL_HEIGHT + PADDING * 3) + PADDING
+    img = Image.new("RGB", (IMG_WIDTH, img_height), color=BACKGROUND_COLOR)
+    draw = ImageDraw.Draw(img)
+
+    draw.text(
+        (PADDING, PADDING),
+        f"{name} ({author})",
+        fill=HEADER_COLOR,
+        font=TEXT_FONT,
+    )
+
+    dates = series["dates"]
+    panels = [
+        ("Rang", series["rank"], RANK_LINE_COLOR, True),
+        ("Score", series["score"], SCORE_LINE_COLOR, False),
+    ]
+
+    top = TITLE_HEIGHT + PADDING
+    for label, values, line_color, inverted in panels:
+        box = (AXIS_WIDTH, top + PADDING * 2, IMG_WIDTH - PADDING, top + PANEL_HEIGHT)
+        draw.text((PADDING, top), label, fill=HEADER_COLOR, font=SMALL_FONT)
+        draw.rectangle(box, outline=DNQ_TEXT_COLOR)
+        _draw_series(
+            draw, box, values, line_color, inverted, NORMAL_TEXT_COLOR, SMALL_FONT
+        )
+        top += PANEL_HEIGHT + PADDING * 3
+
+    # x axis labels: first and last date
+    draw.text(
+        (AXIS_WIDTH, top - PADDING * 2),
+        dates[0],
+        fill=NORMAL_TEXT_COLOR,
+        font=SMALL_FONT,
+    )
+    last_label_width = draw.textlength(dates[-1], font=SMALL_FONT)
+    draw.text(
+        (IMG_WIDTH - PADDING - last_label_width, top - PADDING * 2),
+        dates[-1],
+        fill=NORMAL_TEXT_COLOR,
+        font=SMALL_FONT,
+    )
+
+    img.save(file_path)
+    return file_path
+
+
+def _draw_series(draw, box, values, line_color, inverted, text_color, font):
+    """Plot one value list into `box`; None values (DNQ) break the line."""
+    left, top, right, bottom = box
+    known = [v for v in values if v is not None]
+    if not known:
+        draw.text((left + 10, top + 10), "DNQ", fill=text_color, font=font)
+        return
+
+    low, high = min(known), max(known)
+    if low == high:
+        low, high = low - 1, high + 1
+
+    # axis labels (best value on top)
+    top_label, bottom_label = (low, high) if inverted else (high, low)
+    draw.text((10, top), _format_value(top_label), fill=text_color, font=font)
+    draw.text(
+        (10, bottom - 16), _format_value(bottom_label), fill=text_color, font=font
+    )
+
+    inner_left, inner_right = left + 10, right - 10
+    inner_top, inner_bottom = top + 10, bottom - 10
+    step = (inner_right - inner_left) / max(len(values) - 1, 1)
+
+    points: List[Optional[Tuple[float, float]]] = []
+    for i, value in enumerate(values):
+        if value is None:
+            points.append(None)
+            continue
+        ratio = (value - low) / (high - low)
+        if not inverted:
+            ratio = 1 - ratio
+        points.append(
+            (inner_left + i * step, inner_top + ratio * (inner_bottom - inner_top))
+        )
+
+    for a, b in zip(points, points[1:]):
+        if a and b:
+            draw.line([a, b], fill=line_color, width=2)
+    for point in points:
+        if point:
+            x, y = point
+            draw.ellipse([x - 3, y - 3, x + 3, y + 3], fill=line_color)
+
+
+def _format_value(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else f"{value:.1f}"
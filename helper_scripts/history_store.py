@@ -0,0 +1,520 @@
+# helper_scripts/history_store.py
+
+# Standard library imports
+import logging
+import bisect
+import json
+import os
+import re
+import struct
+import threading
+import zlib
+from datetime import date
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+# Third-party imports
+# None
+
+# Own modules
+from helper_scripts.file_lock import file_lock
+from helper_scripts.globals import LOCAL_DATA_PATH_DIR
+
+
+#       |==========================|
+#       |     HISTORY_STORE.PY     |
+#       |==========================|
+
+# Append-only store of every parsed leaderboard snapshot.
+#
+# snapshots.bin: sequence of records, each `RECORD_HEADER` + zlib(JSON payload).
+#   - base record:  full snapshot in columnar form (keys + one list per column)
+#   - delta record: row order relative to the previous snapshot plus the
+#                   changed cells / added rows only
+# index.json:    snapshot list (key, date, offset, ...) and per-bot series
+#                (snapshot ids, rank and score arrays) for history queries.
+#
+# A new base is written every BASE_INTERVAL snapshots, so reconstructing any
+# day decodes at most BASE_INTERVAL records.
+
+
+HISTORY_DIR = LOCAL_DATA_PATH_DIR / "history"
+SNAPSHOTS_FILE_NAME = "snapshots.bin"
+INDEX_FILE_NAME = "index.json"
+
+# 2: per-bot series with rank/score arrays (1: snapshot id lists only)
+INDEX_VERSION = 2
+BASE_INTERVAL = 7
+RECORD_HEADER = struct.Struct(">BI")  # record kind, payload length
+KIND_BASE = 0
+KIND_DELTA = 1
+
+KEY_SEPARATOR = "\x1f"
+
+logger = logging.getLogger(__name__)
+
+
+# MARK: snapshot_key()
+def snapshot_key(leaderboard_meta: Dict[str, Any]) -> Optional[str]:
+    """Return the unique key (Datum/Stage/Seed) of a leaderboard snapshot."""
+    if not leaderboard_meta or not leaderboard_meta.get("date"):
+        return None
+    return KEY_SEPARATOR.join(
+        str(leaderboard_meta.get(field) or "") for field in ("date", "stage", "seed")
+    )
+
+
+# MARK: parse_snapshot_date()
+def parse_snapshot_date(date_str: Optional[str]) -> str:
+    """Convert the "Datum" value of the scrims page into an ISO date string."""
+    if date_str:
+        match = re.search(r"(\d{4})-(\d{1,2})-(\d{1,2})", date_str)
+        if match:
+            year, month, day = match.groups()
+            return date(int(year), int(month), int(day)).isoformat()
+
+        match = re.search(r"(\d{1,2})\.(\d{1,2})\.(\d{4})", date_str)
+        if match:
+            day, month, year = match.groups()
+            return date(int(year), int(month), int(day)).isoformat()
+
+    # fallback: unknown format, use the day the snapshot was recorded
+    return date.today().isoformat()
+
+
+# MARK: bot_key()
+def bot_key(name: str, author: str) -> str:
+    """Return the key identifying one bot (name + author) across snapshots."""
+    return f"{name}{KEY_SEPARATOR}{author}"
+
+
+def split_bot_key(key: str) -> Tuple[str, str]:
+    """Inverse of bot_key(), ignores the duplicate suffix of row keys."""
+    parts = key.split(KEY_SEPARATOR)
+    return parts[0], parts[1] if len(parts) > 1 else ""
+
+
+# MARK: row_keys()
+def row_keys(leaderboard_json: List[dict]) -> List[str]:
+    """Return a unique key per row; repeated name/author pairs get a suffix."""
+    keys = []
+    seen: Dict[str, int] = {}
+    for entry in leaderboard_json:
+        key = bot_key(entry.get("Bot", ""), entry.get("Autor / Team", ""))
+        count = seen.get(key, 0)
+        seen[key] = count + 1
+        keys.append(key if count == 0 else f"{key}{KEY_SEPARATOR}#{count + 1}")
+    return keys
+
+
+# MARK: parse_rank()
+def parse_rank(rank_str: Optional[str]) -> Optional[int]:
+    """Return the numeric rank of a "Rang" cell ("12." -> 12), None for DNQ."""
+    match = re.match(r"\s*(\d+)", rank_str or "")
+    return int(match.group(1)) if match else None
+
+
+# MARK: parse_score()
+def parse_score(score_str: Optional[str]) -> Optional[float]:
+    """Return the numeric value of a "Score" cell, None if not a number."""
+    try:
+        return float(str(score_str).strip().replace(",", "."))
+    except ValueError:
+        return None
+
+
+# MARK: Encoding
+def _columns_of(leaderboard_json: List[dict]) -> List[str]:
+    columns: List[str] = []
+    seen = set()
+    for entry in leaderboard_json:
+        for column in entry:
+            if column not in seen:
+                seen.add(column)
+                columns.append(column)
+    return columns
+
+
+def _to_columnar(leaderboard_json: List[dict]) -> Tuple[List[str], Dict[str, list]]:
+    columns = _columns_of(leaderboard_json)
+    values = {
+        column: [entry.get(column, "") for entry in leaderboard_json]
+        for column in columns
+    }
+    return columns, values
+
+
+def _from_columnar(columns: List[str], values: Dict[str, list]) -> List[dict]:
+    if not columns:
+        return []
+    row_count = len(values[columns[0]])
+    return [{column: values[column][i] for column in columns} for i in range(row_count)]
+
+
+def _encode_base(keys: List[str], leaderboard_json: List[dict]) -> dict:
+    columns, values = _to_columnar(leaderboard_json)
+    return {"keys": keys, "columns": columns, "values": values}
+
+
+def _encode_delta(
+    prev_keys: List[str],
+    prev_rows: List[dict],
+    keys: List[str],
+    leaderboard_json: List[dict],
+) -> dict:
+    """Encode the new snapshot as row order + changed cells vs. the previous one."""
+    prev_pos = {key: i for i, key in enumerate(prev_keys)}
+    columns = _columns_of(leaderboard_json)
+
+    order: List[Any] = []  # int = index in previous snapshot, list = added row
+    changed: Dict[str, Dict[str, Any]] = {}
+
+    for pos, (key, entry) in enumerate(zip(keys, leaderboard_json)):
+        old_pos = prev_pos.get(key)
+        if old_pos is None:
+            order.append([key, [entry.get(column, "") for column in columns]])
+            continue
+
+        order.append(old_pos)
+        old_entry = prev_rows[old_pos]
+        diff = {
+            column: entry.get(column, "")
+            for column in columns
+            if old_entry.get(column, "") != entry.get(column, "")
+        }
+        if diff:
+            changed[str(pos)] = diff
+
+    return {"columns": columns, "order": order, "changed": changed}
+
+
+def _apply_delta(
+    prev_keys: List[str], prev_rows: List[dict], payload: dict
+) -> Tuple[List[str], List[dict]]:
+    columns = payload["columns"]
+    changed = payload["changed"]
+    keys: List[str] = []
+    rows: List[dict] = []
+
+    for pos, ref in enumerate(payload["order"]):
+        if isinstance(ref, int):
+            keys.append(prev_keys[ref])
+            old_entry = prev_rows[ref]
+            entry = {column: old_entry.get(column, "") for column in columns}
+            entry.update(changed.get(str(pos), {}))
+        else:
+            key, row_values = ref
+            keys.append(key)
+            entry = dict(zip(columns, row_values))
+        rows.append(entry)
+
+    return keys, rows
+
+
+# MARK: HistoryStore
+class HistoryStore:
+    """Append-only, delta-encoded store of leaderboard snapshots."""
+
+    def __init__(self, directory: Path = HISTORY_DIR):
+        self.directory = Path(directory)
+        self.snapshots_file = self.directory / SNAPSHOTS_FILE_NAME
+        self.index_file = self.directory / INDEX_FILE_NAME
+        self._lock = threading.RLock()
+        # mtime of the loaded index.json, to notice appends by other processes
+        self._index_stamp: Optional[int] = None
+
+        # last decoded snapshot, so appending a delta needs no reconstruction
+        self._decoded: Optional[Tuple[int, List[str], List[dict]]] = None
+
+        os.makedirs(self.directory, exist_ok=True)
+        self._load_index()
+        if self._migrated:
+            # persist once, under the lock so no append of another process is lost
+            with self._lock, file_lock(self.index_file):
+                self._load_index()
+                if self._migrated:
+                    self._save_index()
+
+    # ----- INDEX -----
+    def _load_index(self):
+        self._index_stamp = self._stat_index()
+        self.index: Dict[str, Any] = {
+            "version": INDEX_VERSION,
+            "snapshots": [],
+            "bots": {},
+        }
+        if self.index_file.exists():
+            try:
+                with open(self.index_file, "r", encoding="utf-8") as f:
+                    self.index = json.load(f)
+            except (json.JSONDecodeError, ValueError):
+                logger.warning(
+                    f"⚠️ Warning: {self.index_file} is corrupted, starting fresh history."
+                )
+
+        self._migrated = False
+        if self.index.get("version") != INDEX_VERSION:
+            self._rebuild_bots()
+
+        self._by_key = {entry["key"]: entry["id"] for entry in self.index["snapshots"]}
+        self._by_date = sorted(
+            (entry["date"], entry["id"]) for entry in self.index["snapshots"]
+        )
+
+    def _rebuild_bots(self):
+        """Recompute the per-bot series of an index of another version."""
+        logger.info(
+            f"🔄 History-Index Version {self.index.get('version')} -> "
+            f"{INDEX_VERSION}, baue Bot-Verläufe neu auf..."
+        )
+        bots: Dict[str, Dict[str, list]] = {}
+        for entry, rows in self.iter_rows(self.index["snapshots"]):
+            for row_key, row in zip(row_keys(rows), rows):
+                series = bots.setdefault(row_key, {"ids": [], "rank": [], "score": []})
+                series["ids"].append(entry["id"])
+                series["rank"].append(parse_rank(row.get("Rang")))
+                series["score"].append(parse_score(row.get("Score")))
+        self.index["bots"] = bots
+        self.index["version"] = INDEX_VERSION
+        self._migrated = True
+
+    def _save_index(self):
+        tmp_path = self.index_file.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.index, f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp_path, self.index_file)
+        self._index_stamp = self._stat_index()
+
+    def _stat_index(self) -> Optional[int]:
+        try:
+            return os.stat(self.index_file).st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    def refresh(self):
+        """Reload the index if another process of the cluster appended."""
+        with self._lock:
+            if self._stat_index() != self._index_stamp:
+                self._load_index()
+
+    # ----- RECORDS -----
+    def _write_record(self, kind: int, payload: dict) -> Tuple[int, int]:
+        data = zlib.compress(
+            json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode(
+                "utf-8"
+            ),
+            9,
+        )
+        with open(self.snapshots_file, "ab") as f:
+            offset = f.tell()
+            f.write(RECORD_HEADER.pack(kind, len(data)))
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        return offset, RECORD_HEADER.size + len(data)
+
+    def _read_record(self, entry: dict) -> Tuple[int, dict]:
+        with open(self.snapshots_file, "rb") as f:
+            f.seek(entry["offset"])
+            raw = f.read(entry["length"])
+        kind, length = RECORD_HEADER.unpack_from(raw)
+        payload = json.loads(zlib.decompress(raw[RECORD_HEADER.size :][:length]))
+        return kind, payload
+
+    # ----- PUBLIC API -----
+    def __len__(self) -> int:
+        return len(self.index["snapshots"])
+
+    def has(self, key: str) -> bool:
+        return key in self._by_key
+
+    def entry(self, snapshot_id: int) -> dict:
+        return self.index["snapshots"][snapshot_id]
+
+    def entry_by_key(self, key: str) -> Optional[dict]:
+        snapshot_id = self._by_key.get(key)
+        return None if snapshot_id is None else self.entry(snapshot_id)
+
+    def latest(self, count: int = 1) -> List[dict]:
+        """Return the index entries of the newest `count` snapshots (newest last)."""
+        return self.index["snapshots"][-count:] if count > 0 else []
+
+    def previous(self, key: str) -> Optional[dict]:
+        """Return the index entry of the snapshot recorded before `key`."""
+        snapshot_id = self._by_key.get(key)
+        if snapshot_id is None or snapshot_id == 0:
+            return None
+        return self.entry(snapshot_id - 1)
+
+    def append(self, leaderboard_meta: Dict[str, Any], leaderboard_json: List[dict]):
+        """Append a snapshot. Returns its index entry, or None if already stored."""
+        key = snapshot_key(leaderboard_meta)
+        if key is None or not leaderboard_json or "error" in leaderboard_json[0]:
+            return None
+
+        # other cluster processes append to the same files
+        with self._lock, file_lock(self.index_file):
+            self.refresh()
+            if key in self._by_key:
+                return None
+
+            snapshot_id = len(self.index["snapshots"])
+            keys = row_keys(leaderboard_json)
+
+            if snapshot_id % BASE_INTERVAL == 0:
+                kind = KIND_BASE
+                payload = _encode_base(keys, leaderboard_json)
+                base_id = snapshot_id
+            else:
+                prev_keys, prev_rows = self._decode(snapshot_id - 1)
+                kind = KIND_DELTA
+                payload = _encode_delta(prev_keys, prev_rows, keys, leaderboard_json)
+                base_id = self.entry(snapshot_id - 1)["base"]
+
+            offset, length = self._write_record(kind, payload)
+
+            entry = {
+                "id": snapshot_id,
+                "key": key,
+                "date": parse_snapshot_date(leaderboard_meta.get("date")),
+                "meta": leaderboard_meta,
+                "kind": kind,
+                "base": base_id,
+                "offset": offset,
+                "length": length,
+                "rows": len(leaderboard_json),
+            }
+            self.index["snapshots"].append(entry)
+
+            bots = self.index["bots"]
+            for row_key, row in zip(keys, leaderboard_json):
+                series = bots.setdefault(row_key, {"ids": [], "rank": [], "score": []})
+                series["ids"].append(snapshot_id)
+                series["rank"].append(parse_rank(row.get("Rang")))
+                series["score"].append(parse_score(row.get("Score")))
+
+            self._save_index()
+
+            self._by_key[key] = snapshot_id
+            bisect.insort(self._by_date, (entry["date"], snapshot_id))
+            self._decoded = (snapshot_id, keys, [dict(e) for e in leaderboard_json])
+
+            return entry
+
+    def _decode(self, snapshot_id: int) -> Tuple[List[str], List[dict]]:
+        with self._lock:
+            if self._decoded and self._decoded[0] == snapshot_id:
+                return self._decoded[1], self._decoded[2]
+
+            entry = self.entry(snapshot_id)
+            keys: List[str] = []
+            rows: List[dict] = []
+            for current_id in range(entry["base"], snapshot_id + 1):
+                kind, payload = self._read_record(self.entry(current_id))
+                if kind == KIND_BASE:
+                    keys = payload["keys"]
+                    rows = _from_columnar(payload["columns"], payload["values"])
+                else:
+                    keys, rows = _apply_delta(keys, rows, payload)
+
+            self._decoded = (snapshot_id, keys, rows)
+            return keys, rows
+
+    def get_rows(self, snapshot_id: int) -> List[dict]:
+        """Reconstruct the full leaderboard JSON of a stored snapshot."""
+        _, rows = self._decode(snapshot_id)
+        return [dict(entry) for entry in rows]
+
+    def iter_rows(self, entries: List[dict]) -> Iterator[Tuple[dict, List[dict]]]:
+        """
+        Yield (entry, rows) for each index entry, one snapshot at a time.
+        Consecutive snapshots continue from the previous one instead of
+        decoding again from their base record.
+        """
+        last_id: Optional[int] = None
+        keys: List[str] = []
+        rows: List[dict] = []
+        for entry in entries:
+            snapshot_id = entry["id"]
+            if last_id is None or not entry["base"] <= last_id < snapshot_id:
+                last_id = entry["base"] - 1
+            for current_id in range(last_id + 1, snapshot_id + 1):
+                kind, payload = self._read_record(self.entry(current_id))
+                if kind == KIND_BASE:
+                    keys = payload["keys"]
+                    rows = _from_columnar(payload["columns"], payload["values"])
+                else:
+                    keys, rows = _apply_delta(keys, rows, payload)
+            last_id = snapshot_id
+            yield entry, rows
+
+    def get_rows_by_key(self, key: str) -> Optional[List[dict]]:
+        snapshot_id = self._by_key.get(key)
+        return None if snapshot_id is None else self.get_rows(snapshot_id)
+
+    def range_by_date(
+        self, start: Optional[str] = None, end: Optional[str] = None
+    ) -> List[dict]:
+        """Return index entries with start <= date <= end (ISO strings, inclusive)."""
+        lo = 0 if start is None else bisect.bisect_left(self._by_date, (start, -1))
+        hi = (
+            len(self._by_date)
+            if end is None
+            else bisect.bisect_right(self._by_date, (end, float("inf")))
+        )
+        return [self.entry(snapshot_id) for _, snapshot_id in self._by_date[lo:hi]]
+
+    def snapshots_for_bot(
+        self, key: str, start: Optional[str] = None, end: Optional[str] = None
+    ) -> List[dict]:
+        """Return index entries of all snapshots that contain the given bot."""
+        series = self.index["bots"].get(key)
+        entries = [self.entry(i) for i in series["ids"]] if series else []
+        return [
+            e
+            for e in entries
+            if (start is None or e["date"] >= start)
+            and (end is None or e["date"] <= end)
+        ]
+
+    def bot_series(
+        self, key: str, start: Optional[str] = None, end: Optional[str] = None
+    ) -> Dict[str, list]:
+        """Return the precomputed dates/ranks/scores of one bot (oldest first)."""
+        result: Dict[str, list] = {"ids": [], "dates": [], "rank": [], "score": []}
+        series = self.index["bots"].get(key)
+        if not series:
+            return result
+
+        for snapshot_id, rank, score in zip(
+            series["ids"], series["rank"], series["score"]
+        ):
+            day = self.entry(snapshot_id)["date"]
+            if (start is not None and day < start) or (end is not None and day > end):
+                continue
+            result["ids"].append(snapshot_id)
+            result["dates"].append(day)
+            result["rank"].append(rank)
+            result["score"].append(score)
+        return result
+
+    def find_bots(self, name: str) -> List[str]:
+        """Return all bot keys whose name matches (case-insensitive)."""
+        name = name.lower()
+        return [
+            key for key in self.index["bots"] if split_bot_key(key)[0].lower() == name
+        ]
+
+
+_history_store: Optional[HistoryStore] = None
+
+
+# MARK: get_history_store()
+def get_history_store() -> HistoryStore:
+    """Return the shared history store (created on first use)."""
+    global _history_store
+    if _history_store is None:
+        _history_store = HistoryStore()
+    else:
+        _history_store.refresh()
+    return _history_store
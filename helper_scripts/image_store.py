@@ -0,0 +1,102 @@
+# helper_scripts/image_store.py
+
+# Standard library imports
+import asyncio
+import logging
+import os
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+# Third-party imports
+import discord
+
+# Own modules
+from helper_scripts.metrics import record_cache, timed
+
+
+#       |==========================|
+#       |      IMAGE_STORE.PY      |
+#       |==========================|
+
+# Upload-once mode for the scheduled fan-out: every rendered image is sent a
+# single time to a storage channel, and the scheduled channels get an embed
+# that points to that attachment (Embed.set_image). A run then uploads each
+# image once instead of once per channel.
+#
+# Rendered files are named after a hash of their rows, so the path is a safe
+# key. Discord attachment URLs are signed and expire after about a day; a
+# URL is reused for at most URL_TTL_SECONDS and then uploaded again.
+
+
+URL_TTL_SECONDS = 6 * 3600
+MAX_CACHED_URLS = 256
+
+logger = logging.getLogger(__name__)
+
+
+# MARK: ImageStore
+class ImageStore:
+    def __init__(self):
+        self.bot = None
+        self.channel_id = 0
+        # (path, file mtime) -> (uploaded at, attachment URL), oldest first
+        self.urls: "OrderedDict[Tuple[str, float], Tuple[float, str]]" = OrderedDict()
+        self._uploads: Dict[Tuple[str, float], asyncio.Future] = {}
+
+    # MARK: > configure
+    def configure(self, bot, channel_id: int):
+        """Use `channel_id` as storage channel, 0 = upload-once mode off."""
+        self.bot = bot
+        self.channel_id = channel_id
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.bot and self.channel_id)
+
+    # MARK: > url_for
+    async def url_for(self, path: str) -> Optional[str]:
+        """Attachment URL of this image, uploading it once. None on failure."""
+        key = (path, os.path.getmtime(path))
+        cached = self.urls.get(key)
+        hit = cached is not None and time.time() - cached[0] < URL_TTL_SECONDS
+        record_cache("image_urls", hit)
+        if hit:
+            self.urls.move_to_end(key)
+            return cached[1]
+
+        # channels posting at the same time wait for the same upload
+        if key not in self._uploads:
+            self._uploads[key] = asyncio.ensure_future(self._upload(key))
+        try:
+            return await asyncio.shield(self._uploads[key])
+        finally:
+            if self._uploads.get(key) is not None and self._uploads[key].done():
+                del self._uploads[key]
+
+    async def _upload(self, key: Tuple[str, float]) -> Optional[str]:
+        # in cluster mode the storage channel's guild is usually served by
+        # another process; sending only needs the id, not the cached channel
+        channel = self.bot.get_channel(self.channel_id)
+        if channel is None:
+            channel = self.bot.get_partial_messageable(self.channel_id)
+        try:
+            with timed("storage_upload"):
+                message = await channel.send(file=discord.File(key[0]))
+        except discord.HTTPException as e:
+            logger.warning(f"⚠️ Upload in den Bilder-Channel fehlgeschlagen: {e}")
+            return None
+
+        url = message.attachments[0].url
+        self.urls[key] = (time.time(), url)
+        while len(self.urls) > MAX_CACHED_URLS:
+            self.urls.popitem(last=False)
+        return url
+
+
+_image_store = ImageStore()
+
+
+# MARK: get_image_store()
+def get_image_store() -> ImageStore:
+    return _image_store
@@ -0,0 +1,157 @@
+# helper_scripts/job_queue.py
+
+# Standard library imports
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+# Third-party imports
+# None
+
+# Own modules
+from helper_scripts.metrics import observe_stage, registry
+
+
+#       |==========================|
+#       |       JOB_QUEUE.PY       |
+#       |==========================|
+
+# Central queue for everything that fetches, renders and uploads leaderboards.
+# Jobs run in priority order on a bounded number of workers, and every
+# priority has its own concurrency limit: scheduled posts never take more
+# than their share, so a `!top` during the morning fan-out starts right away
+# instead of waiting behind dozens of channels.
+#
+#   await job_queue.submit(PRIORITY_INTERACTIVE, send_leaderboard, channel=...)
+
+
+PRIORITY_INTERACTIVE = 0
+PRIORITY_SCHEDULED = 1
+
+PRIORITY_NAMES = {
+    PRIORITY_INTERACTIVE: "interactive",
+    PRIORITY_SCHEDULED: "scheduled",
+}
+
+DEFAULT_WORKERS = 3
+DEFAULT_SCHEDULED_WORKERS = 1
+
+logger = logging.getLogger(__name__)
+
+
+# MARK: JobQueue
+class JobQueue:
+    """
+    Priority queue of coroutine functions. At most `max_workers` jobs run at
+    once, and at most `limits[priority]` of one priority (default: all).
+    Lower numbers run first, equal priorities in submission order.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_WORKERS,
+        limits: Optional[Dict[int, int]] = None,
+    ):
+        self.max_workers = max_workers
+        self.limits: Dict[int, int] = limits or {}
+        # (priority, sequence, enqueued at, func, args, kwargs, future)
+        self.heap: List[tuple] = []
+        self.running: Dict[int, int] = {p: 0 for p in PRIORITY_NAMES}
+        self._seq = itertools.count()
+        self._tasks: set = set()
+
+    # MARK: > configure
+    def configure(self, max_workers: int, limits: Optional[Dict[int, int]] = None):
+        self.max_workers = max(max_workers, 1)
+        self.limits = limits or {}
+
+    # MARK: > submit
+    async def submit(
+        self, priority: int, func: Callable[..., Awaitable[Any]], *args, **kwargs
+    ) -> Any:
+        """Queue `func(*args, **kwargs)` and return its result once it ran."""
+        future = asyncio.get_running_loop().create_future()
+        entry = (
+            priority,
+            next(self._seq),
+            time.perf_counter(),
+            func,
+            args,
+            kwargs,
+            future,
+        )
+        heapq.heappush(self.heap, entry)
+        self._dispatch()
+        return await future
+
+    def depth(self, priority: int) -> int:
+        return sum(1 for entry in self.heap if entry[0] == priority)
+
+    def _dispatch(self):
+        """Start queued jobs while workers (and their priority's limit) allow."""
+        deferred = []
+        while self.heap and sum(self.running.values()) < self.max_workers:
+            entry = heapq.heappop(self.heap)
+            priority, _, enqueued, func, args, kwargs, future = entry
+            if future.done():  # caller gave up while queued
+                continue
+            if self.running.get(priority, 0) >= self.limits.get(
+                priority, self.max_workers
+            ):
+                deferred.append(entry)
+                continue
+
+            self.running[priority] = self.running.get(priority, 0) + 1
+            observe_stage(
+                "queue_wait",
+                time.perf_counter() - enqueued,
+                priority=PRIORITY_NAMES.get(priority, priority),
+            )
+            task = asyncio.create_task(self._work(priority, func, args, kwargs, future))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+            # caller cancelled (e.g. command timeout): stop the job as well
+            future.add_done_callback(
+                lambda f, task=task: task.cancel() if f.cancelled() else None
+            )
+
+        for entry in deferred:
+            heapq.heappush(self.heap, entry)
+        self._update_gauges()
+
+    async def _work(self, priority: int, func, args, kwargs, future):
+        try:
+            result = await func(*args, **kwargs)
+            if not future.done():
+                future.set_result(result)
+        except asyncio.CancelledError:
+            future.cancel()
+        except Exception as e:
+            if not future.done():
+                future.set_exception(e)
+        finally:
+            self.running[priority] -= 1
+            self._dispatch()
+
+    def _update_gauges(self):
+        for priority, name in PRIORITY_NAMES.items():
+            registry.set_gauge(
+                "job_queue_depth",
+                self.depth(priority),
+                help_text="Jobs waiting in the job queue",
+                priority=name,
+            )
+            registry.set_gauge(
+                "job_queue_running",
+                self.running.get(priority, 0),
+                help_text="Jobs currently running",
+                priority=name,
+            )
+
+
+job_queue = JobQueue(
+    DEFAULT_WORKERS, limits={PRIORITY_SCHEDULED: DEFAULT_SCHEDULED_WORKERS}
+)
@@ -0,0 +1,211 @@
+# helper_scripts/leaderboard_columns.py
+
+# Standard library imports
+import math
+import re
+from array import array
+from collections import OrderedDict
+from typing import Dict, List, Optional, Set, Tuple
+
+# Third-party imports
+# None
+
+# Own modules
+from helper_scripts.history_store import parse_score
+from helper_scripts.metrics import record_cache
+
+
+#       |==========================|
+#       |  LEADERBOARD_COLUMNS.PY  |
+#       |==========================|
+
+# Columnar view of one leaderboard snapshot. Text columns are dictionary
+# encoded (distinct values + one int code per row), numbers live in flat
+# `array` buffers. Aggregations run as a single pass over these buffers
+# instead of looking up keys in every row dict. Filters use inverted indexes
+# (value -> row ids) built once per snapshot from the dictionary columns.
+
+
+MAX_CACHED_SNAPSHOTS = 16
+
+# query field -> column attribute
+QUERY_FIELDS = {
+    "lang": "language",
+    "sprache": "language",
+    "ort": "ort",
+    "author": "author",
+    "autor": "author",
+    "team": "author",
+    "bot": "bot",
+}
+
+
+# MARK: DictColumn
+class DictColumn:
+    """Dictionary-encoded text column."""
+
+    def __init__(self, raw_values: List[str]):
+        self.values: List[str] = []
+        self.codes = array("I")
+        lookup: Dict[str, int] = {}
+        for value in raw_values:
+            code = lookup.get(value)
+            if code is None:
+                code = lookup[value] = len(self.values)
+                self.values.append(value)
+            self.codes.append(code)
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+
+# MARK: normalize_language()
+def normalize_language(lang_str: Optional[str]) -> str:
+    """Same normalization as get_lang_icon(): lowercase, empty -> noLanguage."""
+    lang_key = (lang_str or "").strip().lower()
+    return lang_key or "noLanguage"
+
+
+# MARK: LeaderboardColumns
+class LeaderboardColumns:
+    """Columnar representation of a leaderboard JSON list."""
+
+    def __init__(self, leaderboard_json: List[dict]):
+        self.row_count = len(leaderboard_json)
+        self.language = DictColumn(
+            [normalize_language(e.get("Sprache")) for e in leaderboard_json]
+        )
+        self.ort = DictColumn([e.get("Ort", "").strip() for e in leaderboard_json])
+        self.author = DictColumn(
+            [e.get("Autor / Team", "").strip() for e in leaderboard_json]
+        )
+        self.bot = DictColumn([e.get("Bot", "").strip() for e in leaderboard_json])
+        self._postings: Dict[str, Dict[str, array]] = {}
+
+        self.score = array("d")
+        self.dnq = bytearray()
+        for entry in leaderboard_json:
+            score = parse_score(entry.get("Score"))
+            self.score.append(math.nan if score is None else score)
+            self.dnq.append(1 if entry.get("Rang") == "DNQ." else 0)
+
+    # MARK: > aggregate()
+    def aggregate(self, group: DictColumn) -> Dict[str, dict]:
+        """
+        Group by a dictionary column in one pass. Returns raw, mergeable sums
+        per group value: count, score_sum, score_count, best, dnq.
+        """
+        size = len(group.values)
+        counts = [0] * size
+        score_sums = [0.0] * size
+        score_counts = [0] * size
+        bests = [-math.inf] * size
+        dnqs = [0] * size
+
+        for code, score, dnq in zip(group.codes, self.score, self.dnq):
+            counts[code] += 1
+            dnqs[code] += dnq
+            if score == score:  # not NaN
+                score_sums[code] += score
+                score_counts[code] += 1
+                if score > bests[code]:
+                    bests[code] = score
+
+        return {
+            value: {
+                "count": counts[code],
+                "score_sum": score_sums[code],
+                "score_count": score_counts[code],
+                "best": bests[code],
+                "dnq": dnqs[code],
+            }
+            for code, value in enumerate(group.values)
+        }
+
+    # MARK: > postings()
+    def postings(self, name: str) -> Dict[str, array]:
+        """Inverted index of a text column: lowercased value -> row ids."""
+        index = self._postings.get(name)
+        if index is None:
+            column: DictColumn = getattr(self, name)
+            rows_by_code = [array("I") for _ in column.values]
+            for row, code in enumerate(column.codes):
+                rows_by_code[code].append(row)
+
+            index = {}
+            for value, rows in zip(column.values, rows_by_code):
+                index.setdefault(value.lower(), array("I")).extend(rows)
+            self._postings[name] = index
+        return index
+
+    # MARK: > match_rows()
+    def match_rows(self, conditions: List[Tuple[str, str, str]]) -> List[int]:
+        """
+        Row ids matching all (field, op, value) conditions, in leaderboard order.
+        `=` compares case-insensitively, `=~` is a substring match. Both only
+        look at the distinct values of the index, never at the rows.
+        """
+        result: Optional[Set[int]] = None
+        for field, op, value in conditions:
+            index = self.postings(QUERY_FIELDS[field])
+            needle = value.strip().lower()
+
+            rows: Set[int] = set()
+            if op == "=":
+                rows.update(index.get(needle, ()))
+            else:
+                for indexed_value, value_rows in index.items():
+                    if needle in indexed_value:
+                        rows.update(value_rows)
+
+            result = rows if result is None else result & rows
+            if not result:
+                return []
+
+        return sorted(result or ())
+
+
+# MARK: parse_where_query()
+def parse_where_query(query: str) -> List[Tuple[str, str, str]]:
+    """
+    Parse "lang=python ort=Bad Homburg author=~foo" into conditions.
+    Words without a `field=` prefix belong to the previous value.
+    Raises ValueError on invalid input.
+    """
+    conditions: List[List[str]] = []
+    for token in query.split():
+        match = re.fullmatch(r"(\w+)(=~|=)(.*)", token)
+        if match and match.group(1).lower() in QUERY_FIELDS:
+            conditions.append([match.group(1).lower(), match.group(2), match.group(3)])
+        elif conditions:
+            conditions[-1][2] += f" {token}"
+        else:
+            raise ValueError(f"Ungültiger Filter `{token}`")
+
+    if not conditions:
+        raise ValueError("Kein Filter angegeben")
+    return [(field, op, value) for field, op, value in conditions]
+
+
+_columns_cache: "OrderedDict[str, LeaderboardColumns]" = OrderedDict()
+
+
+# MARK: get_snapshot_columns()
+def get_snapshot_columns(key: str, leaderboard_json: List[dict]) -> LeaderboardColumns:
+    """
+    Return the (cached) columnar view of the snapshot with the given key.
+    `leaderboard_json` must be the full snapshot; a list of another length
+    (a filtered subset) gets a fresh, uncached view instead of wrong indexes.
+    """
+    columns = _columns_cache.get(key)
+    if columns is not None and columns.row_count != len(leaderboard_json):
+        return LeaderboardColumns(leaderboard_json)
+    record_cache("snapshot_columns", columns is not None)
+    if columns is None:
+        columns = LeaderboardColumns(leaderboard_json)
+        _columns_cache[key] = columns
+        if len(_columns_cache) > MAX_CACHED_SNAPSHOTS:
+            _columns_cache.popitem(last=False)
+    else:
+        _columns_cache.move_to_end(key)
+    return columns
@@ -0,0 +1,193 @@
+# helper_scripts/leaderboard_export.py
+
+# Standard library imports
+import csv
+import io
+import json
+import logging
+import os
+import re
+import tempfile
+import zlib
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+# Third-party imports
+# None
+
+# Own modules
+from helper_scripts.globals import LOCAL_DATA_PATH_DIR
+from helper_scripts.helper_functions import get_leaderboard_json
+from helper_scripts.history_charts import range_start
+from helper_scripts.history_store import (
+    KEY_SEPARATOR,
+    HistoryStore,
+    parse_snapshot_date,
+)
+from helper_scripts.metrics import timed
+
+
+#       |==========================|
+#       |  LEADERBOARD_EXPORT.PY   |
+#       |==========================|
+
+# Exports of the current leaderboard or a date range of the history store
+# for !export. Every stage is a generator: snapshots are decoded one at a
+# time (HistoryStore.iter_rows), formatted into text chunks and gzipped on
+# the fly into a temp file, so a long range is never held in memory at once.
+#
+#   csv       one row per bot and snapshot, Datum/Stage/Seed in front
+#   jsonl     one JSON object per bot and snapshot
+#   columnar  one JSON line per snapshot: column names + one list per column
+
+
+EXPORT_FORMATS = {
+    "csv": "csv",
+    "jsonl": "jsonl",
+    "json": "jsonl",
+    "columnar": "columnar.jsonl",
+    "cols": "columnar.jsonl",
+}
+SNAPSHOT_FIELDS = ["Datum", "Stage", "Seed"]
+
+EXPORT_DIR = LOCAL_DATA_PATH_DIR / "exports"
+
+os.makedirs(EXPORT_DIR, exist_ok=True)
+
+logger = logging.getLogger(__name__)
+
+# (snapshot fields, rows) as produced by parse_html_to_json
+Snapshot = Tuple[dict, List[dict]]
+
+
+# MARK: parse_export_range()
+def parse_export_range(
+    arg: Optional[str], store: HistoryStore
+) -> Optional[Tuple[Optional[str], Optional[str]]]:
+    """
+    (start, end) ISO dates of a range argument, None = current leaderboard.
+    Accepts `all`, a number of days, `YYYY-MM-DD` or `YYYY-MM-DD..YYYY-MM-DD`.
+    ValueError if the argument is none of these.
+    """
+    if not arg:
+        return None
+    arg = arg.strip().lower()
+    if arg == "all":
+        return None, None
+    if arg.isdigit():
+        return range_start(store, int(arg)), None
+
+    match = re.fullmatch(r"(\d{4}-\d{2}-\d{2})(?:\.\.(\d{4}-\d{2}-\d{2}))?", arg)
+    if not match:
+        raise ValueError(arg)
+    start, end = match.groups()
+    return start, end or start
+
+
+# MARK: iter_current_snapshot()
+def iter_current_snapshot() -> Iterator[Snapshot]:
+    """The live leaderboard (fetched when the export runs)."""
+    leaderboard_json, leaderboard_meta = get_leaderboard_json()
+    if not leaderboard_json or "error" in leaderboard_json[0]:
+        return
+    yield {
+        "Datum": parse_snapshot_date(leaderboard_meta.get("date")),
+        "Stage": leaderboard_meta.get("stage") or "",
+        "Seed": leaderboard_meta.get("seed") or "",
+    }, leaderboard_json
+
+
+# MARK: iter_history_snapshots()
+def iter_history_snapshots(
+    store: HistoryStore, entries: List[dict]
+) -> Iterator[Snapshot]:
+    """Stored snapshots of the given index entries, oldest first."""
+    for entry, rows in store.iter_rows(entries):
+        _, stage, seed = (entry["key"].split(KEY_SEPARATOR) + ["", ""])[:3]
+        yield {"Datum": entry["date"], "Stage": stage, "Seed": seed}, rows
+
+
+# MARK: Formats
+def csv_chunks(snapshots: Iterable[Snapshot]) -> Iterator[str]:
+    """CSV text, one chunk per snapshot. Columns of the first snapshot."""
+    buffer = io.StringIO()
+    writer = None
+    for fields, rows in snapshots:
+        if writer is None:
+            columns = SNAPSHOT_FIELDS + [c for c in rows[0] if c not in fields]
+            writer = csv.DictWriter(buffer, columns, restval="", extrasaction="ignore")
+            writer.writeheader()
+        for entry in rows:
+            writer.writerow({**entry, **fields})
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+
+
+def jsonl_chunks(snapshots: Iterable[Snapshot]) -> Iterator[str]:
+    """One JSON object per row, one chunk per snapshot."""
+    for fields, rows in snapshots:
+        yield "".join(
+            json.dumps({**fields, **entry}, ensure_ascii=False) + "\n" for entry in rows
+        )
+
+
+def columnar_chunks(snapshots: Iterable[Snapshot]) -> Iterator[str]:
+    """One JSON line per snapshot: {Datum, Stage, Seed, columns, values}."""
+    for fields, rows in snapshots:
+        columns = list(rows[0]) if rows else []
+        values = {
+            column: [entry.get(column, "") for entry in rows] for column in columns
+        }
+        yield json.dumps(
+            {**fields, "columns": columns, "values": values},
+            ensure_ascii=False,
+            separators=(",", ":"),
+        ) + "\n"
+
+
+FORMAT_WRITERS = {
+    "csv": csv_chunks,
+    "jsonl": jsonl_chunks,
+    "columnar.jsonl": columnar_chunks,
+}
+
+
+# MARK: gzip_chunks()
+def gzip_chunks(chunks: Iterable[str]) -> Iterator[bytes]:
+    """Gzip-compress text chunks as they come."""
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        data = compressor.compress(chunk.encode("utf-8"))
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+# MARK: write_export()
+def write_export(extension: str, snapshots: Iterable[Snapshot]) -> Tuple[str, int]:
+    """
+    Blocking: stream the snapshots into a gzipped temp file in EXPORT_DIR.
+    Returns (path, number of snapshots); the caller deletes the file.
+    """
+    count = 0
+
+    def counted() -> Iterator[Snapshot]:
+        nonlocal count
+        for snapshot in snapshots:
+            count += 1
+            yield snapshot
+
+    with timed("export"):
+        with tempfile.NamedTemporaryFile(
+            dir=EXPORT_DIR, suffix=f".{extension}.gz", delete=False
+        ) as f:
+            try:
+                for data in gzip_chunks(FORMAT_WRITERS[extension](counted())):
+                    f.write(data)
+            except BaseException:
+                f.close()
+                os.remove(f.name)
+                raise
+
+    logger.info(f"📦 Export: {count} Leaderboards, {os.path.getsize(f.name)} Bytes")
+    return f.name, count
@@ -0,0 +1,128 @@
+# helper_scripts/leaderboard_poller.py
+
+# Standard library imports
+import logging
+import asyncio
+from typing import Awaitable, Callable, List, Optional, Tuple
+
+# Third-party imports
+import requests
+
+# Own modules
+from helper_scripts.data_functions import get_bot_state, set_bot_state
+from helper_scripts.globals import CLUSTER_ID
+from helper_scripts.helper_functions import (
+    SCRIMS_URL,
+    extract_leaderboard_meta,
+    get_leaderboard_json,
+)
+from helper_scripts.history_store import snapshot_key
+
+
+SnapshotListener = Callable[[list[dict], dict], Awaitable[None]]
+
+# per cluster process: each one posts the new board to its own guilds
+STATE_KEY = f"last_snapshot_key_{CLUSTER_ID}" if CLUSTER_ID else "last_snapshot_key"
+
+logger = logging.getLogger(__name__)
+
+
+# MARK: LeaderboardPoller
+class LeaderboardPoller:
+    """
+    Cheaply checks the scrims page and notifies listeners as soon as a new
+    Datum/Stage/Seed appears. Uses conditional requests (ETag / Last-Modified)
+    and parses only the info boxes until a change is detected.
+    """
+
+    def __init__(self, url: str = SCRIMS_URL):
+        self.url = url
+        self.etag: Optional[str] = None
+        self.last_modified: Optional[str] = None
+        self.last_key: Optional[str] = get_bot_state(STATE_KEY)
+        self.listeners: List[SnapshotListener] = []
+
+    def add_listener(self, listener: SnapshotListener):
+        """Register `async listener(leaderboard_json, leaderboard_meta)`."""
+        self.listeners.append(listener)
+
+    # MARK: > check
+    def check(self) -> Optional[Tuple[str, str]]:
+        """Return (snapshot key, html) if the page shows an unseen snapshot."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+
+        response = requests.get(self.url, headers=headers, timeout=10)
+        if response.status_code == 304:
+            return None
+        response.raise_for_status()
+
+        self.etag = response.headers.get("ETag")
+        self.last_modified = response.headers.get("Last-Modified")
+
+        key = snapshot_key(extract_leaderboard_meta(response.text))
+        if key is None or key == self.last_key:
+            return None
+        return key, response.text
+
+    # MARK: > poll
+    async def poll(self):
+        """Scheduler job: run one check and trigger the listeners on change."""
+        try:
+            result = await asyncio.to_thread(self.check)
+        except requests.RequestException as e:
+            logger.warning(f"⚠️ Poller konnte das Leaderboard nicht abrufen: {e}")
+            return
+
+        if result is None:
+            return
+
+        key, html = result
+        first_run = self.last_key is None
+
+        # Full parse only now that we know the board changed
+        leaderboard_json, leaderboard_meta = await asyncio.to_thread(
+            get_leaderboard_json, html
+        )
+        if not leaderboard_json or "error" in leaderboard_json[0]:
+            logger.warning("⚠️ Poller: neues Leaderboard konnte nicht geparst werden.")
+            self.retry()
+            return
+
+        if first_run:
+            # Nothing to compare against yet: remember it, don't post it again
+            logger.info(
+                f"🔎 Poller initialisiert mit Leaderboard vom {leaderboard_meta.get('date')}"
+            )
+            self.remember(key)
+            return
+
+        logger.info(f"🆕 Neues Leaderboard erkannt: {leaderboard_meta.get('date')}")
+        failed = False
+        for listener in self.listeners:
+            try:
+                await listener(leaderboard_json, leaderboard_meta)
+            except Exception as e:
+                failed = True
+                logger.exception(
+                    f"❌ Poller-Listener {listener.__name__} schlug fehl: {e}"
+                )
+
+        # Only a fully handled board counts as seen; otherwise the next poll
+        # tries again (listeners that succeeded may then run a second time)
+        if failed:
+            self.retry()
+        else:
+            self.remember(key)
+
+    def remember(self, key: str):
+        self.last_key = key
+        set_bot_state(STATE_KEY, key)
+
+    def retry(self):
+        """Fetch the page unconditionally next time (no 304 for it)."""
+        self.etag = None
+        self.last_modified = None
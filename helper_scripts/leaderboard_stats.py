@@ -0,0 +1,212 @@
+# helper_scripts/leaderboard_stats.py
+
+# Standard library imports
+import hashlib
+import math
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Tuple
+
+# Third-party imports
+from PIL import Image, ImageDraw, ImageFont
+
+# Own modules
+from helper_scripts.asset_access import get_lang_icon
+from helper_scripts.helper_functions import (
+    GENERATED_TABLES_DIR,
+    TEXT_FONT_PATH,
+    fit_text_to_column,
+)
+from helper_scripts.history_store import HistoryStore
+from helper_scripts.leaderboard_columns import get_snapshot_columns
+from helper_scripts.metrics import record_cache
+
+
+MAX_ORT_ROWS = 20
+# rendered stats images kept on disk, oldest files are deleted
+MAX_CACHED_STATS_IMAGES = 16
+
+# snapshot key -> raw aggregates of that snapshot
+_stats_cache: Dict[str, dict] = {}
+# tuple of snapshot keys -> rendered image path, least recently used first
+_image_cache: "OrderedDict[Tuple[str, ...], str]" = OrderedDict()
+_image_cache_lock = threading.Lock()
+
+
+# MARK: snapshot_stats()
+def snapshot_stats(key: str, leaderboard_json: List[dict]) -> dict:
+    """Per-language and per-Ort aggregates of one snapshot (cached per key)."""
+    stats = _stats_cache.get(key)
+    record_cache("snapshot_stats", stats is not None)
+    if stats is None:
+        columns = get_snapshot_columns(key, leaderboard_json)
+        stats = {
+            "rows": columns.row_count,
+            "language": columns.aggregate(columns.language),
+            "ort": columns.aggregate(columns.ort),
+        }
+        _stats_cache[key] = stats
+    return stats
+
+
+# MARK: history_stats()
+def history_stats(store: HistoryStore, entries: List[dict]) -> dict:
+    """
+    Merge the aggregates of several stored snapshots. Snapshots not cached
+    yet are decoded in one pass (iter_rows), each from the one before.
+    """
+    missing = sorted(
+        (entry for entry in entries if entry["key"] not in _stats_cache),
+        key=lambda entry: entry["id"],
+    )
+    for entry, rows in store.iter_rows(missing):
+        snapshot_stats(entry["key"], rows)
+    return merge_stats([_stats_cache[entry["key"]] for entry in entries])
+
+
+# MARK: merge_stats()
+def merge_stats(stats_list: List[dict]) -> dict:
+    merged: dict = {"rows": 0, "language": {}, "ort": {}}
+    for stats in stats_list:
+        merged["rows"] += stats["rows"]
+        for group in ("language", "ort"):
+            for value, agg in stats[group].items():
+                target = merged[group].setdefault(
+                    value,
+                    {
+                        "count": 0,
+                        "score_sum": 0.0,
+                        "score_count": 0,
+                        "best": -math.inf,
+                        "dnq": 0,
+                    },
+                )
+                target["count"] += agg["count"]
+                target["score_sum"] += agg["score_sum"]
+                target["score_count"] += agg["score_count"]
+                target["best"] = max(target["best"], agg["best"])
+                target["dnq"] += agg["dnq"]
+    return merged
+
+
+# MARK: summarize()
+def summarize(groups: Dict[str, dict]) -> List[dict]:
+    """Turn raw aggregates into display rows, most bots first."""
+    rows = []
+    for value, agg in groups.items():
+        rows.append(
+            {
+                "name": value,
+                "count": agg["count"],
+                "avg": (
+                    agg["score_sum"] / agg["score_count"]
+                    if agg["score_count"]
+                    else None
+                ),
+                "best": agg["best"] if agg["best"] != -math.inf else None,
+                "dnq_rate": agg["dnq"] / agg["count"] if agg["count"] else 0.0,
+            }
+        )
+    rows.sort(key=lambda r: (-r["count"], r["name"]))
+    return rows
+
+
+# MARK: get_stats_image()
+def get_stats_image(keys: Tuple[str, ...], stats: dict, title: str) -> str:
+    """
+    Return the stats image for a set of snapshots, rendering it only once.
+    Blocking; called from worker threads of the job queue.
+    """
+    with _image_cache_lock:
+        cached = _image_cache.get(keys)
+        hit = bool(cached and os.path.exists(cached))
+        if cached and hit:
+            _image_cache.move_to_end(keys)
+    record_cache("stats_images", hit)
+    if cached and hit:
+        return cached
+
+    digest = hashlib.sha1("|".join(keys).encode("utf-8")).hexdigest()[:16]
+    file_path = os.path.join(GENERATED_TABLES_DIR, f"stats_{digest}.png")
+    render_stats_image(stats, title, file_path)
+    with _image_cache_lock:
+        _image_cache[keys] = file_path
+        _image_cache.move_to_end(keys)
+        while len(_image_cache) > MAX_CACHED_STATS_IMAGES:
+            _, old_path = _image_cache.popitem(last=False)
+            try:
+                os.remove(old_path)
+            except OSError:
+                pass
+    return file_path
+
+
+# MARK: render_stats_image()
+def render_stats_image(stats: dict, title: str, file_path: str) -> str:
+    """Draw the language and Ort tables into one PNG."""
+
+    # ----- COLORS -----
+    BACKGROUND_COLOR = (21, 21, 20)
+    HEADER_COLOR = (255, 200, 0)
+    NORMAL_TEXT_COLOR = (231, 230, 225)
+
+    # ----- LAYOUT -----
+    PADDING = 5
+    LINE_HEIGHT = 36
+    IMG_WIDTH = 800
+    TEXT_FONT = ImageFont.truetype(TEXT_FONT_PATH, 18)
+
+    language_rows = summarize(stats["language"])
+    ort_rows = summarize(stats["ort"])[:MAX_ORT_ROWS]
+
+    sections = [("Sprache", language_rows, True), ("Ort", ort_rows, False)]
+    line_count = 1 + sum(len(rows) + 2 for _, rows, _ in sections)
+    img_height = PADDING * 2 + line_count * LINE_HEIGHT
+    img = Image.new("RGB", (IMG_WIDTH, img_height), color=BACKGROUND_COLOR)
+    draw = ImageDraw.Draw(img)
+
+    draw.text((PADDING, PADDING), title, fill=HEADER_COLOR, font=TEXT_FONT)
+    y = PADDING + LINE_HEIGHT
+
+    for section_title, rows, with_icon in sections:
+        y += LINE_HEIGHT // 2
+        columns = [
+            (section_title, 300),
+            ("Bots", 100),
+            ("Ø Score", 130),
+            ("Best", 130),
+            ("DNQ", 100),
+        ]
+        col_x = [PADDING]
+        for _, width in columns[:-1]:
+            col_x.append(col_x[-1] + width)
+
+        for (head, _), x in zip(columns, col_x):
+            draw.text((x, y), head, fill=HEADER_COLOR, font=TEXT_FONT)
+        y += LINE_HEIGHT
+
+        for row in rows:
+            name_x = col_x[0]
+            if with_icon:
+                lang_img = get_lang_icon(row["name"])
+                img.paste(lang_img, (name_x, y - 6), lang_img.convert("RGBA"))
+                name_x += 40
+
+            values = [
+                fit_text_to_column(
+                    draw, row["name"] or "-", TEXT_FONT, col_x[1] - name_x - 5
+                ),
+                str(row["count"]),
+                f"{row['avg']:.1f}" if row["avg"] is not None else "-",
+                f"{row['best']:.1f}" if row["best"] is not None else "-",
+                f"{row['dnq_rate'] * 100:.0f}%",
+            ]
+            for col_idx, value in enumerate(values):
+                x = name_x if col_idx == 0 else col_x[col_idx]
+                draw.text((x, y), value, fill=NORMAL_TEXT_COLOR, font=TEXT_FONT)
+            y += LINE_HEIGHT
+        y += LINE_HEIGHT // 2
+
+    img.save(file_path)
+    return file_path
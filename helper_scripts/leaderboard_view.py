@@ -0,0 +1,131 @@
+# helper_scripts/leaderboard_view.py
+
+# Standard library imports
+import asyncio
+import logging
+import time
+
+# Third-party imports
+import discord
+
+# Own modules
+from helper_scripts.helper_functions import (
+    image_chunks,
+    images_in_use,
+    render_page_cached,
+)
+from helper_scripts.job_queue import PRIORITY_INTERACTIVE, job_queue
+from helper_scripts.metrics import observe_stage
+
+
+#       |==========================|
+#       |   LEADERBOARD_VIEW.PY    |
+#       |==========================|
+
+# `/leaderboard` shows one image at a time with ◀️ / ▶️ buttons instead of
+# posting every chunk. A page is rendered only when someone asks for it (and
+# then comes from the render cache), so a request that only looks at page 1
+# renders and uploads one image instead of the whole board.
+
+
+VIEW_TIMEOUT_SECONDS = 15 * 60
+
+logger = logging.getLogger(__name__)
+
+
+# MARK: render_page()
+async def render_page(
+    leaderboard_json: list[dict], top_x: int | None, page: int, hold=None
+):
+    """Render one page as an interactive job, in a worker thread."""
+    return await job_queue.submit(
+        PRIORITY_INTERACTIVE,
+        asyncio.to_thread,
+        render_page_cached,
+        leaderboard_json,
+        top_x,
+        page,
+        hold,
+    )
+
+
+# MARK: LeaderboardPageView
+class LeaderboardPageView(discord.ui.View):
+    """Buttons to page through one leaderboard snapshot."""
+
+    def __init__(self, leaderboard_json: list[dict], top_x: int | None, title: str):
+        super().__init__(timeout=VIEW_TIMEOUT_SECONDS)
+        # snapshot rows, shared with the parse cache: read only
+        self.leaderboard_json = leaderboard_json
+        self.top_x = top_x
+        self.title = title
+        self.page = 0
+        rows = leaderboard_json[:top_x] if top_x else leaderboard_json
+        self.page_count = len(image_chunks(len(rows)))
+        self.message: discord.Message | None = None
+        self._update_buttons()
+
+    def content(self) -> str:
+        return f"{self.title}\n-# Seite {self.page + 1}/{self.page_count}"
+
+    def _update_buttons(self):
+        self.previous_button.disabled = self.page <= 0
+        self.next_button.disabled = self.page >= self.page_count - 1
+
+    async def show_page(self, interaction: discord.Interaction, page: int):
+        await interaction.response.defer()
+        self.page = max(0, min(page, self.page_count - 1))
+        self._update_buttons()
+
+        start = time.perf_counter()
+        with images_in_use() as hold:
+            path = await render_page(self.leaderboard_json, self.top_x, self.page, hold)
+            await interaction.edit_original_response(
+                content=self.content(), attachments=[discord.File(path)], view=self
+            )
+        observe_stage("page_turn", time.perf_counter() - start)
+
+    @discord.ui.button(emoji="◀️", style=discord.ButtonStyle.secondary)
+    async def previous_button(
+        self, interaction: discord.Interaction, button: discord.ui.Button
+    ):
+        await self.show_page(interaction, self.page - 1)
+
+    @discord.ui.button(emoji="▶️", style=discord.ButtonStyle.secondary)
+    async def next_button(
+        self, interaction: discord.Interaction, button: discord.ui.Button
+    ):
+        await self.show_page(interaction, self.page + 1)
+
+    async def on_timeout(self):
+        if self.message is None:
+            return
+        for item in self.children:
+            item.disabled = True
+        try:
+            await self.message.edit(view=self)
+        except discord.HTTPException:
+            pass
+
+    async def on_error(self, interaction: discord.Interaction, error, item):
+        logger.error(f"❌ Seite konnte nicht angezeigt werden: {error}", exc_info=error)
+
+
+# MARK: send_leaderboard_pages()
+async def send_leaderboard_pages(
+    interaction: discord.Interaction,
+    leaderboard_json: list[dict],
+    top_x: int | None,
+    title: str,
+):
+    """Answer a deferred interaction with page 1 and the page buttons."""
+    view = LeaderboardPageView(leaderboard_json, top_x, title)
+    with images_in_use() as hold:
+        path = await render_page(leaderboard_json, top_x, 0, hold)
+        if view.page_count <= 1:
+            await interaction.followup.send(content=title, file=discord.File(path))
+            return
+
+        view.message = await interaction.followup.send(
+            content=view.content(), file=discord.File(path), view=view, wait=True
+        )
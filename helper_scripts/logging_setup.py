@@ -0,0 +1,146 @@
+# helper_scripts/logging_setup.py
+
+# Standard library imports
+import atexit
+import copy
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+from datetime import datetime, timezone
+from typing import Optional
+
+# Third-party imports
+# None
+
+# Own modules
+from helper_scripts.globals import LOCAL_DATA_PATH_DIR
+
+
+#       |==========================|
+#       |    LOGGING_SETUP.PY      |
+#       |==========================|
+
+# All log records go through a QueueHandler; formatting and writing happen on
+# the QueueListener thread, so logging never blocks the event loop.
+# Outputs: JSON lines file with size-based rotation + readable stdout lines.
+
+
+LOG_DIR = LOCAL_DATA_PATH_DIR / "logs"
+DEFAULT_LOG_FILE = LOG_DIR / "bot.jsonl"
+
+# attributes every LogRecord has; everything else came in via `extra=`
+_STANDARD_RECORD_ATTRS = set(
+    vars(logging.LogRecord("", logging.INFO, "", 0, "", (), None))
+) | {"message", "asctime"}
+
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+# MARK: JsonLinesFormatter
+class JsonLinesFormatter(logging.Formatter):
+    """One JSON object per line: ts, level, logger, msg + all extra fields."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(
+                timespec="milliseconds"
+            ),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        for name, value in record.__dict__.items():
+            if name not in _STANDARD_RECORD_ATTRS and not name.startswith("_"):
+                payload[name] = value
+        # set by StructuredQueueHandler; exc_info itself does not cross the queue
+        if record.exc_text:
+            payload["exc"] = record.exc_text
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+
+# MARK: StructuredQueueHandler
+class StructuredQueueHandler(logging.handlers.QueueHandler):
+    """
+    The stock prepare() formats the traceback into msg and clears exc_info.
+    Keep msg plain and the traceback in exc_text, so the JSON lines get it
+    as their own "exc" field (the console line still appends it).
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        if record.exc_info and not record.exc_text:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+        record.exc_info = None
+        return record
+
+
+# MARK: ConsoleFormatter
+class ConsoleFormatter(logging.Formatter):
+    """Readable line for bot.log / the terminal, extra fields appended."""
+
+    def __init__(self):
+        super().__init__("%(asctime)s %(levelname)-7s %(name)s: %(message)s")
+
+    def format(self, record: logging.LogRecord) -> str:
+        line = super().format(record)
+        fields = [
+            f"{name}={value}"
+            for name, value in record.__dict__.items()
+            if name not in _STANDARD_RECORD_ATTRS and not name.startswith("_")
+        ]
+        return f"{line} [{' '.join(fields)}]" if fields else line
+
+
+# MARK: setup_logging()
+def setup_logging() -> logging.handlers.QueueListener:
+    """
+    Configure the root logger once. Settings via environment:
+    LOG_LEVEL (INFO), LOG_FILE, LOG_MAX_BYTES (5 MB), LOG_BACKUP_COUNT (5).
+    """
+    global _listener
+    if _listener is not None:
+        return _listener
+
+    log_file = os.getenv("LOG_FILE", str(DEFAULT_LOG_FILE))
+    os.makedirs(os.path.dirname(log_file) or ".", exist_ok=True)
+
+    file_handler = logging.handlers.RotatingFileHandler(
+        log_file,
+        maxBytes=int(os.getenv("LOG_MAX_BYTES", str(5 * 1024 * 1024))),
+        backupCount=int(os.getenv("LOG_BACKUP_COUNT", "5")),
+        encoding="utf-8",
+    )
+    file_handler.setFormatter(JsonLinesFormatter())
+
+    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.setFormatter(ConsoleFormatter())
+
+    log_queue: queue.Queue = queue.Queue(-1)
+    root = logging.getLogger()
+    root.handlers.clear()
+    root.addHandler(StructuredQueueHandler(log_queue))
+    root.setLevel(os.getenv("LOG_LEVEL", "INFO").upper())
+
+    _listener = logging.handlers.QueueListener(
+        log_queue, file_handler, console_handler, respect_handler_level=True
+    )
+    _listener.start()
+    atexit.register(_listener.stop)
+    return _listener
+
+
+# MARK: command_fields()
+def command_fields(ctx) -> dict:
+    """Structured fields of a command invocation for `extra=`."""
+    return {
+        "guild": ctx.guild.id if ctx.guild else None,
+        "channel": ctx.channel.id,
+        "user": ctx.author.id,
+        "command": str(ctx.command),
+    }
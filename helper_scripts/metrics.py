@@ -0,0 +1,253 @@
+# helper_scripts/metrics.py
+
+# Standard library imports
+import logging
+import asyncio
+import bisect
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+# Third-party imports
+# None
+
+# Own modules
+# None
+
+
+#       |==========================|
+#       |        METRICS.PY        |
+#       |==========================|
+
+# In-process metrics (histograms, counters, gauges) exposed in Prometheus
+# text format on a local HTTP endpoint. Use `timed("stage")` around a
+# pipeline stage and `record_cache("name", hit)` for cache lookups.
+
+
+METRIC_PREFIX = "hgbot"
+DEFAULT_BUCKETS = (
+    0.001,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+logger = logging.getLogger(__name__)
+
+
+def _label_key(labels: Dict[str, object]) -> LabelKey:
+    return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+
+def _format_labels(label_key: LabelKey, extra: str = "") -> str:
+    parts = [f'{name}="{_escape(value)}"' for name, value in label_key]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+# MARK: Histogram
+class Histogram:
+    """Cumulative-bucket histogram in seconds."""
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # last = +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+# MARK: MetricsRegistry
+class MetricsRegistry:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.histograms: Dict[str, Dict[LabelKey, Histogram]] = {}
+        self.counters: Dict[str, Dict[LabelKey, float]] = {}
+        self.gauges: Dict[str, Dict[LabelKey, float]] = {}
+        self.help: Dict[str, str] = {}
+        # callbacks(name, value, labels) for raw samples, e.g. benchmarks
+        self.observers: List[Callable[[str, float, Dict[str, object]], None]] = []
+
+    def observe(self, name: str, value: float, help_text: str = "", **labels):
+        with self._lock:
+            series = self.histograms.setdefault(name, {})
+            key = _label_key(labels)
+            if key not in series:
+                series[key] = Histogram()
+            series[key].observe(value)
+            if help_text:
+                self.help.setdefault(name, help_text)
+        for observer in self.observers:
+            observer(name, value, labels)
+
+    def inc(self, name: str, amount: float = 1.0, help_text: str = "", **labels):
+        with self._lock:
+            series = self.counters.setdefault(name, {})
+            key = _label_key(labels)
+            series[key] = series.get(key, 0.0) + amount
+            if help_text:
+                self.help.setdefault(name, help_text)
+
+    def set_gauge(self, name: str, value: float, help_text: str = "", **labels):
+        with self._lock:
+            self.gauges.setdefault(name, {})[_label_key(labels)] = value
+            if help_text:
+                self.help.setdefault(name, help_text)
+
+    # MARK: > render_prometheus()
+    def render_prometheus(self) -> str:
+        """Return all metrics in the Prometheus text exposition format."""
+        lines = []
+        with self._lock:
+            for name, series in sorted(self.counters.items()):
+                full_name = f"{METRIC_PREFIX}_{name}"
+                lines.append(f"# HELP {full_name} {self.help.get(name, name)}")
+                lines.append(f"# TYPE {full_name} counter")
+                for key, value in series.items():
+                    lines.append(f"{full_name}{_format_labels(key)} {value}")
+
+            for name, series in sorted(self.gauges.items()):
+                full_name = f"{METRIC_PREFIX}_{name}"
+                lines.append(f"# HELP {full_name} {self.help.get(name, name)}")
+                lines.append(f"# TYPE {full_name} gauge")
+                for key, value in series.items():
+                    lines.append(f"{full_name}{_format_labels(key)} {value}")
+
+            for name, series in sorted(self.histograms.items()):
+                full_name = f"{METRIC_PREFIX}_{name}"
+                lines.append(f"# HELP {full_name} {self.help.get(name, name)}")
+                lines.append(f"# TYPE {full_name} histogram")
+                for key, hist in series.items():
+                    cumulative = 0
+                    for bound, count in zip(hist.buckets, hist.counts):
+                        cumulative += count
+                        labels = _format_labels(key, f'le="{bound}"')
+                        lines.append(f"{full_name}_bucket{labels} {cumulative}")
+                    labels = _format_labels(key, 'le="+Inf"')
+                    lines.append(f"{full_name}_bucket{labels} {hist.count}")
+                    lines.append(f"{full_name}_sum{_format_labels(key)} {hist.sum}")
+                    lines.append(f"{full_name}_count{_format_labels(key)} {hist.count}")
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+# keep references, asyncio only holds weak references to tasks
+_background_tasks: set = set()
+
+
+# MARK: observe_stage()
+def observe_stage(stage: str, seconds: float, **labels):
+    registry.observe(
+        "stage_duration_seconds",
+        seconds,
+        help_text="Duration of leaderboard pipeline stages",
+        stage=stage,
+        **labels,
+    )
+
+
+# MARK: timed()
+@contextmanager
+def timed(stage: str, **labels) -> Iterator[None]:
+    """Measure the wall time of a pipeline stage (works around awaits too)."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        observe_stage(stage, time.perf_counter() - start, **labels)
+
+
+# MARK: record_cache()
+def record_cache(cache: str, hit: bool):
+    """Count a cache lookup; hit rate = hits / (hits + misses)."""
+    registry.inc(
+        "cache_requests_total",
+        help_text="Cache lookups by result",
+        cache=cache,
+        result="hit" if hit else "miss",
+    )
+
+
+# MARK: monitor_event_loop_lag()
+async def monitor_event_loop_lag(interval: float = 1.0):
+    """Background task: how late the event loop wakes up from a sleep."""
+    loop = asyncio.get_running_loop()
+    while True:
+        start = loop.time()
+        await asyncio.sleep(interval)
+        lag = max(loop.time() - start - interval, 0.0)
+        registry.observe(
+            "event_loop_lag_seconds", lag, help_text="Event loop wake-up delay"
+        )
+        registry.set_gauge(
+            "event_loop_lag_last_seconds", lag, help_text="Last event loop lag"
+        )
+
+
+# MARK: start_metrics_server()
+async def start_metrics_server(
+    port: int, host: str = "127.0.0.1"
+) -> Optional[asyncio.AbstractServer]:
+    """Serve GET /metrics on a local port and start the event loop monitor."""
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            request_line = await reader.readline()
+            # skip request headers
+            while (await reader.readline()).strip():
+                pass
+
+            parts = request_line.decode("latin-1").split()
+            if len(parts) >= 2 and parts[0] == "GET" and parts[1] == "/metrics":
+                body = registry.render_prometheus().encode("utf-8")
+                status = "200 OK"
+                content_type = "text/plain; version=0.0.4; charset=utf-8"
+            else:
+                body = b"not found\n"
+                status = "404 Not Found"
+                content_type = "text/plain"
+
+            writer.write(
+                f"HTTP/1.1 {status}\r\nContent-Type: {content_type}\r\n"
+                f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode(
+                    "latin-1"
+                )
+                + body
+            )
+            await writer.drain()
+        finally:
+            writer.close()
+
+    try:
+        server = await asyncio.start_server(handle, host, port)
+    except OSError as e:
+        logger.warning(f"⚠️ Metrics-Endpoint konnte nicht gestartet werden: {e}")
+        return None
+
+    task = asyncio.create_task(monitor_event_loop_lag())
+    _background_tasks.add(task)
+    logger.info(f"📈 Metrics unter http://{host}:{port}/metrics")
+    return server
@@ -0,0 +1,126 @@
+# helper_scripts/notifications.py
+
+# Standard library imports
+import logging
+from typing import Dict, List
+
+# Third-party imports
+# None
+
+# Own modules
+from helper_scripts.data_functions import load_bot_data
+from helper_scripts.history_store import bot_key, get_history_store, snapshot_key
+from helper_scripts.sharding import owns_guild
+from helper_scripts.snapshot_diff import (
+    CHANGE_ENTERED_DNQ,
+    CHANGE_GONE,
+    CHANGE_LEFT_DNQ,
+    CHANGE_MOVED,
+    CHANGE_NEW,
+    CHANGE_SCORE,
+    diff_snapshots,
+)
+
+
+MAX_MESSAGE_LENGTH = 2000
+
+logger = logging.getLogger(__name__)
+
+
+# MARK: build_tracked_index()
+def build_tracked_index(guilds: Dict[str, dict]) -> Dict[str, List[str]]:
+    """Return {bot key: [guild ids]} over all guilds with notifications enabled."""
+    index: Dict[str, List[str]] = {}
+    for guild_id, g_data in guilds.items():
+        if not g_data.get("notify_channel"):
+            continue
+        for info in g_data.get("tracked_bots", []):
+            index.setdefault(bot_key(info["name"], info["author"]), []).append(guild_id)
+    return index
+
+
+# MARK: format_change()
+def format_change(change: dict) -> str:
+    """One compact line describing the change of a tracked bot."""
+    bot = f"{change['emoji']} **{change['name']}** ({change['author']})"
+    old_rank = f"{change['old_rank']}." if change["old_rank"] is not None else "DNQ"
+    new_rank = f"{change['new_rank']}." if change["new_rank"] is not None else "DNQ"
+    score = (
+        f" · Score {change['old_score']} → {change['new_score']}"
+        if change["old_score"] != change["new_score"]
+        else ""
+    )
+
+    kind = change["kind"]
+    if kind == CHANGE_MOVED:
+        delta = change["rank_delta"]
+        arrow = "⬆️" if delta > 0 else "⬇️"
+        return f"{arrow} {bot}: {old_rank} → {new_rank} ({delta:+d}){score}"
+    if kind == CHANGE_ENTERED_DNQ:
+        return f"🔻 {bot}: {old_rank} → DNQ{score}"
+    if kind == CHANGE_LEFT_DNQ:
+        return f"🔺 {bot}: DNQ → {new_rank}{score}"
+    if kind == CHANGE_SCORE:
+        return f"🔁 {bot}: {new_rank}{score}"
+    if kind == CHANGE_NEW:
+        return f"🆕 {bot}: neu auf Platz {new_rank}"
+    if kind == CHANGE_GONE:
+        return f"👻 {bot}: nicht mehr im Leaderboard"
+    return bot
+
+
+# MARK: notify_tracked_changes()
+async def notify_tracked_changes(bot, leaderboard_json, leaderboard_meta):
+    """
+    Poller listener: diff the new snapshot against the previous one once for
+    all tracked bots of all guilds, then send every opted-in guild its changes.
+    """
+    guilds = load_bot_data().get("guild_data", {})
+    tracked_index = build_tracked_index(guilds)
+    if not tracked_index:
+        return
+
+    store = get_history_store()
+    key = snapshot_key(leaderboard_meta)
+    prev_entry = store.previous(key) if key else None
+    if prev_entry is None:
+        logger.info("ℹ️ Kein vorheriges Leaderboard zum Vergleichen vorhanden.")
+        return
+
+    prev_rows = store.get_rows(prev_entry["id"])
+    changes = diff_snapshots(prev_rows, leaderboard_json, set(tracked_index))
+
+    # Fan the shared diff out to the guilds
+    per_guild: Dict[str, List[str]] = {}
+    for changed_key, change in changes.items():
+        for guild_id in tracked_index.get(changed_key, []):
+            per_guild.setdefault(guild_id, []).append(format_change(change))
+
+    for guild_id, lines in per_guild.items():
+        # another process of the cluster serves this guild
+        if not owns_guild(bot, guild_id):
+            continue
+
+        channel_id = guilds[guild_id]["notify_channel"]
+        channel = bot.get_channel(int(channel_id))
+        if channel is None:
+            logger.warning(
+                f"❌ Notify-Channel {channel_id} nicht gefunden.",
+                extra={"guild": guild_id, "channel": channel_id},
+            )
+            continue
+
+        message = f"**📈 Tracked Bots seit {prev_entry['meta'].get('date')}**"
+        try:
+            for line in lines:
+                if len(message) + len(line) + 1 > MAX_MESSAGE_LENGTH:
+                    await channel.send(message)
+                    message = ""
+                message += f"\n{line}"
+            if message:
+                await channel.send(message)
+        except Exception as e:
+            logger.warning(
+                f"❌ Notification an {channel_id} fehlgeschlagen: {e}",
+                extra={"guild": guild_id, "channel": channel_id},
+            )
@@ -0,0 +1,314 @@
+# helper_scripts/post_scheduler.py
+
+# Standard library imports
+import asyncio
+import heapq
+import logging
+import re
+import time
+import zlib
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+# Third-party imports
+import pytz
+
+# Own modules
+from helper_scripts.data_functions import load_bot_data
+from helper_scripts.posting_journal import (
+    CHANNEL_DELIVERED,
+    CHANNEL_SENDING,
+    RUN_EXPIRED,
+    PostingJournal,
+    run_id,
+)
+
+
+#       |==========================|
+#       |    POST_SCHEDULER.PY     |
+#       |==========================|
+
+# One asyncio task drives all scheduled posts. Channels with the same local
+# post time and time zone share a slot (one fetch/render, posted together);
+# different slots spread the load over the day. The next run of every slot
+# sits in a heap, so a restart or a schedule change costs O(n log n) and the
+# loop only sleeps until the earliest slot. The times themselves are stored
+# per guild / per channel in bot_data.json (see below). With a posting
+# journal, every run is recorded per channel; on start, interrupted runs and
+# runs missed while the bot was down are resumed for the open channels only;
+# channels that were mid-send are first checked with `already_posted`.
+#
+#   guild_data[guild]["post_time"] = "03:00", ["timezone"] = "Europe/Berlin"
+#   guild_data[guild]["channel_schedules"][channel] = {"time": ..., "timezone": ...}
+#
+# Channels without an explicit time (neither channel nor guild) do not all
+# fire at DEFAULT_POST_TIME: each gets a stable offset of up to
+# DEFAULT_SPREAD_MINUTES from its id, so they spread over several slots.
+
+
+DEFAULT_POST_TIME = "03:00"
+DEFAULT_TIMEZONE = "Europe/Berlin"
+# channels on the default time are staggered over this many minutes
+DEFAULT_SPREAD_MINUTES = 30
+# wake up at least this often, e.g. after the system clock jumped
+MAX_SLEEP_SECONDS = 300
+
+Slot = Tuple[str, str]  # (HH:MM, time zone)
+# post_slot(channel_ids, report) with report(channel_id, journal state) or None
+SlotCallback = Callable[
+    [Set[int], Optional[Callable[[int, str], None]]], Awaitable[None]
+]
+# already_posted(channel_id, due) -> the channel got its post after `due`
+PostedCheck = Callable[[int, float], Awaitable[bool]]
+
+logger = logging.getLogger(__name__)
+
+
+# MARK: parse_post_time()
+def parse_post_time(value: str) -> str:
+    """Normalize "3:00" / "03:00" to "03:00". Raises ValueError (German text)."""
+    match = re.fullmatch(r"(\d{1,2}):(\d{2})", value.strip())
+    if not match or int(match.group(1)) > 23 or int(match.group(2)) > 59:
+        raise ValueError(f"Ungültige Uhrzeit `{value}`, erwartet z.B. `03:00`")
+    return f"{int(match.group(1)):02d}:{match.group(2)}"
+
+
+# MARK: parse_timezone()
+def parse_timezone(value: str) -> str:
+    """Return the canonical zone name. Raises ValueError (German text)."""
+    try:
+        return pytz.timezone(value.strip()).zone
+    except pytz.UnknownTimeZoneError:
+        raise ValueError(
+            f"Unbekannte Zeitzone `{value}`, z.B. `Europe/Berlin` oder `UTC`"
+        )
+
+
+# MARK: channel_slot()
+def channel_slot(g_data: dict, channel_id) -> Slot:
+    """Effective (time, zone) of a channel: channel > guild > default."""
+    override = g_data.get("channel_schedules", {}).get(str(channel_id), {})
+    return (
+        override.get("time")
+        or g_data.get("post_time")
+        or default_post_time(channel_id),
+        override.get("timezone") or g_data.get("timezone") or DEFAULT_TIMEZONE,
+    )
+
+
+# MARK: default_post_time()
+def default_post_time(channel_id) -> str:
+    """DEFAULT_POST_TIME plus a stable per-channel offset (staggering)."""
+    offset = zlib.crc32(str(channel_id).encode()) % DEFAULT_SPREAD_MINUTES
+    return _add_minutes(DEFAULT_POST_TIME, offset)
+
+
+# MARK: default_post_window()
+def default_post_window() -> Tuple[str, str]:
+    """Earliest and latest post time of channels without an explicit time."""
+    return DEFAULT_POST_TIME, _add_minutes(
+        DEFAULT_POST_TIME, DEFAULT_SPREAD_MINUTES - 1
+    )
+
+
+def _add_minutes(post_time: str, minutes: int) -> str:
+    hour, minute = map(int, post_time.split(":"))
+    total = (hour * 60 + minute + minutes) % (24 * 60)
+    return f"{total // 60:02d}:{total % 60:02d}"
+
+
+# MARK: build_slots()
+def build_slots(
+    data: dict, owns_guild: Optional[Callable[[str], bool]] = None
+) -> Dict[Slot, Set[int]]:
+    """Group all scheduled channels (of the guilds this process owns) by slot."""
+    slots: Dict[Slot, Set[int]] = {}
+    for guild_id, g_data in data.get("guild_data", {}).items():
+        if owns_guild is not None and not owns_guild(guild_id):
+            continue
+        for channel_id in g_data.get("scheduled_channels", []):
+            slot = channel_slot(g_data, channel_id)
+            slots.setdefault(slot, set()).add(int(channel_id))
+    return slots
+
+
+# MARK: next_run()
+def next_run(slot: Slot, after: float) -> float:
+    """Next UTC timestamp > `after` at which the slot's local time occurs."""
+    post_time, zone = slot
+    tz = pytz.timezone(zone)
+    hour, minute = map(int, post_time.split(":"))
+
+    local_now = datetime.fromtimestamp(after, tz)
+    day = local_now.date()
+    while True:
+        candidate = tz.normalize(
+            tz.localize(datetime(day.year, day.month, day.day, hour, minute))
+        )
+        if candidate.timestamp() > after:
+            return candidate.timestamp()
+        day += timedelta(days=1)
+
+
+# MARK: PostScheduler
+class PostScheduler:
+    """
+    Heap of (next run, slot) entries with one sleeping task. `post_slot` gets
+    the channel ids of a due slot; `prewarm` (optional) runs `prewarm_minutes`
+    before each slot. Runs older than `catch_up_hours` are not caught up.
+    With `owns_guild`, only those guilds' channels are scheduled (sharding).
+    `already_posted` keeps resumed runs from re-posting to channels that
+    were mid-send when the bot stopped.
+    """
+
+    def __init__(
+        self,
+        post_slot: SlotCallback,
+        prewarm: Optional[Callable[[], Awaitable[None]]] = None,
+        prewarm_minutes: int = 0,
+        journal: Optional[PostingJournal] = None,
+        catch_up_hours: float = 12,
+        owns_guild: Optional[Callable[[str], bool]] = None,
+        already_posted: Optional[PostedCheck] = None,
+    ):
+        self.post_slot = post_slot
+        self.prewarm = prewarm
+        self.prewarm_seconds = prewarm_minutes * 60 if prewarm else 0
+        self.journal = journal
+        self.catch_up_seconds = catch_up_hours * 3600
+        self.owns_guild = owns_guild
+        self.already_posted = already_posted
+        self.slots: Dict[Slot, Set[int]] = {}
+        # (UTC timestamp, "post" | "prewarm", slot)
+        self.heap: List[Tuple[float, str, Slot]] = []
+        self._changed = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._running: set = set()
+
+    # MARK: > reload
+    def reload(self, data: Optional[dict] = None):
+        """Rebuild slots and heap from bot data, e.g. after a schedule change."""
+        self.slots = build_slots(
+            load_bot_data() if data is None else data, self.owns_guild
+        )
+        now = time.time()
+        self.heap = []
+        if self.journal:
+            self.journal.drop_future_plans(now)
+        for slot in self.slots:
+            self._push(slot, now)
+        if self.journal:
+            self.journal.request_save()
+        self._changed.set()
+
+    def _push(self, slot: Slot, after: float):
+        """Queue the slot's next post (and its pre-warm, if still ahead)."""
+        when = next_run(slot, after)
+        heapq.heappush(self.heap, (when, "post", slot))
+        if self.journal:
+            self.journal.plan(slot, when, self.slots[slot])
+        prewarm_at = when - self.prewarm_seconds
+        if self.prewarm_seconds and prewarm_at > after:
+            heapq.heappush(self.heap, (prewarm_at, "prewarm", slot))
+
+    # MARK: > next_runs
+    def next_runs(self) -> List[Tuple[datetime, Slot, int]]:
+        """Upcoming posts as (UTC datetime, slot, channel count), earliest first."""
+        posts = sorted(entry for entry in self.heap if entry[1] == "post")
+        return [
+            (datetime.fromtimestamp(when, pytz.utc), slot, len(self.slots[slot]))
+            for when, _, slot in posts
+        ]
+
+    # MARK: > start
+    def start(self):
+        if self._task is None:
+            self.reload()
+            self.recover()
+            self._task = asyncio.create_task(self._run())
+
+    # MARK: > recover
+    def recover(self):
+        """Resume runs from the journal that are due but not done."""
+        if self.journal is None:
+            return
+        now = time.time()
+        for run in self.journal.unfinished(now):
+            slot: Slot = (run["slot"][0], run["slot"][1])
+            key = run_id(slot, run["due"])
+            if now - run["due"] > self.catch_up_seconds:
+                logger.warning(f"⏭️ Verpasster Post {key} ist zu alt, übersprungen.")
+                self.journal.finish(slot, run["due"], RUN_EXPIRED)
+                continue
+
+            logger.info(
+                f"♻️ Setze Post {key} fort "
+                f"({len(PostingJournal.open_channels(run))} Channels offen)."
+            )
+            self._spawn(self._post(slot, run["due"]))
+
+    # MARK: > _post
+    async def _post(self, slot: Slot, due: float):
+        channel_ids = set(self.slots.get(slot, ()))
+        if self.journal is None:
+            await self.post_slot(channel_ids, None)
+            return
+
+        journal = self.journal
+        open_channels = journal.begin(slot, due, channel_ids)
+
+        # "sending" in the journal: the post may or may not have gone out
+        unsure = PostingJournal.open_channels(
+            journal.runs[run_id(slot, due)], (CHANNEL_SENDING,)
+        )
+        if unsure and self.already_posted:
+            for channel_id in unsure:
+                if await self.already_posted(channel_id, due):
+                    logger.info(f"♻️ Channel {channel_id} hat den Post schon.")
+                    journal.mark(slot, due, channel_id, CHANNEL_DELIVERED)
+                    open_channels.discard(channel_id)
+
+        def report(channel_id: int, state: str):
+            journal.mark(slot, due, channel_id, state)
+
+        if open_channels:
+            await self.post_slot(open_channels, report)
+        # not reached on a crash: the run stays "running" and resumes on start
+        journal.finish(slot, due)
+
+    async def _run(self):
+        while True:
+            self._changed.clear()
+            now = time.time()
+
+            while self.heap and self.heap[0][0] <= now:
+                due, kind, slot = heapq.heappop(self.heap)
+                if kind == "post":
+                    self._push(slot, now)
+                    if self.journal:
+                        self.journal.request_save()
+                    self._spawn(self._post(slot, due))
+                elif self.prewarm:
+                    self._spawn(self.prewarm())
+
+            timeout = MAX_SLEEP_SECONDS
+            if self.heap:
+                timeout = min(max(self.heap[0][0] - now, 0), MAX_SLEEP_SECONDS)
+            try:
+                await asyncio.wait_for(self._changed.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    def _spawn(self, coro: Awaitable[None]):
+        """Run slot jobs as tasks, so a long post never delays the next slot."""
+        task = asyncio.ensure_future(coro)
+        self._running.add(task)
+        task.add_done_callback(self._job_done)
+
+    def _job_done(self, task: asyncio.Task):
+        self._running.discard(task)
+        if not task.cancelled() and task.exception():
+            logger.error(
+                f"❌ Geplanter Job fehlgeschlagen: {task.exception()}",
+                exc_info=task.exception(),
+            )
@@ -0,0 +1,221 @@
+# helper_scripts/posting_journal.py
+
+# Standard library imports
+import asyncio
+import json
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Dict, List, Optional, Set, Tuple
+
+# Third-party imports
+import pytz
+
+# Own modules
+from helper_scripts.globals import CLUSTER_ID, LOCAL_DATA_PATH_DIR
+
+
+#       |==========================|
+#       |   POSTING_JOURNAL.PY     |
+#       |==========================|
+
+# Persistent record of every scheduled post run: run id -> slot, due time,
+# run status and one status per channel. Written atomically (temp file +
+# rename), so a crash or restart never corrupts it. Inside the event loop the
+# writes run in a thread and changes made while one is in flight are batched
+# into a single follow-up write. On startup the scheduler resumes runs that
+# were interrupted or missed, posting only to channels that have not been
+# delivered yet.
+#
+# Run status:     planned -> running -> done  (or expired, if too old)
+# Channel status: pending -> sending -> delivered | failed
+#
+# Delivery is at-least-once: a channel still "sending" after a crash (or
+# whose "delivered" was not written yet) may have got its post already. The
+# scheduler asks `already_posted` (last bot message after the due time)
+# before re-sending those; if that cannot tell, the post is sent again.
+
+
+# one journal per cluster process, each only posts to its own guilds
+JOURNAL_FILE = LOCAL_DATA_PATH_DIR / (
+    f"post_journal_{CLUSTER_ID}.json" if CLUSTER_ID else "post_journal.json"
+)
+KEEP_DAYS = 7
+
+RUN_PLANNED = "planned"
+RUN_RUNNING = "running"
+RUN_DONE = "done"
+RUN_EXPIRED = "expired"
+
+CHANNEL_PENDING = "pending"
+CHANNEL_SENDING = "sending"
+CHANNEL_DELIVERED = "delivered"
+CHANNEL_FAILED = "failed"
+
+# not delivered yet: to be (re)sent when a run resumes
+OPEN_CHANNEL_STATES = (CHANNEL_PENDING, CHANNEL_SENDING)
+
+Slot = Tuple[str, str]
+
+logger = logging.getLogger(__name__)
+
+
+# MARK: run_id()
+def run_id(slot: Slot, due: float) -> str:
+    """Stable id of one slot occurrence, e.g. "2026-10-19 03:00 Europe/Berlin"."""
+    post_time, zone = slot
+    local_date = datetime.fromtimestamp(due, pytz.timezone(zone)).date()
+    return f"{local_date.isoformat()} {post_time} {zone}"
+
+
+# MARK: PostingJournal
+class PostingJournal:
+    def __init__(self, path=JOURNAL_FILE):
+        self.path = str(path)
+        # guards self.runs; the file write itself runs under _file_lock
+        self._lock = threading.RLock()
+        self._file_lock = threading.Lock()
+        self._dirty = False
+        self._writer: Optional[asyncio.Task] = None
+        self.runs: Dict[str, dict] = self._load()
+
+    def _load(self) -> Dict[str, dict]:
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f).get("runs", {})
+        except (OSError, ValueError) as e:
+            logger.warning(f"⚠️ Post-Journal unlesbar, starte leer: {e}")
+            return {}
+
+    # MARK: > save
+    def save(self):
+        """
+        Atomically write the journal, dropping runs older than KEEP_DAYS.
+        Blocking; inside the event loop use request_save().
+        """
+        with self._lock:
+            cutoff = time.time() - KEEP_DAYS * 86400
+            self.runs = {k: r for k, r in self.runs.items() if r["due"] >= cutoff}
+            text = json.dumps({"runs": self.runs}, ensure_ascii=False, indent=1)
+
+        with self._file_lock:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(text)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+
+    # MARK: > request_save
+    def request_save(self):
+        """
+        Save without blocking the event loop: the write runs in a thread, and
+        changes made meanwhile go into one follow-up write. Outside a running
+        loop this saves right away.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.save()
+            return
+        self._dirty = True
+        if self._writer is None or self._writer.done():
+            self._writer = loop.create_task(self._write_pending())
+
+    async def _write_pending(self):
+        while self._dirty:
+            self._dirty = False
+            await asyncio.to_thread(self.save)
+
+    # MARK: > flush
+    async def flush(self):
+        """Wait until all requested saves are on disk."""
+        while self._writer is not None and not self._writer.done():
+            await self._writer
+
+    def _run(self, slot: Slot, due: float, channel_ids: Set[int]) -> dict:
+        with self._lock:
+            run = self.runs.setdefault(
+                run_id(slot, due),
+                {"slot": list(slot), "due": due, "status": RUN_PLANNED, "channels": {}},
+            )
+            for channel_id in channel_ids:
+                run["channels"].setdefault(str(channel_id), CHANNEL_PENDING)
+            return run
+
+    # MARK: > plan
+    def plan(self, slot: Slot, due: float, channel_ids: Set[int]):
+        """Remember an upcoming run (call request_save() afterwards)."""
+        self._run(slot, due, channel_ids)
+
+    # MARK: > drop_future_plans
+    def drop_future_plans(self, now: float):
+        """Forget planned runs that are not due yet, before re-planning."""
+        with self._lock:
+            self.runs = {
+                key: run
+                for key, run in self.runs.items()
+                if not (run["status"] == RUN_PLANNED and run["due"] > now)
+            }
+
+    # MARK: > begin
+    def begin(self, slot: Slot, due: float, channel_ids: Set[int]) -> Set[int]:
+        """Mark the run as running; return the channels still to deliver."""
+        run = self._run(slot, due, channel_ids)
+        with self._lock:
+            run["status"] = RUN_RUNNING
+        self.request_save()
+        return self.open_channels(run)
+
+    # MARK: > mark
+    def mark(self, slot: Slot, due: float, channel_id: int, state: str):
+        run = self.runs.get(run_id(slot, due))
+        if run is None:
+            return
+        with self._lock:
+            run["channels"][str(channel_id)] = state
+        self.request_save()
+
+    # MARK: > finish
+    def finish(self, slot: Slot, due: float, state: str = RUN_DONE):
+        run = self.runs.get(run_id(slot, due))
+        if run is None:
+            return
+        with self._lock:
+            run["status"] = state
+        self.request_save()
+
+    # MARK: > unfinished
+    def unfinished(self, now: float) -> List[dict]:
+        """Runs that are due but not done: missed or interrupted, oldest first."""
+        runs = [
+            run
+            for run in self.runs.values()
+            if run["status"] in (RUN_PLANNED, RUN_RUNNING) and run["due"] <= now
+        ]
+        return sorted(runs, key=lambda run: run["due"])
+
+    # MARK: > open_channels
+    @staticmethod
+    def open_channels(run: dict, states=OPEN_CHANNEL_STATES) -> Set[int]:
+        return {
+            int(channel_id)
+            for channel_id, state in run["channels"].items()
+            if state in states
+        }
+
+
+_journal: Optional[PostingJournal] = None
+
+
+# MARK: get_posting_journal()
+def get_posting_journal() -> PostingJournal:
+    global _journal
+    if _journal is None:
+        _journal = PostingJournal()
+    return _journal
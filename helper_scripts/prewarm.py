@@ -0,0 +1,73 @@
+# helper_scripts/prewarm.py
+
+# Standard library imports
+import asyncio
+import logging
+
+# Third-party imports
+# None
+
+# Own modules
+from helper_scripts.data_functions import load_bot_data
+from helper_scripts.helper_functions import (
+    filter_json_tracked,
+    get_leaderboard_json,
+    render_images_cached,
+    unpin_renders,
+)
+from helper_scripts.metrics import timed
+
+
+#       |==========================|
+#       |        PREWARM.PY        |
+#       |==========================|
+
+# Runs a few minutes before the daily post: fetch, parse and render the
+# images every scheduled channel will get, so the post itself only uploads.
+# At post time get_leaderboard_json() re-validates the page (conditional GET
+# + content hash); if the board changed meanwhile, it is rendered again.
+# The pre-warmed renders stay pinned in the render cache until the next run.
+
+
+logger = logging.getLogger(__name__)
+
+
+# MARK: prewarm_leaderboard()
+def prewarm_leaderboard() -> int:
+    """Blocking: fill the render cache for the next scheduled post."""
+    with timed("prewarm"):
+        leaderboard_json, leaderboard_meta = get_leaderboard_json()
+        if not leaderboard_json or "error" in leaderboard_json[0]:
+            logger.warning("⚠️ Pre-Warm: Leaderboard konnte nicht geladen werden.")
+            return 0
+
+        # same rows and top_x as post_lb_in_scheduled_channels() sends; pinned,
+        # so the tracked renders of many guilds cannot evict them before the post
+        unpin_renders()
+        image_count = len(render_images_cached(leaderboard_json, top_x=0, pin=True))
+
+        guilds = load_bot_data().get("guild_data", {})
+        for g_data in guilds.values():
+            tracked_bots = g_data.get("tracked_bots", [])
+            if not g_data.get("scheduled_channels") or not tracked_bots:
+                continue
+            tracked_json = filter_json_tracked(leaderboard_json, tracked_bots)
+            if tracked_json:
+                image_count += len(
+                    render_images_cached(tracked_json, top_x=0, pin=True)
+                )
+
+    logger.info(
+        f"🔥 Pre-Warm fertig: Leaderboard vom {leaderboard_meta.get('date')}, "
+        f"{image_count} Bilder im Cache."
+    )
+    return image_count
+
+
+# MARK: prewarm_job()
+async def prewarm_job():
+    """Scheduler job, renders in a worker thread."""
+    try:
+        await asyncio.to_thread(prewarm_leaderboard)
+    except Exception as e:
+        logger.exception(f"❌ Pre-Warm fehlgeschlagen: {e}")
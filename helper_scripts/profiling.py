@@ -0,0 +1,122 @@
+# helper_scripts/profiling.py
+
+# Standard library imports
+import cProfile
+import io
+import logging
+import os
+import pstats
+import threading
+import time
+import tracemalloc
+from datetime import datetime
+
+# Third-party imports
+import requests
+
+# Own modules
+from helper_scripts.globals import LOCAL_DATA_PATH_DIR
+from helper_scripts.helper_functions import (
+    SCRIMS_URL,
+    extract_leaderboard_meta,
+    iter_images_from_json,
+    parse_html_to_json,
+)
+
+
+PROFILES_DIR = LOCAL_DATA_PATH_DIR / "profiles"
+TOP_FUNCTIONS = 30
+TOP_ALLOCATIONS = 15
+# older .pstats files are deleted
+MAX_PROFILES = 10
+
+logger = logging.getLogger(__name__)
+
+# only one profiling run at a time (tracemalloc is process-wide)
+_profile_lock = threading.Lock()
+
+
+# MARK: profile_pipeline()
+def profile_pipeline(top_x: int | None = None) -> tuple[str, str]:
+    """
+    Run fetch -> parse -> render once under cProfile and tracemalloc.
+    Always the full work in this process: no conditional GET, no cached
+    parse (_last_page) and no render worker.
+    Blocking, call it in a worker thread. Returns (text report, .pstats path).
+    Raises RuntimeError if another profiling run is active or the page
+    cannot be fetched.
+    """
+    if not _profile_lock.acquire(blocking=False):
+        raise RuntimeError("Es läuft bereits ein Profiling.")
+
+    try:
+        os.makedirs(PROFILES_DIR, exist_ok=True)
+        profiler = cProfile.Profile()
+
+        tracemalloc.start(25)
+        start = time.perf_counter()
+        profiler.enable()
+        try:
+            try:
+                response = requests.get(SCRIMS_URL, timeout=10)
+                response.raise_for_status()
+            except requests.RequestException as e:
+                raise RuntimeError(f"Leaderboard konnte nicht geladen werden: {e}")
+            extract_leaderboard_meta(response.text)
+            leaderboard_json = parse_html_to_json(response.text)
+            image_paths = list(
+                iter_images_from_json(
+                    leaderboard_json, top_x, file_prefix="profile", local=True
+                )
+            )
+        finally:
+            profiler.disable()
+            duration = time.perf_counter() - start
+            _, peak = tracemalloc.get_traced_memory()
+            memory_snapshot = tracemalloc.take_snapshot()
+            tracemalloc.stop()
+
+        stats_path = str(
+            PROFILES_DIR / f"profile_{datetime.now():%Y%m%d_%H%M%S}.pstats"
+        )
+        profiler.dump_stats(stats_path)
+        remove_old_profiles()
+
+        report = io.StringIO()
+        report.write(
+            f"Pipeline: fetch -> parse -> render (top_x={top_x or 'alle'})\n"
+            f"Zeilen: {len(leaderboard_json)}, Bilder: {len(image_paths)}\n"
+            f"Dauer: {duration:.3f}s, Peak-Speicher: {peak / 1024 / 1024:.2f} MiB\n"
+        )
+
+        report.write(f"\n===== CPU: Top {TOP_FUNCTIONS} (cumulative) =====\n")
+        stats = pstats.Stats(profiler, stream=report)
+        stats.strip_dirs().sort_stats("cumulative").print_stats(TOP_FUNCTIONS)
+
+        report.write(f"\n===== CPU: Top {TOP_FUNCTIONS} (tottime) =====\n")
+        stats.sort_stats("tottime").print_stats(TOP_FUNCTIONS)
+
+        report.write(f"\n===== Speicher: Top {TOP_ALLOCATIONS} Allokationen =====\n")
+        for stat in memory_snapshot.statistics("lineno")[:TOP_ALLOCATIONS]:
+            report.write(f"{stat}\n")
+
+        logger.info(
+            f"🔬 Profiling fertig: {duration:.3f}s, Peak {peak / 1024 / 1024:.2f} MiB",
+            extra={"profile": stats_path},
+        )
+        return report.getvalue(), stats_path
+    finally:
+        _profile_lock.release()
+
+
+# MARK: remove_old_profiles()
+def remove_old_profiles():
+    """Keep only the newest MAX_PROFILES .pstats files."""
+    profiles = sorted(
+        PROFILES_DIR.glob("profile_*.pstats"), key=lambda path: path.stat().st_mtime
+    )
+    for path in profiles[:-MAX_PROFILES]:
+        try:
+            path.unlink()
+        except OSError:
+            pass
@@ -0,0 +1,125 @@
+# helper_scripts/render_worker.py
+
+# Standard library imports
+import asyncio
+import json
+import logging
+import os
+import socketserver
+import sys
+import threading
+
+# Third-party imports
+# None
+
+# Own modules
+from helper_scripts.helper_functions import get_leaderboard_json, iter_images_from_json
+from helper_scripts.logging_setup import setup_logging
+from helper_scripts.metrics import start_metrics_server
+from helper_scripts.worker_client import DEFAULT_SOCKET_PATH
+
+
+#       |==========================|
+#       |     RENDER_WORKER.PY     |
+#       |==========================|
+
+# Worker process that owns fetching, parsing and rendering, so the Discord
+# gateway process only routes commands and uploads files. Started by the bot
+# with LEADERBOARD_RENDER_WORKER=1, or by hand:
+#
+#   python -m helper_scripts.render_worker [socket path]
+#
+# Protocol: see worker_client.py. Every connection is served in its own
+# thread; renders of different boards run in parallel. The fetch, parse,
+# render and encode timings are recorded here, so the worker serves its own
+# /metrics, by default on the bot's METRICS_PORT + 100 (clusters already get
+# one METRICS_PORT each, so their workers do not collide either).
+
+
+# Local Prometheus endpoint of the worker, 0 = disabled
+_bot_metrics_port = int(os.getenv("METRICS_PORT", "9108"))
+WORKER_METRICS_PORT = int(
+    os.getenv(
+        "WORKER_METRICS_PORT", str(_bot_metrics_port + 100 if _bot_metrics_port else 0)
+    )
+)
+
+logger = logging.getLogger(__name__)
+
+
+# MARK: RequestHandler
+class RequestHandler(socketserver.StreamRequestHandler):
+    def send(self, message: dict):
+        self.wfile.write(json.dumps(message, ensure_ascii=False).encode("utf-8"))
+        self.wfile.write(b"\n")
+        self.wfile.flush()
+
+    def handle(self):
+        for line in self.rfile:
+            try:
+                request = json.loads(line)
+                self.answer(request)
+            except (BrokenPipeError, ConnectionResetError):
+                return  # gateway gave up (e.g. upload failed)
+            except Exception as e:
+                logger.exception(f"❌ Render-Worker Anfrage fehlgeschlagen: {e}")
+                self.send({"error": str(e)})
+
+    def answer(self, request: dict):
+        op = request.get("op")
+        if op == "ping":
+            self.send({"ok": True})
+
+        elif op == "leaderboard":
+            leaderboard_json, leaderboard_meta = get_leaderboard_json(
+                request.get("html")
+            )
+            self.send({"rows": leaderboard_json, "meta": leaderboard_meta})
+
+        elif op == "render":
+            images = iter_images_from_json(
+                request["rows"],
+                request.get("top_x"),
+                request.get("delta_column", False),
+                request.get("file_prefix", "leaderboard"),
+                request.get("only_page"),
+            )
+            for path in images:
+                self.send({"path": path})
+            self.send({"done": True})
+
+        else:
+            self.send({"error": f"Unbekannte Operation: {op}"})
+
+
+class WorkerServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+
+# MARK: start_metrics_thread()
+def start_metrics_thread(port: int):
+    """The worker has no event loop: serve /metrics from one in a thread."""
+
+    def run():
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        if loop.run_until_complete(start_metrics_server(port)) is not None:
+            loop.run_forever()
+
+    threading.Thread(target=run, name="worker-metrics", daemon=True).start()
+
+
+# MARK: serve()
+def serve(socket_path: str):
+    if os.path.exists(socket_path):
+        os.remove(socket_path)  # left over from a crashed worker
+    with WorkerServer(socket_path, RequestHandler) as server:
+        logger.info(f"🧵 Render-Worker wartet auf {socket_path}")
+        server.serve_forever()
+
+
+if __name__ == "__main__":
+    setup_logging()
+    if WORKER_METRICS_PORT > 0:
+        start_metrics_thread(WORKER_METRICS_PORT)
+    serve(sys.argv[1] if len(sys.argv) > 1 else str(DEFAULT_SOCKET_PATH))
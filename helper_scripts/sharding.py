@@ -0,0 +1,65 @@
+# helper_scripts/sharding.py
+
+# Standard library imports
+import os
+from typing import List, Optional
+
+# Third-party imports
+# None
+
+# Own modules
+# None
+
+
+#       |==========================|
+#       |       SHARDING.PY        |
+#       |==========================|
+
+# Shard settings of this process. The cluster launcher (hidden_gems_cluster.py)
+# starts one bot process per core and hands each a slice of the shards:
+#
+#   LEADERBOARD_SHARD_COUNT  total shards ("auto" = Discord's recommendation
+#                            in this process, unset = no sharding)
+#   LEADERBOARD_SHARD_IDS    shards of this process, e.g. "0,1,2"
+#   LEADERBOARD_CLUSTER_ID   name of this process, keeps per-process files apart
+#
+# Every guild belongs to exactly one shard, (guild_id >> 22) % shard_count, so
+# each process posts and notifies only for the guilds of its own shards.
+
+
+# MARK: shard_settings()
+def shard_settings() -> Optional[dict]:
+    """AutoShardedBot kwargs from the environment, None = not sharded."""
+    count = os.getenv("LEADERBOARD_SHARD_COUNT", "").strip().lower()
+    if not count:
+        return None
+    if count == "auto":
+        return {}
+
+    ids = os.getenv("LEADERBOARD_SHARD_IDS", "").strip()
+    return {
+        "shard_count": int(count),
+        "shard_ids": [int(x) for x in ids.split(",") if x.strip()] or None,
+    }
+
+
+# MARK: split_shards()
+def split_shards(shard_count: int, clusters: int) -> List[List[int]]:
+    """Spread shard ids evenly over `clusters` processes (none left empty)."""
+    clusters = max(1, min(clusters, shard_count))
+    return [list(range(i, shard_count, clusters)) for i in range(clusters)]
+
+
+# MARK: shard_for_guild()
+def shard_for_guild(guild_id: int, shard_count: int) -> int:
+    return (int(guild_id) >> 22) % shard_count
+
+
+# MARK: owns_guild()
+def owns_guild(bot, guild_id) -> bool:
+    """Whether this process serves `guild_id` (always, if not sharded)."""
+    shard_count = getattr(bot, "shard_count", None)
+    shard_ids = getattr(bot, "shard_ids", None)
+    if not shard_count or shard_ids is None:
+        return True
+    return shard_for_guild(guild_id, shard_count) in shard_ids
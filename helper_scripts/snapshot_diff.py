@@ -0,0 +1,103 @@
+# helper_scripts/snapshot_diff.py
+
+# Standard library imports
+from typing import Dict, List, Optional, Set
+
+# Third-party imports
+# None
+
+# Own modules
+from helper_scripts.history_store import parse_rank, parse_score, row_keys
+
+
+# Change kinds, in the order they are reported
+CHANGE_NEW = "new"
+CHANGE_GONE = "gone"
+CHANGE_ENTERED_DNQ = "entered_dnq"
+CHANGE_LEFT_DNQ = "left_dnq"
+CHANGE_MOVED = "moved"
+CHANGE_SCORE = "score"
+
+
+# MARK: diff_snapshots()
+def diff_snapshots(
+    prev_rows: List[dict],
+    new_rows: List[dict],
+    keys: Optional[Set[str]] = None,
+) -> Dict[str, dict]:
+    """
+    Compare two leaderboard snapshots row by row (keyed by bot name + author)
+    in one linear pass. If `keys` is given, only those bots are compared.
+
+    Returns {bot key: change dict} for every bot whose rank, DNQ state or
+    score changed, or that appeared / disappeared.
+    """
+    prev_by_key = {
+        key: (pos, row)
+        for pos, (key, row) in enumerate(zip(row_keys(prev_rows), prev_rows))
+        if keys is None or key in keys
+    }
+
+    changes: Dict[str, dict] = {}
+    for pos, (key, row) in enumerate(zip(row_keys(new_rows), new_rows)):
+        if keys is not None and key not in keys:
+            continue
+
+        old_pos, old_row = prev_by_key.pop(key, (None, None))
+        change = _compare_rows(old_row, row)
+        if change:
+            change["key"] = key
+            change["old_pos"] = old_pos
+            change["new_pos"] = pos
+            changes[key] = change
+
+    # whatever is left in the previous snapshot is gone now
+    for key, (old_pos, old_row) in prev_by_key.items():
+        change = _compare_rows(old_row, None)
+        change["key"] = key
+        change["old_pos"] = old_pos
+        change["new_pos"] = None
+        changes[key] = change
+
+    return changes
+
+
+def _compare_rows(old_row: Optional[dict], new_row: Optional[dict]) -> dict:
+    """Return a change dict for one bot, empty if nothing relevant changed."""
+    row = new_row or old_row or {}
+    old_rank = parse_rank(old_row.get("Rang")) if old_row else None
+    new_rank = parse_rank(new_row.get("Rang")) if new_row else None
+    old_score = parse_score(old_row.get("Score")) if old_row else None
+    new_score = parse_score(new_row.get("Score")) if new_row else None
+
+    if old_row is None:
+        kind = CHANGE_NEW
+    elif new_row is None:
+        kind = CHANGE_GONE
+    elif old_rank is not None and new_rank is None:
+        kind = CHANGE_ENTERED_DNQ
+    elif old_rank is None and new_rank is not None:
+        kind = CHANGE_LEFT_DNQ
+    elif old_rank != new_rank:
+        kind = CHANGE_MOVED
+    elif old_score != new_score:
+        kind = CHANGE_SCORE
+    else:
+        return {}
+
+    return {
+        "kind": kind,
+        "name": row.get("Bot", ""),
+        "author": row.get("Autor / Team", ""),
+        "emoji": row.get("Col1", ""),
+        "old_rank": old_rank,
+        "new_rank": new_rank,
+        "old_score": old_score,
+        "new_score": new_score,
+        # positive = moved up
+        "rank_delta": (
+            old_rank - new_rank
+            if old_rank is not None and new_rank is not None
+            else None
+        ),
+    }
@@ -0,0 +1,189 @@
+# helper_scripts/worker_client.py
+
+# Standard library imports
+import atexit
+import json
+import logging
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+from typing import Any, Dict, Iterator, Optional
+
+# Third-party imports
+# None
+
+# Own modules
+from helper_scripts.globals import BASE_DIR, CLUSTER_ID, LOCAL_DATA_PATH_DIR
+from helper_scripts.logging_setup import DEFAULT_LOG_FILE
+
+
+#       |==========================|
+#       |     WORKER_CLIENT.PY     |
+#       |==========================|
+
+# Gateway side of the render worker (see render_worker.py). Once configured,
+# get_leaderboard_json() and iter_images_from_json() ask the worker process
+# instead of fetching, parsing and rendering here, so BeautifulSoup and
+# Pillow never hold this process's GIL while the gateway needs to heartbeat.
+#
+# Protocol: one connection per request over a Unix socket, JSON lines.
+#   -> {"op": "leaderboard", "html": ...}  <- {"rows": [...], "meta": {...}}
+#   -> {"op": "render", "rows": [...], ...} <- {"path": ...} per image, {"done": true}
+#   -> {"op": "ping"}                      <- {"ok": true}
+#   any request                            <- {"error": "..."} on failure
+# Images are written to GENERATED_TABLES_DIR; only their paths are sent.
+#
+# If the worker cannot be reached, callers render locally and report it via
+# unreachable(): the fallback is logged once per outage, and a worker started
+# by this process that has died is started again (at most once per
+# RESTART_INTERVAL).
+
+
+DEFAULT_SOCKET_PATH = LOCAL_DATA_PATH_DIR / (
+    f"render_worker_{CLUSTER_ID}.sock" if CLUSTER_ID else "render_worker.sock"
+)
+CONNECT_TIMEOUT = 5
+# a full render of a large board can take a while
+READ_TIMEOUT = 120
+STARTUP_TIMEOUT = 30
+# seconds between two restarts of a dead worker
+RESTART_INTERVAL = 60
+
+_socket_path: Optional[str] = None
+# worker started by start_worker_process(), restarted by unreachable()
+_process: Optional[subprocess.Popen] = None
+_restart_lock = threading.Lock()
+_last_restart = 0.0
+_fallback_logged = False
+
+logger = logging.getLogger(__name__)
+
+
+class WorkerError(Exception):
+    """The worker answered with an error (not a connection problem)."""
+
+
+# MARK: configure()
+def configure(socket_path: Optional[str]):
+    """Route fetching/rendering to the worker at `socket_path` (None = local)."""
+    global _socket_path
+    _socket_path = str(socket_path) if socket_path else None
+
+
+def enabled() -> bool:
+    return _socket_path is not None
+
+
+# MARK: call()
+def call(request: Dict[str, Any]) -> Iterator[dict]:
+    """Blocking: send one request, yield the answer lines. OSError if unreachable."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(CONNECT_TIMEOUT)
+        sock.connect(_socket_path)
+        sock.settimeout(READ_TIMEOUT)
+        _reachable()
+        sock.sendall(json.dumps(request, ensure_ascii=False).encode("utf-8") + b"\n")
+        # one request per connection: the worker's read loop ends, and it
+        # closes the connection after the last answer
+        sock.shutdown(socket.SHUT_WR)
+
+        with sock.makefile("r", encoding="utf-8") as answers:
+            for line in answers:
+                message = json.loads(line)
+                if "error" in message:
+                    raise WorkerError(message["error"])
+                yield message
+
+
+# MARK: remote_leaderboard()
+def remote_leaderboard(html: Optional[str] = None) -> tuple[list[dict], dict]:
+    """get_leaderboard_json() in the worker (parsing `html` if given)."""
+    for message in call({"op": "leaderboard", "html": html}):
+        return message["rows"], message["meta"]
+    raise ConnectionError("Render-Worker hat nicht geantwortet")
+
+
+# MARK: remote_images()
+def remote_images(**render_args) -> Iterator[str]:
+    """Image paths as the worker finishes them (iter_images_from_json args)."""
+    for message in call({"op": "render", **render_args}):
+        if message.get("done"):
+            return
+        yield message["path"]
+    raise ConnectionError("Render-Worker hat die Verbindung beendet")
+
+
+# MARK: unreachable()
+def unreachable(error: OSError):
+    """
+    The caller falls back to local work: log that once per outage and start
+    the worker again if it has died.
+    """
+    global _fallback_logged, _last_restart
+    if not _fallback_logged:
+        _fallback_logged = True
+        logger.warning(f"⚠️ Render-Worker nicht erreichbar, arbeite lokal: {error}")
+
+    with _restart_lock:
+        if _process is None or _process.poll() is None:
+            return  # not ours, or still running (e.g. busy or starting up)
+        if time.monotonic() - _last_restart < RESTART_INTERVAL:
+            return
+        _last_restart = time.monotonic()
+        logger.warning(
+            f"🧵 Render-Worker beendet (Code {_process.returncode}), starte neu."
+        )
+        _spawn(_socket_path)
+
+
+def _reachable():
+    global _fallback_logged
+    if _fallback_logged:
+        _fallback_logged = False
+        logger.info("🧵 Render-Worker wieder erreichbar.")
+
+
+def _spawn(socket_path) -> subprocess.Popen:
+    """Start the worker process; it listens on `socket_path` once it is up."""
+    global _process
+    # own log file, rotating one file from two processes loses lines
+    log_file = os.getenv("LOG_FILE", str(DEFAULT_LOG_FILE))
+    env = {**os.environ, "LOG_FILE": f"{os.path.splitext(log_file)[0]}_worker.jsonl"}
+
+    _process = subprocess.Popen(
+        [sys.executable, "-m", "helper_scripts.render_worker", str(socket_path)],
+        cwd=BASE_DIR,
+        env=env,
+    )
+    return _process
+
+
+@atexit.register
+def _terminate():
+    if _process is not None and _process.poll() is None:
+        _process.terminate()
+
+
+# MARK: start_worker_process()
+def start_worker_process(socket_path=DEFAULT_SOCKET_PATH) -> subprocess.Popen:
+    """Spawn `python -m helper_scripts.render_worker` and wait until it answers."""
+    process = _spawn(socket_path)
+
+    configure(socket_path)
+    deadline = time.monotonic() + STARTUP_TIMEOUT
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            break
+        try:
+            list(call({"op": "ping"}))
+            logger.info(f"🧵 Render-Worker läuft (PID {process.pid}).")
+            return process
+        except OSError:
+            time.sleep(0.2)
+
+    logger.warning("⚠️ Render-Worker nicht erreichbar, rendere im Bot-Prozess.")
+    configure(None)
+    return process
@@ -0,0 +1,169 @@
+# hidden_gems_cluster.py
+
+# Standard library imports
+import argparse
+import logging
+import os
+import signal
+import subprocess
+import sys
+import time
+
+# Third-party imports
+import requests
+from dotenv import load_dotenv
+
+# Own custom scripts / modules
+from helper_scripts.globals import BASE_DIR, DOTENV_PATH
+from helper_scripts.logging_setup import DEFAULT_LOG_FILE, setup_logging
+from helper_scripts.sharding import split_shards
+
+
+# Cluster launcher: starts one bot process per core (hidden_gems_leaderboard_bot.py)
+# and gives each an equal slice of the gateway shards. Every process serves
+# the commands, scheduled posts and notifications of its own guilds; they
+# share local_data (bot_data.json and the history store are file-locked).
+# Crashed processes are restarted; Ctrl+C / SIGTERM stops all of them.
+# Each process logs to its own file (bot_cluster<N>.jsonl, bot_launcher.jsonl
+# next to LOG_FILE): several processes rotating one file lose lines.
+#
+#   python hidden_gems_cluster.py                  # shards from Discord, 1 process/core
+#   python hidden_gems_cluster.py --shards 8 --clusters 4
+
+
+GATEWAY_URL = "https://discord.com/api/v10/gateway/bot"
+BOT_SCRIPT = BASE_DIR / "hidden_gems_leaderboard_bot.py"
+# seconds Discord wants between IDENTIFYs of one concurrency bucket
+IDENTIFY_INTERVAL = 5
+RESTART_DELAY_MAX = 300
+
+logger = logging.getLogger("hidden_gems_cluster")
+
+
+def process_log_file(log_file: str, name: str) -> str:
+    """`logs/bot.jsonl` -> `logs/bot_<name>.jsonl`."""
+    root, ext = os.path.splitext(log_file)
+    return f"{root}_{name}{ext or '.jsonl'}"
+
+
+def recommended_shards(token: str) -> tuple[int, int]:
+    """(shard count, max_concurrency) recommended by Discord for this bot."""
+    response = requests.get(
+        GATEWAY_URL, headers={"Authorization": f"Bot {token}"}, timeout=10
+    )
+    response.raise_for_status()
+    data = response.json()
+    return data["shards"], data["session_start_limit"]["max_concurrency"]
+
+
+class Worker:
+    """One bot process with a fixed set of shards."""
+
+    def __init__(self, cluster_id: int, shard_ids: list[int], shard_count: int):
+        self.cluster_id = cluster_id
+        self.shard_ids = shard_ids
+        self.shard_count = shard_count
+        self.process: subprocess.Popen | None = None
+        self.restart_delay = IDENTIFY_INTERVAL
+        self.started_at = 0.0
+
+    def start(self, metrics_base_port: int, log_file: str):
+        env = {
+            **os.environ,
+            "LEADERBOARD_SHARD_COUNT": str(self.shard_count),
+            "LEADERBOARD_SHARD_IDS": ",".join(map(str, self.shard_ids)),
+            "LEADERBOARD_CLUSTER_ID": str(self.cluster_id),
+            # one metrics endpoint per process
+            "METRICS_PORT": str(
+                metrics_base_port + self.cluster_id if metrics_base_port else 0
+            ),
+            "LOG_FILE": process_log_file(log_file, f"cluster{self.cluster_id}"),
+        }
+        self.process = subprocess.Popen([sys.executable, str(BOT_SCRIPT)], env=env)
+        self.started_at = time.monotonic()
+        logger.info(
+            f"Cluster {self.cluster_id} gestartet (PID {self.process.pid}, "
+            f"Shards {self.shard_ids})"
+        )
+
+
+def main():
+    load_dotenv(dotenv_path=DOTENV_PATH)
+    log_file = os.getenv("LOG_FILE", str(DEFAULT_LOG_FILE))
+    os.environ["LOG_FILE"] = process_log_file(log_file, "launcher")
+    setup_logging()
+
+    parser = argparse.ArgumentParser(description="Start the bot as shard cluster.")
+    parser.add_argument(
+        "--clusters",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="processes (default: one per core)",
+    )
+    parser.add_argument(
+        "--shards", type=int, default=0, help="total shards (default: from Discord)"
+    )
+    args = parser.parse_args()
+
+    max_concurrency = 1
+    shard_count = args.shards
+    if shard_count <= 0:
+        token = os.getenv("DISCORD_BOT_TOKEN")
+        if token is None:
+            raise ValueError("DISCORD_BOT_TOKEN ist nicht in der .env gesetzt!")
+        shard_count, max_concurrency = recommended_shards(token)
+
+    metrics_base_port = int(os.getenv("METRICS_PORT", "9108"))
+    workers = [
+        Worker(cluster_id, shard_ids, shard_count)
+        for cluster_id, shard_ids in enumerate(split_shards(shard_count, args.clusters))
+    ]
+    logger.info(f"{shard_count} Shards auf {len(workers)} Prozesse verteilt.")
+
+    stopping = []
+
+    def stop(signum, frame):
+        stopping.append(signum)
+
+    signal.signal(signal.SIGINT, stop)
+    signal.signal(signal.SIGTERM, stop)
+
+    # Stagger the starts: each process identifies its shards one after another
+    for worker in workers:
+        if stopping:
+            break
+        worker.start(metrics_base_port, log_file)
+        time.sleep(IDENTIFY_INTERVAL * len(worker.shard_ids) / max_concurrency)
+
+    while not stopping:
+        time.sleep(1)
+        for worker in workers:
+            if worker.process is None or worker.process.poll() is None:
+                continue
+            code = worker.process.returncode
+            # back off if it keeps crashing right after the start
+            if time.monotonic() - worker.started_at > RESTART_DELAY_MAX:
+                worker.restart_delay = IDENTIFY_INTERVAL
+            logger.warning(
+                f"Cluster {worker.cluster_id} beendet (Code {code}), "
+                f"Neustart in {worker.restart_delay}s."
+            )
+            time.sleep(worker.restart_delay)
+            worker.restart_delay = min(worker.restart_delay * 2, RESTART_DELAY_MAX)
+            if not stopping:
+                worker.start(metrics_base_port, log_file)
+
+    logger.info("Stoppe alle Cluster-Prozesse...")
+    for worker in workers:
+        if worker.process and worker.process.poll() is None:
+            worker.process.terminate()
+    for worker in workers:
+        if worker.process:
+            try:
+                worker.process.wait(timeout=30)
+            except subprocess.TimeoutExpired:
+                worker.process.kill()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,7 @@
 # hidden_gems_leaderboard_bot.py
 
 # Standard library imports
+import logging
 import os
 import json
 import socket
@@ -10,30 +11,46 @@ from datetime import datetime, timezone
 import discord
 from discord.ext import commands
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
-from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
 import pytz
 from dotenv import load_dotenv
 
 # Own custom scripts / modules
 from helper_scripts.bot_commands import register_commands
+from helper_scripts.command_throttle import LeaderboardThrottle
 from helper_scripts.helper_functions import (
+    channel_posted_since,
     post_lb_in_scheduled_channels,
     send_leaderboard,
 )
 from helper_scripts.globals import DOTENV_PATH, LOCAL_DATA_PATH_DIR
+from helper_scripts.image_store import get_image_store
+from helper_scripts.job_queue import PRIORITY_SCHEDULED, job_queue
+from helper_scripts.leaderboard_poller import LeaderboardPoller
+from helper_scripts.logging_setup import command_fields, setup_logging
+from helper_scripts.metrics import start_metrics_server
+from helper_scripts.notifications import notify_tracked_changes
+from helper_scripts.post_scheduler import PostScheduler
+from helper_scripts.posting_journal import get_posting_journal
+from helper_scripts.prewarm import prewarm_job
+from helper_scripts.sharding import owns_guild, shard_settings
+from helper_scripts.worker_client import start_worker_process
 
 
-DAILY_POST_TIME = "03:00:00"
 BOT_DATA_FILE = LOCAL_DATA_PATH_DIR / "bot_data.json"
 
 os.makedirs(LOCAL_DATA_PATH_DIR, exist_ok=True)
 
+logger = logging.getLogger("hidden_gems_leaderboard_bot")
+
 
 def main():
     # 1. Loading env
     # 2. Initializing bot
     # 3. Scheduler
 
+    setup_logging()
+
     # Load saved channels on startup
     scheduled_channels = {}
     channels_to_post = set()
@@ -47,7 +64,9 @@ def main():
                     int(ch_id) for ch_id in scheduled_channels.keys()
                 )
         except (json.JSONDecodeError, ValueError):
-            print(f"⚠️ Warning: {BOT_DATA_FILE} is empty or corrupted, starting fresh.")
+            logger.warning(
+                f"⚠️ Warning: {BOT_DATA_FILE} is empty or corrupted, starting fresh."
+            )
             scheduled_channels = {}
             channels_to_post = set()
 
@@ -73,6 +92,33 @@ def main():
         if x.strip().isdigit()
     )
 
+    # "cron": post at each channel's post time, "poll": post as soon as a new board appears
+    POST_MODE = os.getenv("LEADERBOARD_POST_MODE", "cron").strip().lower()
+    POLL_INTERVAL_MINUTES = int(os.getenv("LEADERBOARD_POLL_MINUTES", "5"))
+    # fetch + render this many minutes before each post time, 0 = disabled
+    PREWARM_MINUTES = int(os.getenv("LEADERBOARD_PREWARM_MINUTES", "5"))
+    # posts missed while offline are caught up within this many hours
+    CATCH_UP_HOURS = float(os.getenv("LEADERBOARD_CATCH_UP_HOURS", "12"))
+
+    # Fetch/render/upload jobs at once, of which at most this many scheduled
+    JOB_WORKERS = int(os.getenv("LEADERBOARD_JOB_WORKERS", "3"))
+    SCHEDULED_WORKERS = int(os.getenv("LEADERBOARD_SCHEDULED_WORKERS", "1"))
+    job_queue.configure(JOB_WORKERS, limits={PRIORITY_SCHEDULED: SCHEDULED_WORKERS})
+
+    # !lb cooldowns in seconds: same request per channel / any request per user
+    CHANNEL_COOLDOWN = float(os.getenv("LEADERBOARD_CHANNEL_COOLDOWN", "60"))
+    USER_COOLDOWN = float(os.getenv("LEADERBOARD_USER_COOLDOWN", "30"))
+
+    # Scheduled posts: upload each image once to this channel, 0 = disabled
+    STORAGE_CHANNEL_ID = int(os.getenv("LEADERBOARD_STORAGE_CHANNEL_ID", "0"))
+
+    # Fetch, parse and render in a separate process (render_worker.py)
+    if os.getenv("LEADERBOARD_RENDER_WORKER", "0") == "1":
+        start_worker_process()
+
+    # Local Prometheus endpoint, 0 = disabled
+    METRICS_PORT = int(os.getenv("METRICS_PORT", "9108"))
+
     intents = discord.Intents.default()
     intents.message_content = True
     hostname = socket.gethostname()
@@ -80,60 +126,120 @@ def main():
     if hostname == "turtle-01":
         prefix = "!"
 
-    bot = commands.Bot(command_prefix=prefix, intents=intents)
+    # Sharded (LEADERBOARD_SHARD_COUNT, see helper_scripts/sharding.py) or not
+    sharding = shard_settings()
+    if sharding is None:
+        bot = commands.Bot(command_prefix=prefix, intents=intents)
+    else:
+        bot = commands.AutoShardedBot(
+            command_prefix=prefix, intents=intents, **sharding
+        )
+        logger.info(
+            f"Sharding aktiv: Shards {sharding.get('shard_ids') or 'alle'} "
+            f"von {sharding.get('shard_count') or 'auto'}"
+        )
+    get_image_store().configure(bot, STORAGE_CHANNEL_ID)
 
     # Scheduler mit CET
     scheduler = AsyncIOScheduler(timezone=pytz.timezone("Europe/Berlin"))
 
+    # Per-guild/channel post times (see helper_scripts/post_scheduler.py)
+    async def post_slot(channel_ids, report):
+        await post_lb_in_scheduled_channels(bot, channel_ids, report)
+
+    post_scheduler = PostScheduler(
+        post_slot,
+        prewarm=prewarm_job,
+        prewarm_minutes=PREWARM_MINUTES,
+        journal=get_posting_journal(),
+        catch_up_hours=CATCH_UP_HOURS,
+        owns_guild=lambda guild_id: owns_guild(bot, guild_id),
+        already_posted=lambda channel_id, due: channel_posted_since(
+            bot, channel_id, due
+        ),
+    )
+
+    # Change detection for new leaderboards
+    poller = LeaderboardPoller()
+
+    async def post_new_snapshot(leaderboard_json, leaderboard_meta):
+        await post_lb_in_scheduled_channels(bot)
+
+    async def notify_new_snapshot(leaderboard_json, leaderboard_meta):
+        await notify_tracked_changes(bot, leaderboard_json, leaderboard_meta)
+
+    if POST_MODE == "poll":
+        poller.add_listener(post_new_snapshot)
+    poller.add_listener(notify_new_snapshot)
+
+    metrics_server = []
+    synced_commands = []
+
     # ----------------- Bot Ready & Scheduler -----------------
     @bot.event
     async def on_ready():
-        print(f"Bot ist online als {bot.user}")
+        logger.info(f"Bot ist online als {bot.user}")
+
+        # Metrics endpoint (only once, on_ready fires again after reconnects)
+        if METRICS_PORT > 0 and not metrics_server:
+            metrics_server.append(await start_metrics_server(METRICS_PORT))
+
+        # Slash commands (/leaderboard, /track, /schedule), once per process
+        # and only in the cluster process with shard 0
+        if not synced_commands and 0 in (getattr(bot, "shard_ids", None) or [0]):
+            try:
+                synced_commands.extend(await bot.tree.sync())
+                logger.info(f"{len(synced_commands)} Slash-Commands synchronisiert.")
+            except discord.HTTPException as e:
+                logger.warning(f"⚠️ Slash-Commands nicht synchronisiert: {e}")
 
         # Scheduler starten
-        if not scheduler.get_jobs():
-            h, m, s = map(int, DAILY_POST_TIME.split(":"))
+        if POST_MODE != "poll":
+            post_scheduler.start()
+
+        if not scheduler.running:
+            if POLL_INTERVAL_MINUTES > 0:
+                scheduler.add_job(
+                    poller.poll,
+                    IntervalTrigger(minutes=POLL_INTERVAL_MINUTES),
+                    next_run_time=datetime.now(timezone.utc),
+                )
 
-            job = scheduler.add_job(
-                post_lb_in_scheduled_channels,
-                CronTrigger(hour=h, minute=m, second=s),
-                args=[bot],
-            )
             scheduler.start()
+            logger.info(f"Scheduler gestartet! (Modus: {POST_MODE})")
 
+        for job in scheduler.get_jobs():
             next_run = job.next_run_time
             now = datetime.now(timezone.utc)
             delta = next_run - now
-            hours, remainder = divmod(int(delta.total_seconds()), 3600)
+            hours, remainder = divmod(max(int(delta.total_seconds()), 0), 3600)
             minutes, seconds = divmod(remainder, 60)
 
-            print(
-                f"Scheduler gestartet! Nächster Post um: {next_run.strftime('%Y-%m-%d %H:%M:%S %Z')} "
+            logger.info(
+                f"Nächster Lauf von {job.name}: {next_run.strftime('%Y-%m-%d %H:%M:%S %Z')} "
                 f"({hours}h {minutes}m {seconds}s von jetzt)"
             )
-        else:
-            for job in scheduler.get_jobs():
-                next_run = job.next_run_time
-                now = datetime.now(timezone.utc)
-                delta = next_run - now
-                hours, remainder = divmod(int(delta.total_seconds()), 3600)
-                minutes, seconds = divmod(remainder, 60)
-
-                print(
-                    f"Scheduler bereits aktiv. Nächster Lauf: {next_run.strftime('%Y-%m-%d %H:%M:%S %Z')} "
-                    f"({hours}h {minutes}m {seconds}s von jetzt)"
-                )
+
+        for next_run, (post_time, zone), count in post_scheduler.next_runs()[:5]:
+            logger.info(
+                f"Nächster Post {post_time} {zone}: "
+                f"{next_run.strftime('%Y-%m-%d %H:%M:%S %Z')} ({count} Channels)"
+            )
 
     # ----------------- Command Logging -----------------
     @bot.event
     async def on_command(ctx: commands.Context):
-        print(
-            f"[COMMAND] {ctx.author} hat '{ctx.command}' in {ctx.channel} ausgeführt."
+        logger.info(
+            f"[COMMAND] {ctx.author} hat '{ctx.command}' in {ctx.channel} ausgeführt.",
+            extra=command_fields(ctx),
         )
 
     @bot.event
     async def on_command_error(ctx, error):
-        print(f"[ERROR] Command '{ctx.command}' von {ctx.author} schlug fehl: {error}")
+        logger.error(
+            f"[ERROR] Command '{ctx.command}' von {ctx.author} schlug fehl: {error}",
+            extra=command_fields(ctx),
+        )
 
     register_commands(
         bot,
@@ -142,9 +248,13 @@ def main():
         scheduled_channels,
         save_channels,
         send_leaderboard,
+        # in poll mode the post scheduler never runs, nothing to reload
+        post_scheduler=post_scheduler if POST_MODE != "poll" else None,
+        throttle=LeaderboardThrottle(USER_COOLDOWN, CHANNEL_COOLDOWN),
     )
 
-    bot.run(DISCORD_BOT_TOKEN)
+    # discord.py logs go through our queue-based root logger
+    bot.run(DISCORD_BOT_TOKEN, log_handler=None)
 
 
 if __name__ == "__main__":